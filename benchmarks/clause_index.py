@@ -0,0 +1,96 @@
+# benchmarks/clause_index.py
+"""
+Clause segmentation speed and index size.
+
+Segments generated contracts of increasing size with ``segment_clauses`` and
+reports segmentation time, MB/s, the number of clauses, the memory held by
+the array-backed index and, for comparison, by the same clauses kept as a
+list of ``Clause`` objects. Also times ``ClauseIndex.at`` lookups, the
+operation that maps a model's quote or a search hit back to its clause.
+
+Usage:
+    python benchmarks/clause_index.py
+    python benchmarks/clause_index.py --sizes 100000 1000000 --json clauses.json
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import Any, Dict
+
+from common import environment, synthetic_contract, write_json
+
+from lexiguard_sdk.clauses import segment_clauses
+
+DEFAULT_SIZES = (100_000, 1_000_000, 10_000_000)
+LOOKUPS = 10_000
+
+
+def _deep_size(value: Any, seen: set) -> int:
+    """Approximate memory held by ``value`` and everything it references."""
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(_deep_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += _deep_size(vars(value), seen)
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Clause segmentation speed and index size")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES),
+                        help="document sizes in characters")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "benchmark": "clause_index",
+        "environment": environment(),
+        "config": {"sizes": args.sizes, "lookups": LOOKUPS},
+        "results": [],
+    }
+
+    print(f"{'chars':>10} {'clauses':>8} {'ms':>9} {'MB/s':>7} {'index KB':>9} "
+          f"{'objects KB':>11} {'at() us':>8}")
+    for size in args.sizes:
+        text = synthetic_contract(size, seed=size)
+        started = time.perf_counter()
+        index = segment_clauses(text)
+        seconds = time.perf_counter() - started
+
+        # The text itself is shared by both and not counted
+        seen = {id(text)}
+        index_bytes = _deep_size(index, seen)
+        objects_bytes = _deep_size(list(index), {id(text)})
+
+        rng = random.Random(size)
+        offsets = [rng.randrange(len(text)) for _ in range(LOOKUPS)]
+        started = time.perf_counter()
+        for offset in offsets:
+            index.at(offset)
+        lookup_us = (time.perf_counter() - started) / LOOKUPS * 1e6
+
+        report["results"].append({
+            "chars": len(text), "clauses": len(index),
+            "ms": round(seconds * 1000, 2),
+            "mb_per_second": round(len(text) / (1 << 20) / max(seconds, 1e-9), 2),
+            "index_bytes": index_bytes, "objects_bytes": objects_bytes,
+            "lookup_us": round(lookup_us, 2),
+        })
+        print(f"{len(text):>10} {len(index):>8} {seconds * 1000:>9.1f} "
+              f"{len(text) / (1 << 20) / max(seconds, 1e-9):>7.1f} {index_bytes / 1024:>9.0f} "
+              f"{objects_bytes / 1024:>11.0f} {lookup_us:>8.1f}")
+
+    if args.json:
+        write_json(args.json, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+# benchmarks/common.py
+"""
+Helpers shared by the benchmark scripts.
+"""
+
+import io
+import json
+import platform
+import subprocess
+import sys
+import textwrap
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_CLAUSE_TITLES = [
+    "Definitions", "Term", "Payment", "Confidentiality", "Termination",
+    "Limitation of Liability", "Indemnification", "Governing Law",
+    "Intellectual Property", "Force Majeure", "Notices", "Assignment",
+]
+
+_SENTENCES = [
+    "The Provider shall perform the Services with reasonable skill and care.",
+    "The Customer shall pay all undisputed invoices within thirty (30) days of receipt.",
+    "Either party may terminate this Agreement upon ninety (90) days' written notice.",
+    "Neither party shall be liable for any indirect or consequential loss.",
+    "The Receiving Party shall keep the Confidential Information strictly confidential.",
+    "This Agreement shall be governed by the laws of the State of New York.",
+    "The Provider may revise the fees once per calendar year upon written notice.",
+    "All intellectual property created under this Agreement vests in the Provider.",
+]
+
+
+def synthetic_contract(size_bytes: int, seed: int = 0) -> str:
+    """
+    Build deterministic contract-like text of roughly ``size_bytes`` characters,
+    with numbered clause headings every few paragraphs.
+    """
+    parts: List[str] = ["MASTER SERVICES AGREEMENT\n\n"]
+    length = len(parts[0])
+    clause = 0
+    paragraph = seed
+    while length < size_bytes:
+        if paragraph % 4 == 0:
+            clause += 1
+            heading = f"{clause}. {_CLAUSE_TITLES[clause % len(_CLAUSE_TITLES)]}\n\n"
+            parts.append(heading)
+            length += len(heading)
+        sentences = [_SENTENCES[(paragraph + i) % len(_SENTENCES)] for i in range(4)]
+        text = f"{clause}.{paragraph % 4 + 1} " + " ".join(sentences) + "\n\n"
+        parts.append(text)
+        length += len(text)
+        paragraph += 1
+    return "".join(parts)[:size_bytes]
+
+
+def _pdf_escape(text: str) -> str:
+    text = text.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _hyphenate(lines: List[str], min_word: int = 8) -> List[str]:
+    """Split long words that start a line across the line break, as typeset text does."""
+    lines = list(lines)
+    for i in range(len(lines) - 1):
+        word, _, rest = lines[i + 1].partition(" ")
+        if len(word) >= min_word and word.isalpha():
+            cut = len(word) // 2
+            lines[i] += f" {word[:cut]}-"
+            lines[i + 1] = f"{word[cut:]} {rest}".rstrip()
+    return lines
+
+
+def _page_stream(text: str, ocr_layout: bool, header: Optional[str] = None,
+                 footer: Optional[str] = None, hyphenate: bool = False,
+                 line_breaks: bool = False) -> bytes:
+    """Content stream drawing ``text`` as 10pt lines in font F1."""
+    if line_breaks:
+        lines = [wrapped for line in text.split("\n") for wrapped in textwrap.wrap(line, 95) or [""]]
+    else:
+        lines = textwrap.wrap(text, 95) or [""]
+    if hyphenate:
+        lines = _hyphenate(lines)
+    if header is not None:
+        lines = [header, ""] + lines
+    ops = ["BT", "/F1 10 Tf", "12 TL", "40 800 Td"]
+    for line in lines[:64]:
+        if ocr_layout:
+            # OCR text layers place every word separately
+            x = 0.0
+            for word in line.split():
+                ops.append(f"{x:.2f} 0 Td ({_pdf_escape(word)}) Tj {-x:.2f} 0 Td")
+                x += 5.5 * (len(word) + 1)
+            ops.append("T*")
+        else:
+            ops.append(f"({_pdf_escape(line)}) Tj T*")
+    ops.append("ET")
+    if footer is not None:
+        ops += ["BT", "/F1 10 Tf", "40 30 Td", f"({_pdf_escape(footer)}) Tj", "ET"]
+    return "\n".join(ops).encode("latin-1")
+
+
+def minimal_pdf(pages: Sequence[str], ocr_layout: bool = False,
+                image_bytes: int = 0, header: Optional[str] = None,
+                footer: Optional[str] = None, hyphenate: bool = False,
+                font: str = "Helvetica", line_breaks: bool = False) -> bytes:
+    """
+    Build a valid PDF with one page per string, without any PDF library.
+
+    Text is wrapped to fit an A4 page (longer pages are truncated). With
+    ``ocr_layout`` each word is positioned on its own, like the invisible text
+    layer of a scanned and OCR'd document, which makes extraction slower.
+    ``image_bytes`` adds a full-page greyscale image of about that size behind
+    the text of every page, as in a scanned document. ``header`` and
+    ``footer`` are drawn at the top and bottom of every page, after
+    formatting with ``page`` and ``pages`` ("Page {page} of {pages}");
+    ``hyphenate`` splits long words across line breaks. ``font`` is one of
+    the standard PDF fonts ("Helvetica", "Times-Roman", "Courier", ...), with
+    WinAnsi encoding for Latin-1 text. With ``line_breaks`` the text's own
+    lines are kept (for tables) instead of being rewrapped as one paragraph.
+    """
+    objects: List[bytes] = [b"", b"", (f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} "
+                                       f"/Encoding /WinAnsiEncoding >>").encode()]
+    kids = []
+    for number, text in enumerate(pages, start=1):
+        stream = _page_stream(
+            text, ocr_layout,
+            header=header.format(page=number, pages=len(pages)) if header is not None else None,
+            footer=footer.format(page=number, pages=len(pages)) if footer is not None else None,
+            hyphenate=hyphenate, line_breaks=line_breaks,
+        )
+        resources = "/Font << /F1 3 0 R >>"
+        if image_bytes > 0:
+            height = max(1, image_bytes // 1000)
+            pixels = bytes(range(256)) * (1000 * height // 256 + 1)
+            objects.append(b"<< /Type /XObject /Subtype /Image /Width 1000 /Height %d "
+                           b"/ColorSpace /DeviceGray /BitsPerComponent 8 /Length %d >>\n"
+                           b"stream\n%s\nendstream" % (height, 1000 * height, pixels[:1000 * height]))
+            resources += f" /XObject << /Im1 {len(objects)} 0 R >>"
+            stream = b"q 595 0 0 842 0 0 cm /Im1 Do Q\n" + stream
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                        f"/Resources << {resources} >> /Contents {len(objects)} 0 R >>"
+                        ).encode())
+        kids.append(f"{len(objects)} 0 R")
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _xml_escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _docx_paragraph(text: str, font: Optional[str] = None) -> str:
+    if text == "\f":
+        return '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+    properties = f'<w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/></w:rPr>' if font else ""
+    return f'<w:p><w:r>{properties}<w:t xml:space="preserve">{_xml_escape(text)}</w:t></w:r></w:p>'
+
+
+_W_NS = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_R_NS = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+_WML_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml."
+
+
+def minimal_docx(paragraphs: Sequence[str], media_bytes: int = 0,
+                 tables: Sequence[Sequence[Sequence[str]]] = (),
+                 header: Optional[str] = None, footer: Optional[str] = None,
+                 footnotes: Sequence[str] = (), font: Optional[str] = None) -> bytes:
+    """
+    Build a valid DOCX with one Word paragraph per string, without python-docx.
+
+    ``tables`` (lists of rows of cell strings) follow the paragraphs; ``header``
+    and ``footer`` add a default header and footer part and ``footnotes`` a
+    footnotes part. ``media_bytes`` embeds an (unreferenced) image part of
+    that size, stored uncompressed, like the photos and scans that make real
+    uploads large. A "\\f" paragraph is a page break, and ``font`` sets the
+    font of every run.
+    """
+    body = "".join(_docx_paragraph(text, font) for text in paragraphs)
+    for table in tables:
+        rows = "".join(
+            "<w:tr>" + "".join(f"<w:tc>{_docx_paragraph(cell, font)}</w:tc>" for cell in row) + "</w:tr>"
+            for row in table
+        )
+        body += f"<w:tbl>{rows}</w:tbl>"
+    overrides = [("/word/document.xml", "document.main+xml")]
+    relationships = []
+    extra_parts = {}
+    section = ""
+    for kind, text in (("header", header), ("footer", footer)):
+        if text is not None:
+            rid = f"rId{len(relationships) + 1}"
+            tag = "hdr" if kind == "header" else "ftr"
+            extra_parts[f"word/{kind}1.xml"] = (
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<w:{tag} {_W_NS}>{_docx_paragraph(text)}</w:{tag}>'
+            )
+            overrides.append((f"/word/{kind}1.xml", f"{kind}+xml"))
+            relationships.append((rid, kind, f"{kind}1.xml"))
+            section += f'<w:{kind}Reference w:type="default" r:id="{rid}"/>'
+    if footnotes:
+        notes = "".join(f'<w:footnote w:id="{i + 1}">{_docx_paragraph(text)}</w:footnote>'
+                        for i, text in enumerate(footnotes))
+        extra_parts["word/footnotes.xml"] = (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<w:footnotes {_W_NS}><w:footnote w:type="separator" w:id="-1"><w:p><w:r>'
+            f'<w:separator/></w:r></w:p></w:footnote>{notes}</w:footnotes>'
+        )
+        overrides.append(("/word/footnotes.xml", "footnotes+xml"))
+        relationships.append((f"rId{len(relationships) + 1}", "footnotes", "footnotes.xml"))
+    if section:
+        body += f"<w:sectPr>{section}</w:sectPr>"
+
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Default Extension="png" ContentType="image/png"/>'
+            + "".join(f'<Override PartName="{name}" ContentType="{_WML_TYPE}{kind}"/>'
+                      for name, kind in overrides)
+            + '</Types>'
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{_REL_TYPE}officeDocument" Target="word/document.xml"/>'
+            '</Relationships>'
+        ),
+        "word/document.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<w:document {_W_NS} {_R_NS}><w:body>{body}</w:body></w:document>'
+        ),
+        **extra_parts,
+    }
+    if relationships:
+        parts["word/_rels/document.xml.rels"] = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(f'<Relationship Id="{rid}" Type="{_REL_TYPE}{kind}" Target="{target}"/>'
+                      for rid, kind, target in relationships)
+            + '</Relationships>'
+        )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in parts.items():
+            archive.writestr(name, content)
+        if media_bytes > 0:
+            archive.writestr("word/media/image1.png", bytes(range(256)) * (media_bytes // 256 + 1),
+                             compress_type=zipfile.ZIP_STORED)
+    return out.getvalue()
+
+
+def percentiles(values: Sequence[float]) -> Dict[str, Optional[float]]:
+    """p50/p95/p99 (nearest rank) of ``values``; None for an empty sequence."""
+    from lexiguard_sdk.hooks import percentile
+
+    return {name: percentile(values, fraction)
+            for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))}
+
+
+def parse_size(text: str) -> int:
+    """Parse sizes such as "512", "10KB" or "1MB" into bytes."""
+    text = text.strip().upper()
+    for suffix, factor in (("KB", 1024), ("MB", 1024 ** 2), ("K", 1024), ("M", 1024 ** 2)):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
+
+
+def format_size(size_bytes: int) -> str:
+    if size_bytes >= 1024 ** 2 and size_bytes % (1024 ** 2) == 0:
+        return f"{size_bytes // 1024 ** 2}MB"
+    if size_bytes >= 1024 and size_bytes % 1024 == 0:
+        return f"{size_bytes // 1024}KB"
+    return f"{size_bytes}B"
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the machine and revision a benchmark ran on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=str(REPO_ROOT),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": commit,
+    }
+
+
+def write_json(path: str, report: Dict[str, Any]) -> None:
+    Path(path).write_text(json.dumps(report, indent=2))
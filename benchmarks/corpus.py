@@ -0,0 +1,173 @@
+# benchmarks/corpus.py
+"""
+Synthetic contract corpus for the file-parsing benchmarks.
+
+``generate(spec)`` builds one contract as PDF, DOCX or TXT bytes, shaped by
+a ``CorpusSpec``:
+
+    format      "pdf", "docx" or "txt"
+    pages       pages of text: PDF pages, DOCX page breaks, TXT form feeds
+    tables      payment-schedule tables (Word tables in DOCX, aligned text
+                rows in PDF and TXT)
+    font        PDF standard font ("Helvetica", "Times-Roman", "Courier") or
+                DOCX run font
+    encoding    TXT byte encoding ("utf-8", "utf-8-sig", "utf-16", "latin-1",
+                "cp1252")
+    accents     use Latin-1 party names and symbols instead of plain ASCII
+    ocr_layout  PDF only: one text object per word, like OCR'd scans
+
+The same spec and seed always give the same bytes. Run as a script to write
+a corpus (every combination of the given options) to a directory:
+
+Usage:
+    python benchmarks/corpus.py ./corpus
+    python benchmarks/corpus.py ./corpus --formats pdf txt --pages 10 200 --encodings utf-8 latin-1
+"""
+
+import argparse
+import itertools
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from common import minimal_docx, minimal_pdf, synthetic_contract
+
+FORMATS = ("pdf", "docx", "txt")
+FONTS = ("Helvetica", "Times-Roman", "Courier")
+ENCODINGS = ("utf-8", "utf-8-sig", "utf-16", "latin-1", "cp1252")
+
+# Characters of contract text per page (about 40 wrapped lines)
+PAGE_CHARS = 3000
+
+_ACCENTS = {"The Provider": "Société Générale Müller", "the Provider": "Société Générale Müller",
+            "The Customer": "Björk & Søn", "the Customer": "Björk & Søn",
+            "New York": "Zürich (§ 4 OR)"}
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    format: str
+    pages: int = 10
+    tables: int = 0
+    font: str = "Helvetica"
+    encoding: str = "utf-8"
+    accents: bool = False
+    ocr_layout: bool = False
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        """File name describing the spec."""
+        parts = [f"{self.pages}p"]
+        if self.tables:
+            parts.append(f"{self.tables}t")
+        if self.format == "pdf":
+            parts.append(self.font.lower())
+            if self.ocr_layout:
+                parts.append("ocr")
+        elif self.format == "docx" and self.font != "Helvetica":
+            parts.append(self.font.lower())
+        if self.format == "txt":
+            parts.append(self.encoding)
+        if self.accents:
+            parts.append("accents")
+        return "-".join(parts) + f".{self.format}"
+
+
+def _page_texts(spec: CorpusSpec) -> List[str]:
+    pages = []
+    for page in range(spec.pages):
+        text = synthetic_contract(PAGE_CHARS, seed=spec.seed * 100_003 + page)
+        if spec.accents:
+            for plain, accented in _ACCENTS.items():
+                text = text.replace(plain, accented)
+        pages.append(text)
+    return pages
+
+
+def _schedule(number: int) -> List[List[str]]:
+    currency = "£" if number % 2 else "$"
+    return [["Installment", "Due date", "Amount"]] + [
+        [str(i + 1), f"2025-{i % 12 + 1:02d}-01", f"{currency}{(i + 1) * 1250 * (number + 1):,}.00"]
+        for i in range(12)
+    ]
+
+
+def _table_lines(table: List[List[str]]) -> str:
+    return "\n".join(f"{a:<14}{b:<14}{c:>16}" for a, b, c in table)
+
+
+def generate(spec: CorpusSpec) -> bytes:
+    """
+    Build the document described by ``spec``.
+
+    Raises:
+        ValueError: For an unknown format, or text the encoding cannot hold
+    """
+    if spec.format not in FORMATS:
+        raise ValueError(f"unknown format: {spec.format}")
+    pages = _page_texts(spec)
+    tables = [_schedule(number) for number in range(spec.tables)]
+
+    if spec.format == "docx":
+        paragraphs: List[str] = []
+        for page, text in enumerate(pages):
+            if page:
+                paragraphs.append("\f")
+            paragraphs.extend(block for block in text.split("\n\n") if block.strip())
+        return minimal_docx(paragraphs, tables=tables, font=spec.font)
+
+    # PDF and TXT pages carry the tables as text, one per page from the first
+    for number, table in enumerate(tables):
+        page = number % len(pages)
+        pages[page] = _table_lines(table) + "\n\n" + pages[page]
+    if spec.format == "pdf":
+        return minimal_pdf(pages, ocr_layout=spec.ocr_layout, font=spec.font, line_breaks=True)
+    return "\f".join(pages).encode(spec.encoding)
+
+
+def specs(formats: Sequence[str] = FORMATS, pages: Sequence[int] = (1, 10, 100),
+          tables: Sequence[int] = (0,), fonts: Sequence[str] = ("Helvetica",),
+          encodings: Sequence[str] = ("utf-8",), accents: Sequence[bool] = (False,),
+          ocr_layout: Sequence[bool] = (False,)) -> List[CorpusSpec]:
+    """
+    Every combination of the options, without duplicates: fonts only vary
+    PDF and DOCX files, encodings only TXT files and ``ocr_layout`` only PDFs.
+    """
+    result: Dict[CorpusSpec, None] = {}
+    for spec_format, count, table_count, font, encoding, accented, ocr in itertools.product(
+            formats, pages, tables, fonts, encodings, accents, ocr_layout):
+        spec = CorpusSpec(
+            format=spec_format, pages=count, tables=table_count,
+            font=font if spec_format != "txt" else "Helvetica",
+            encoding=encoding if spec_format == "txt" else "utf-8",
+            accents=accented, ocr_layout=ocr and spec_format == "pdf",
+        )
+        result[spec] = None
+    return list(result)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic contract corpus")
+    parser.add_argument("directory", help="output directory")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--pages", nargs="+", type=int, default=[1, 10, 100])
+    parser.add_argument("--tables", nargs="+", type=int, default=[0])
+    parser.add_argument("--fonts", nargs="+", choices=FONTS, default=["Helvetica"])
+    parser.add_argument("--encodings", nargs="+", choices=ENCODINGS, default=["utf-8"])
+    parser.add_argument("--accents", action="store_true", help="also write Latin-1 variants")
+    args = parser.parse_args()
+
+    output = Path(args.directory)
+    output.mkdir(parents=True, exist_ok=True)
+    for spec in specs(args.formats, args.pages, args.tables, args.fonts, args.encodings,
+                      (False, True) if args.accents else (False,)):
+        data = generate(spec)
+        (output / spec.name).write_bytes(data)
+        print(f"{spec.name:<40} {len(data):>10} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
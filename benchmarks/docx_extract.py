@@ -0,0 +1,148 @@
+# benchmarks/docx_extract.py
+"""
+Streaming DOCX reader vs. python-docx.
+
+Generates DOCX contracts of increasing paragraph count (with a payment
+schedule table, a header, a footer and footnotes) and extracts them, each
+run in a fresh subprocess, with:
+
+    iter_docx    the streaming reader, consuming blocks without keeping them
+    parse_docx   FileParser.parse_docx (the streaming reader, joined)
+    python-docx  Document(...).paragraphs, as parse_docx used to
+
+Reports extraction time, peak RSS growth and how much of the document's
+text each reader returned; the streaming reader's body paragraphs must match
+python-docx's.
+
+Usage:
+    python benchmarks/docx_extract.py
+    python benchmarks/docx_extract.py --paragraphs 1000 100000 --json docx.json
+"""
+
+import argparse
+import hashlib
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from common import environment, minimal_docx, synthetic_contract, write_json
+
+DEFAULT_PARAGRAPHS = (1000, 10000, 100000)
+READERS = ("iter_docx", "parse_docx", "python-docx")
+
+
+def _max_rss() -> int:
+    """Peak resident set size of this process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _generate(path: Path, count: int) -> None:
+    lines = [line for line in synthetic_contract(count * 120, seed=count).split("\n") if line.strip()]
+    paragraphs = (lines * (count // max(len(lines), 1) + 1))[:count]
+    schedule = [["Installment", "Due date", "Amount"]] + [
+        [str(i + 1), f"2025-{i % 12 + 1:02d}-01", f"${(i + 1) * 1250:,}.00"]
+        for i in range(max(count // 100, 12))
+    ]
+    path.write_bytes(minimal_docx(paragraphs, tables=[schedule], header="CONFIDENTIAL",
+                                  footer="Master Services Agreement",
+                                  footnotes=["Amounts exclude VAT."]))
+
+
+def _child(path: str, reader: str) -> Dict[str, Any]:
+    import io
+
+    from lexiguard_sdk.docx_reader import BODY, iter_docx
+    from lexiguard_sdk.file_utils import FileParser
+    if reader == "python-docx":
+        import docx
+    data = Path(path).read_bytes()
+    baseline = _max_rss()
+
+    started = time.perf_counter()
+    if reader == "iter_docx":
+        chars = sum(len(block.text) + 1 for block in iter_docx(io.BytesIO(data))) - 1
+    elif reader == "parse_docx":
+        chars = len(FileParser.parse_docx(data))
+    else:
+        document = docx.Document(io.BytesIO(data))
+        text = "\n".join(p.text for p in document.paragraphs if p.text.strip())
+        chars = len(text)
+    seconds = time.perf_counter() - started
+    peak = max(0, _max_rss() - baseline)
+
+    if reader == "python-docx":
+        body = text
+    else:
+        body = "\n".join(block.text for block in iter_docx(io.BytesIO(data), parts=(BODY,))
+                         if not block.table)
+    # Only a digest goes back: the parent must stay small (see main)
+    return {"seconds": seconds, "peak_bytes": peak, "chars": chars,
+            "body": hashlib.sha256(body.encode("utf-8")).hexdigest()}
+
+
+def _run(*args: str) -> Any:
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", __file__, *args],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        print(json.dumps(_child(*sys.argv[2:])))
+        return 0
+    if len(sys.argv) == 4 and sys.argv[1] == "--generate":
+        _generate(Path(sys.argv[2]), int(sys.argv[3]))
+        print("null")
+        return 0
+
+    parser = argparse.ArgumentParser(description="Streaming DOCX reader vs. python-docx")
+    parser.add_argument("--paragraphs", nargs="+", type=int, default=list(DEFAULT_PARAGRAPHS))
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "benchmark": "docx_extract",
+        "environment": environment(),
+        "config": {"paragraphs": args.paragraphs},
+        "results": [],
+    }
+
+    print(f"{'paras':>7} {'size KB':>8} {'reader':>12} {'ms':>9} {'peak MB':>8} {'chars':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.paragraphs:
+            path = Path(tmp) / f"doc-{count}.docx"
+            # Generated in a subprocess: a child starts with its parent's peak RSS,
+            # so the parent has to stay small
+            _run("--generate", str(path), str(count))
+            size = path.stat().st_size
+            results = {reader: _run("--child", str(path), reader) for reader in READERS}
+            if any(results[reader]["body"] != results["python-docx"]["body"] for reader in READERS):
+                print(f"error: body text differs from python-docx at {count} paragraphs",
+                      file=sys.stderr)
+                return 1
+            for reader, result in results.items():
+                report["results"].append({
+                    "paragraphs": count, "bytes": size, "reader": reader,
+                    "ms": round(result["seconds"] * 1000, 2),
+                    "peak_mb": round(result["peak_bytes"] / (1 << 20), 2),
+                    "chars": result["chars"],
+                })
+                print(f"{count:>7} {size / 1024:>8.0f} {reader:>12} {result['seconds'] * 1000:>9.1f} "
+                      f"{result['peak_bytes'] / (1 << 20):>8.1f} {result['chars']:>10}")
+
+    if args.json:
+        write_json(args.json, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
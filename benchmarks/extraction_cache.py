@@ -0,0 +1,102 @@
+# benchmarks/extraction_cache.py
+"""
+Extraction cache: cold parse vs. memory and disk hits.
+
+Generates PDF documents of increasing page count and times
+``FileParser.parse_uploaded_file`` without a cache, on a cold cache (extract
+and store), on a memory-tier hit and on a disk-tier hit (a fresh cache over
+the same database, as after a restart). A hit still hashes the upload, so
+the hash time is reported separately. All runs must return the same text.
+
+Usage:
+    python benchmarks/extraction_cache.py
+    python benchmarks/extraction_cache.py --pages 10 100 --json cache.json
+"""
+
+import argparse
+import hashlib
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from common import environment, minimal_pdf, synthetic_contract, write_json
+
+from lexiguard_sdk.file_utils import FileParser, make_extraction_cache
+
+DEFAULT_PAGES = (5, 50, 200)
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    timings: List[float] = []
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn()
+        timings.append(time.perf_counter() - started)
+    return {"ms": statistics.median(timings) * 1000, "value": value}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Extraction cache benchmark")
+    parser.add_argument("--pages", nargs="+", type=int, default=list(DEFAULT_PAGES))
+    parser.add_argument("--chars-per-page", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per hit case (median is reported)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "benchmark": "extraction_cache",
+        "environment": environment(),
+        "config": {"pages": args.pages, "chars_per_page": args.chars_per_page,
+                   "repeat": args.repeat},
+        "results": [],
+    }
+
+    print(f"{'pages':>6} {'size':>9} {'uncached ms':>12} {'cold ms':>8} "
+          f"{'memory ms':>10} {'disk ms':>8} {'sha256 ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.pages:
+            pages = [synthetic_contract(args.chars_per_page, seed=i) for i in range(count)]
+            data = minimal_pdf(pages, ocr_layout=True)
+            db = Path(tmp) / f"cache-{count}.db"
+
+            def parse(cache: Any = None) -> str:
+                result = FileParser.parse_uploaded_file(data, "contract.pdf", cache=cache)
+                if not result["success"]:
+                    raise SystemExit(f"parse failed: {result['error']}")
+                return result["text"]
+
+            uncached = _time(parse, 1)
+            cache = make_extraction_cache(db)
+            cold = _time(lambda: parse(cache), 1)
+            memory = _time(lambda: parse(cache), args.repeat)
+            # A new memory tier each run, so every lookup is served from disk
+            disk = _time(lambda: parse(make_extraction_cache(db)), args.repeat)
+            digest = _time(lambda: hashlib.sha256(data).hexdigest(), args.repeat)
+
+            texts = {uncached["value"], cold["value"], memory["value"], disk["value"]}
+            if len(texts) != 1:
+                print(f"error: cached text differs at {count} pages", file=sys.stderr)
+                return 1
+            report["results"].append({
+                "pages": count,
+                "bytes": len(data),
+                "uncached_ms": round(uncached["ms"], 2),
+                "cold_ms": round(cold["ms"], 2),
+                "memory_hit_ms": round(memory["ms"], 3),
+                "disk_hit_ms": round(disk["ms"], 3),
+                "sha256_ms": round(digest["ms"], 3),
+            })
+            print(f"{count:>6} {len(data):>9} {uncached['ms']:>12.1f} {cold['ms']:>8.1f} "
+                  f"{memory['ms']:>10.2f} {disk['ms']:>8.2f} {digest['ms']:>10.2f}")
+
+    if args.json:
+        write_json(args.json, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+# benchmarks/file_parsing.py
+"""
+File-parsing benchmark: the SDK against the services' own extraction code.
+
+Runs three text extraction implementations over the same documents:
+
+    sdk       FileParser.parse_file
+    backend   extract_text_from_pdf/_docx/_txt in lexiguard-backend/main.py
+    worker    extract_text in cloud-run-worker/main.py
+
+The services import their web framework and Google Cloud clients at module
+level, so their extraction functions are compiled from the source files on
+their own (later definitions replace earlier ones, as on import), with
+PyPDF2, python-docx and a logger bound to the names they use.
+
+The documents come from ``corpus.py`` (by default every format at 1, 10 and
+100 pages, with a table and Latin-1 text) or from ``--corpus DIR``. Each
+document and implementation is measured in a fresh subprocess: the median
+time over ``--repeat`` runs (reading the file included), pages/s, MB/s, peak
+RSS growth, and the characters returned. Failures are reported, not fatal.
+
+Usage:
+    python benchmarks/file_parsing.py
+    python benchmarks/file_parsing.py --formats pdf --pages 10 100 500 --repeat 5
+    python benchmarks/file_parsing.py --corpus ./contracts --json parsing.json
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import json
+import logging
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from common import REPO_ROOT, environment, write_json
+from corpus import FORMATS, CorpusSpec, generate, specs
+
+IMPLEMENTATIONS = ("sdk", "backend", "worker")
+SUPPORTED = {".pdf": "pdf", ".docx": "docx", ".txt": "txt"}
+
+_SERVICES = {
+    "backend": (REPO_ROOT / "lexiguard-backend" / "main.py",
+                ("extract_text_from_pdf", "extract_text_from_docx", "extract_text_from_txt")),
+    "worker": (REPO_ROOT / "cloud-run-worker" / "main.py", ("extract_text",)),
+}
+
+
+def _max_rss() -> int:
+    """Peak resident set size of this process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _service_functions(implementation: str) -> Dict[str, Callable]:
+    import PyPDF2
+    import docx
+
+    path, names = _SERVICES[implementation]
+    tree = ast.parse(path.read_text(encoding="utf-8-sig"), filename=str(path))
+    functions = [node for node in tree.body
+                 if isinstance(node, ast.FunctionDef) and node.name in names]
+    namespace: Dict[str, Any] = {
+        "io": io, "PyPDF2": PyPDF2, "Document": docx.Document, "DocxDocument": docx.Document,
+        "logger": logging.getLogger(path.parent.name),
+    }
+    exec(compile(ast.Module(body=functions, type_ignores=[]), str(path), "exec"), namespace)
+    return {name: namespace[name] for name in names}
+
+
+def _extractor(implementation: str, file_type: str) -> Callable[[str], str]:
+    if implementation == "sdk":
+        from lexiguard_sdk.file_utils import FileParser
+
+        def extract(path: str) -> str:
+            result = FileParser.parse_file(path, file_type)
+            if not result["success"]:
+                raise RuntimeError(result["error"])
+            return result["text"]
+        return extract
+
+    functions = _service_functions(implementation)
+    if implementation == "worker":
+        return lambda path: functions["extract_text"](Path(path).read_bytes(), file_type)
+
+    def extract(path: str) -> str:
+        # Like FastAPI's UploadFile.file
+        with open(path, "rb") as f:
+            return functions[f"extract_text_from_{file_type}"](f)
+    return extract
+
+
+def _child(path: str, file_type: str, implementation: str, repeat: int) -> Dict[str, Any]:
+    import PyPDF2  # noqa: F401
+    import docx  # noqa: F401
+
+    import lexiguard_sdk.docx_reader  # noqa: F401
+    import lexiguard_sdk.extractors  # noqa: F401
+
+    extract = _extractor(implementation, file_type)
+    # Libraries are loaded first so every implementation's peak is its own work
+    baseline = _max_rss()
+    timings: List[float] = []
+    chars = 0
+    # The worker prints progress lines; keep stdout for the result
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            started = time.perf_counter()
+            try:
+                text = extract(path)
+            except Exception as e:
+                return {"error": f"{type(e).__name__}: {e}"[:200]}
+            timings.append(time.perf_counter() - started)
+            chars = len(text)
+            del text
+    return {"seconds": statistics.median(timings), "peak_bytes": max(0, _max_rss() - baseline),
+            "chars": chars}
+
+
+def _page_count(path: str, file_type: str) -> int:
+    from lexiguard_sdk.file_utils import FileParser
+
+    try:
+        return sum(1 for _ in FileParser.iter_pages(path, file_type))
+    except Exception:
+        return 0
+
+
+def _run(*args: str) -> Any:
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", __file__, *args],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _documents(args: argparse.Namespace, directory: Path) -> List[Tuple[Path, str, int, Dict[str, Any]]]:
+    """(path, file type, pages, spec) for every document to measure."""
+    if args.corpus:
+        paths = [path for path in sorted(Path(args.corpus).rglob("*"))
+                 if path.is_file() and path.suffix.lower() in SUPPORTED]
+        return [(path, SUPPORTED[path.suffix.lower()],
+                 _run("--pages-of", str(path), SUPPORTED[path.suffix.lower()]), {})
+                for path in paths]
+    documents = []
+    for spec in specs(args.formats, args.pages, tables=[args.tables], fonts=[args.font],
+                      encodings=[args.encoding], accents=[args.accents]):
+        path = directory / spec.name
+        # Generated in a subprocess: a child starts with its parent's peak RSS,
+        # so the parent has to stay small
+        _run("--generate", str(path), json.dumps(asdict(spec)))
+        documents.append((path, spec.format, spec.pages, asdict(spec)))
+    return documents
+
+
+def main() -> int:
+    if len(sys.argv) == 6 and sys.argv[1] == "--child":
+        print(json.dumps(_child(sys.argv[2], sys.argv[3], sys.argv[4], int(sys.argv[5]))))
+        return 0
+    if len(sys.argv) == 4 and sys.argv[1] == "--generate":
+        Path(sys.argv[2]).write_bytes(generate(CorpusSpec(**json.loads(sys.argv[3]))))
+        print("null")
+        return 0
+    if len(sys.argv) == 4 and sys.argv[1] == "--pages-of":
+        print(json.dumps(_page_count(sys.argv[2], sys.argv[3])))
+        return 0
+
+    parser = argparse.ArgumentParser(description="SDK vs. service text extraction")
+    parser.add_argument("--corpus", metavar="DIR", help="directory of PDF/DOCX/TXT files (default: generated)")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--pages", nargs="+", type=int, default=[1, 10, 100])
+    parser.add_argument("--tables", type=int, default=1, help="tables per generated document")
+    parser.add_argument("--font", default="Helvetica", help="font of generated PDF/DOCX files")
+    parser.add_argument("--encoding", default="utf-8", help="encoding of generated TXT files")
+    parser.add_argument("--accents", action=argparse.BooleanOptionalAction, default=True,
+                        help="Latin-1 text in generated documents")
+    parser.add_argument("--implementations", nargs="+", choices=IMPLEMENTATIONS,
+                        default=list(IMPLEMENTATIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (median is reported)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "benchmark": "file_parsing",
+        "environment": environment(),
+        "config": {"corpus": args.corpus or "generated", "repeat": args.repeat,
+                   "implementations": args.implementations},
+        "results": [],
+    }
+    totals: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    print(f"{'document':<34} {'impl':<8} {'ms':>9} {'pages/s':>9} {'MB/s':>7} {'peak MB':>8} {'chars':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for path, file_type, pages, spec in _documents(args, Path(tmp)):
+            size = path.stat().st_size
+            for implementation in args.implementations:
+                result = _run("--child", str(path), file_type, implementation, str(args.repeat))
+                entry = {"document": path.name, "format": file_type, "pages": pages,
+                         "bytes": size, "implementation": implementation, "spec": spec}
+                if "error" in result:
+                    entry["error"] = result["error"]
+                    report["results"].append(entry)
+                    print(f"{path.name[:34]:<34} {implementation:<8} failed: {result['error'][:60]}")
+                    continue
+                seconds = max(result["seconds"], 1e-9)
+                entry.update({
+                    "ms": round(result["seconds"] * 1000, 3),
+                    "pages_per_second": round(pages / seconds, 1),
+                    "mb_per_second": round(size / (1 << 20) / seconds, 2),
+                    "peak_mb": round(result["peak_bytes"] / (1 << 20), 2),
+                    "chars": result["chars"],
+                })
+                report["results"].append(entry)
+                total = totals.setdefault((file_type, implementation),
+                                          {"seconds": 0.0, "pages": 0, "bytes": 0, "peak_mb": 0.0})
+                total["seconds"] += result["seconds"]
+                total["pages"] += pages
+                total["bytes"] += size
+                total["peak_mb"] = max(total["peak_mb"], entry["peak_mb"])
+                print(f"{path.name[:34]:<34} {implementation:<8} {entry['ms']:>9.1f} "
+                      f"{entry['pages_per_second']:>9.1f} {entry['mb_per_second']:>7.2f} "
+                      f"{entry['peak_mb']:>8.1f} {entry['chars']:>9}")
+
+    report["summary"] = []
+    print(f"\n{'format':<6} {'impl':<8} {'pages/s':>9} {'MB/s':>7} {'max peak MB':>12}")
+    for (file_type, implementation), total in sorted(totals.items()):
+        seconds = max(total["seconds"], 1e-9)
+        summary = {"format": file_type, "implementation": implementation,
+                   "pages_per_second": round(total["pages"] / seconds, 1),
+                   "mb_per_second": round(total["bytes"] / (1 << 20) / seconds, 2),
+                   "max_peak_mb": total["peak_mb"]}
+        report["summary"].append(summary)
+        print(f"{file_type:<6} {implementation:<8} {summary['pages_per_second']:>9.1f} "
+              f"{summary['mb_per_second']:>7.2f} {summary['max_peak_mb']:>12.1f}")
+
+    if args.json:
+        write_json(args.json, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# benchmarks/import_time.py
+"""
+Cold-start benchmark for the LexiGuard SDK.
+
+Each scenario runs in a fresh interpreter so nothing is already imported. The
+script reports the median import time per scenario and fails (exit code 1)
+when a scenario exceeds its budget or pulls in a heavy dependency that should
+only load on first use (the Gemini client library and its grpc stack).
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 --budget-scale 2 --json import_time.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# (statement, budget in milliseconds)
+SCENARIOS = [
+    ("import lexiguard_sdk", 20),
+    ("from lexiguard_sdk import FileParser", 30),
+    ("from lexiguard_sdk import LexiGuard", 150),
+    ("from lexiguard_sdk import AsyncLexiGuard", 250),
+]
+
+# Modules that must not be loaded by importing the SDK
+FORBIDDEN_MODULES = ("google.generativeai", "grpc", "google.protobuf")
+
+_CHILD = """
+import json, sys, time
+started = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(statement: str) -> dict:
+    """Run ``statement`` in a fresh interpreter and return its timing and modules."""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT), PYTHONDONTWRITEBYTECODE="1")
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", _CHILD.format(statement=statement)],
+        check=True, capture_output=True, text=True, env=env, cwd=str(REPO_ROOT),
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int, budget_scale: float) -> dict:
+    # Warm the bytecode cache so the first run doesn't include compilation
+    measure("import lexiguard_sdk.core, lexiguard_sdk.async_core, lexiguard_sdk.chat")
+
+    results = []
+    for statement, budget_ms in SCENARIOS:
+        samples = [measure(statement) for _ in range(repeat)]
+        times_ms = [sample["seconds"] * 1000 for sample in samples]
+        loaded = sorted({
+            name for sample in samples for name in sample["modules"]
+            if any(name == m or name.startswith(m + ".") for m in FORBIDDEN_MODULES)
+        })
+        median_ms = statistics.median(times_ms)
+        results.append({
+            "statement": statement,
+            "median_ms": round(median_ms, 2),
+            "min_ms": round(min(times_ms), 2),
+            "max_ms": round(max(times_ms), 2),
+            "budget_ms": budget_ms * budget_scale,
+            "forbidden_modules_loaded": loaded,
+            "passed": median_ms <= budget_ms * budget_scale and not loaded,
+        })
+    return {
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "scenarios": results,
+        "passed": all(r["passed"] for r in results),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="fresh interpreters per scenario (default: 5)")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="multiply every budget, e.g. 2 on slow CI machines")
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.budget_scale)
+    for r in report["scenarios"]:
+        status = "ok" if r["passed"] else "FAIL"
+        print(f"{status:4}  {r['median_ms']:8.1f} ms  (budget {r['budget_ms']:.0f} ms)  "
+              f"{r['statement']}")
+        if r["forbidden_modules_loaded"]:
+            print(f"      loaded eagerly: {', '.join(r['forbidden_modules_loaded'][:5])}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
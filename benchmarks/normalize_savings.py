@@ -0,0 +1,138 @@
+# benchmarks/normalize_savings.py
+"""
+Token savings of text normalization.
+
+Extracts documents page by page with ``FileParser.iter_pages`` and runs
+``normalize_pages`` over them, reporting estimated input tokens before and
+after, what each pass removed, and the time normalization takes next to
+extraction. Every normalized character is also mapped back through the
+offset map and checked against the original text.
+
+By default the corpus is generated: contracts typeset as PDFs with a running
+header, a "Page N of M" footer and words hyphenated at line ends, every other
+one with an OCR-style text layer. Generated pages are dense, so the savings
+they show are a floor; pass ``--corpus DIR`` to measure your own PDF, DOCX and
+TXT files.
+
+Usage:
+    python benchmarks/normalize_savings.py
+    python benchmarks/normalize_savings.py --corpus ./contracts --json normalize.json
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from common import environment, minimal_pdf, synthetic_contract, write_json
+
+from lexiguard_sdk.file_utils import FileParser
+from lexiguard_sdk.normalize import normalize_pages
+
+SUPPORTED = {".pdf": "pdf", ".docx": "docx", ".txt": "txt"}
+
+
+def _generated_corpus(documents: int, pages: int) -> List[Tuple[str, str, bytes]]:
+    corpus = []
+    for doc in range(documents):
+        texts = [synthetic_contract(4000, seed=doc * pages + i) for i in range(pages)]
+        data = minimal_pdf(texts, ocr_layout=doc % 2 == 1,
+                           header=f"Contract No. {1000 + doc} - Master Services Agreement",
+                           footer="Page {page} of {pages}", hyphenate=True)
+        corpus.append((f"generated-{doc}.pdf", "pdf", data))
+    return corpus
+
+
+def _mismatches(normalized: Any) -> int:
+    """Normalized characters whose mapped original character differs."""
+    bad = 0
+    for index, ch in enumerate(normalized.text):
+        source = normalized.original[normalized.original_offset(index)]
+        if source != ch and not (ch.isspace() and source.isspace()):
+            bad += 1
+    return bad
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Token savings of text normalization")
+    parser.add_argument("--corpus", metavar="DIR", help="directory of PDF/DOCX/TXT files (default: generated)")
+    parser.add_argument("--documents", type=int, default=5, help="generated documents")
+    parser.add_argument("--pages", type=int, default=20, help="pages per generated document")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = [(path.name, SUPPORTED[path.suffix.lower()], path.read_bytes())
+                  for path in sorted(Path(args.corpus).rglob("*"))
+                  if path.is_file() and path.suffix.lower() in SUPPORTED]
+    else:
+        corpus = _generated_corpus(args.documents, args.pages)
+    if not corpus:
+        print("error: no supported files in the corpus", file=sys.stderr)
+        return 1
+
+    report: Dict[str, Any] = {
+        "benchmark": "normalize_savings",
+        "environment": environment(),
+        "config": {"corpus": args.corpus or "generated", "documents": len(corpus)},
+        "results": [],
+    }
+
+    print(f"{'document':<24} {'tokens':>9} {'after':>9} {'saved':>7} "
+          f"{'hdr/ftr':>7} {'pg#':>5} {'hyph':>5} {'ws chars':>9} {'extract ms':>11} {'norm ms':>8}")
+    totals = {"original_tokens": 0, "normalized_tokens": 0, "extract_seconds": 0.0,
+              "normalize_seconds": 0.0}
+    for name, file_type, data in corpus:
+        started = time.perf_counter()
+        try:
+            pages = [page["text"] for page in FileParser.iter_pages(data, file_type)]
+        except Exception as e:
+            print(f"{name:<24} failed: {e}", file=sys.stderr)
+            continue
+        extracted = time.perf_counter()
+        normalized = normalize_pages(pages)
+        finished = time.perf_counter()
+
+        mismatches = _mismatches(normalized)
+        if mismatches:
+            print(f"error: {mismatches} characters of {name} map to different original text",
+                  file=sys.stderr)
+            return 1
+        stats = normalized.stats
+        report["results"].append({
+            "document": name,
+            "pages": len(pages),
+            **stats,
+            "extract_ms": round((extracted - started) * 1000, 2),
+            "normalize_ms": round((finished - extracted) * 1000, 2),
+        })
+        totals["original_tokens"] += stats["original_tokens"]
+        totals["normalized_tokens"] += stats["normalized_tokens"]
+        totals["extract_seconds"] += extracted - started
+        totals["normalize_seconds"] += finished - extracted
+        print(f"{name[:24]:<24} {stats['original_tokens']:>9} {stats['normalized_tokens']:>9} "
+              f"{stats['token_savings']:>7.1%} {stats['header_footer_lines']:>7} "
+              f"{stats['page_numbers']:>5} {stats['hyphenations']:>5} {stats['whitespace_chars']:>9} "
+              f"{(extracted - started) * 1000:>11.1f} {(finished - extracted) * 1000:>8.1f}")
+
+    if totals["original_tokens"]:
+        saved = 1 - totals["normalized_tokens"] / totals["original_tokens"]
+        report["total"] = {
+            "original_tokens": totals["original_tokens"],
+            "normalized_tokens": totals["normalized_tokens"],
+            "token_savings": round(saved, 4),
+            "normalize_share_of_extraction": round(
+                totals["normalize_seconds"] / max(totals["extract_seconds"], 1e-9), 4),
+        }
+        print(f"\ntotal: {totals['original_tokens']} -> {totals['normalized_tokens']} tokens "
+              f"({saved:.1%} saved); normalizing took "
+              f"{report['total']['normalize_share_of_extraction']:.1%} of extraction time")
+
+    if args.json:
+        write_json(args.json, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+# benchmarks/parse_memory.py
+"""
+Peak memory of text extraction for large inputs.
+
+Generates a PDF, a DOCX and a TXT file of about ``--size`` bytes (PDF and DOCX
+are padded with embedded images, as real scanned uploads are) and parses each
+one in a fresh subprocess per input kind:
+
+    path     FileParser.parse_file(path) - the file is memory-mapped
+    bytes    parse_uploaded_file(data) with the whole file already in memory
+    mmap     parse_uploaded_file(mmap.mmap(...))
+    bytesio  parse_pdf/parse_docx/parse_txt(BytesIO(data))
+    file     parse_pdf/parse_docx/parse_txt(open(path, "rb")), which has to
+             read the whole file into memory
+
+The reported peak is the growth of the child's maximum resident set size
+while parsing, after the parser modules are imported and the input is
+prepared, so it covers only the copies extraction itself makes. Inputs are
+generated in a subprocess too: a child starts with the peak RSS of the
+process that spawned it, so the parent has to stay small. Pages of a memory-mapped file that
+the parser touches count toward RSS as well, although they are shared page
+cache the kernel can drop, not private copies. ``--max-ratio``
+fails the run when a peak exceeds that multiple of the input size.
+
+Usage:
+    python benchmarks/parse_memory.py
+    python benchmarks/parse_memory.py --size 50MB --formats pdf docx --json memory.json
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from common import environment, minimal_docx, minimal_pdf, synthetic_contract, write_json
+
+MODES = ("path", "bytes", "mmap", "bytesio", "file")
+FORMATS = ("pdf", "docx", "txt")
+
+
+def _size(value: str) -> int:
+    units = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+    value = value.strip().upper()
+    for suffix, factor in units.items():
+        if value.endswith(suffix):
+            return int(float(value[:-len(suffix)]) * factor)
+    return int(value)
+
+
+def _max_rss() -> int:
+    """Peak resident set size of this process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _generate(fmt: str, path: Path, size: int) -> None:
+    text_pages = [synthetic_contract(3000, seed=i) for i in range(20)]
+    if fmt == "pdf":
+        path.write_bytes(minimal_pdf(text_pages, image_bytes=size // len(text_pages)))
+    elif fmt == "docx":
+        paragraphs = [p for page in text_pages for p in page.split("\n") if p]
+        path.write_bytes(minimal_docx(paragraphs, media_bytes=size))
+    else:
+        page = "\n".join(text_pages)
+        path.write_text(page * (size // len(page) + 1), encoding="utf-8")
+
+
+def _child(path: str, fmt: str, mode: str) -> Dict[str, Any]:
+    import io
+    import mmap
+
+    from lexiguard_sdk.file_utils import FileParser
+
+    if mode == "path":
+        source: Any = path
+    elif mode == "mmap":
+        with open(path, "rb") as f:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    elif mode == "bytesio":
+        source = io.BytesIO(Path(path).read_bytes())
+    elif mode == "file":
+        source = open(path, "rb")
+    else:
+        source = Path(path).read_bytes()
+    baseline = _max_rss()
+
+    started = time.perf_counter()
+    if mode == "path":
+        text = FileParser.parse_file(source, parallel_pdf=False)["text"]
+    elif mode in ("bytesio", "file"):
+        text = getattr(FileParser, f"parse_{fmt}")(source)
+    else:
+        text = FileParser.parse_uploaded_file(source, f"upload.{fmt}")["text"]
+    seconds = time.perf_counter() - started
+
+    return {"peak_bytes": max(0, _max_rss() - baseline), "seconds": seconds,
+            "chars": len(text)}
+
+
+def _run(*args: str) -> Any:
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", __file__, *args],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        print(json.dumps(_child(*sys.argv[2:])))
+        return 0
+    if len(sys.argv) == 5 and sys.argv[1] == "--generate":
+        _generate(sys.argv[2], Path(sys.argv[3]), int(sys.argv[4]))
+        print("null")
+        return 0
+
+    parser = argparse.ArgumentParser(description="Peak RSS of text extraction for large inputs")
+    parser.add_argument("--size", type=_size, default=_size("50MB"),
+                        help="approximate input size, e.g. 50MB (default: 50MB)")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--max-ratio", type=float, default=None,
+                        help="fail when a peak exceeds this multiple of the input size")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {
+        "benchmark": "parse_memory",
+        "environment": environment(),
+        "config": {"size": args.size, "formats": args.formats, "modes": args.modes},
+        "results": [],
+    }
+    failures: List[str] = []
+
+    print(f"{'format':>6} {'mode':>7} {'input MB':>9} {'peak MB':>8} {'ratio':>6} {'ms':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.formats:
+            path = Path(tmp) / f"input.{fmt}"
+            _run("--generate", fmt, str(path), str(args.size))
+            size = path.stat().st_size
+            for mode in args.modes:
+                result = _run("--child", str(path), fmt, mode)
+                ratio = result["peak_bytes"] / size
+                report["results"].append({
+                    "format": fmt, "mode": mode, "bytes": size,
+                    "peak_mb": round(result["peak_bytes"] / (1 << 20), 2),
+                    "peak_ratio": round(ratio, 3),
+                    "ms": round(result["seconds"] * 1000, 2),
+                    "chars": result["chars"],
+                })
+                print(f"{fmt:>6} {mode:>7} {size / (1 << 20):>9.1f} "
+                      f"{result['peak_bytes'] / (1 << 20):>8.1f} {ratio:>6.2f} "
+                      f"{result['seconds'] * 1000:>8.1f}")
+                if args.max_ratio is not None and ratio > args.max_ratio:
+                    failures.append(f"{fmt}/{mode}: peak {ratio:.2f}x input > {args.max_ratio}x")
+
+    if args.json:
+        write_json(args.json, report)
+    for failure in failures:
+        print(f"error: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# benchmarks/pdf_backends.py
+"""
+Rank the installed PDF extraction backends.
+
+Extracts every page of a sample corpus with each installed extractor from
+``lexiguard_sdk.extractors`` on its own (no fallback) and reports pages/s,
+MB/s, failed documents and the pages each one returned empty or garbled. By
+default the corpus is generated (plain and OCR-style text layers); pass
+``--corpus DIR`` to rank on your own PDFs, which is what a deployment should
+do before choosing. The extractors are then ranked by speed, and the
+resulting chain is printed as a ``LEXIGUARD_PDF_EXTRACTORS`` setting.
+
+Usage:
+    python benchmarks/pdf_backends.py
+    python benchmarks/pdf_backends.py --corpus ./contracts --json backends.json
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from common import environment, minimal_pdf, synthetic_contract, write_json
+
+from lexiguard_sdk.extractors import ENV_EXTRACTORS, needs_fallback, pdf_extractors
+
+
+def _generated_corpus(documents: int, pages: int) -> List[Tuple[str, bytes]]:
+    corpus = []
+    for doc in range(documents):
+        texts = [synthetic_contract(3000, seed=doc * pages + i) for i in range(pages)]
+        corpus.append((f"generated-{doc}.pdf", minimal_pdf(texts, ocr_layout=doc % 2 == 1)))
+    return corpus
+
+
+def _run(extractor: Any, corpus: List[Tuple[str, bytes]], repeat: int) -> Dict[str, Any]:
+    timings: List[float] = []
+    pages = empty = failed = 0
+    for run in range(repeat):
+        elapsed = 0.0
+        for _, data in corpus:
+            started = time.perf_counter()
+            try:
+                with extractor.open(memoryview(data)) as document:
+                    texts = [document.page_text(i) for i in range(document.page_count)]
+            except Exception:
+                failed += run == 0
+                continue
+            elapsed += time.perf_counter() - started
+            if run == 0:
+                pages += len(texts)
+                empty += sum(needs_fallback(text) for text in texts)
+        timings.append(elapsed)
+    return {"seconds": statistics.median(timings), "pages": pages,
+            "fallback_pages": empty, "failed_documents": failed}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rank installed PDF extraction backends")
+    parser.add_argument("--corpus", metavar="DIR", help="directory of PDFs (default: generated)")
+    parser.add_argument("--documents", type=int, default=6, help="generated documents")
+    parser.add_argument("--pages", type=int, default=20, help="pages per generated document")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per extractor (median is reported)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = [(path.name, path.read_bytes()) for path in sorted(Path(args.corpus).rglob("*.pdf"))]
+    else:
+        corpus = _generated_corpus(args.documents, args.pages)
+    if not corpus:
+        print("error: no PDFs in the corpus", file=sys.stderr)
+        return 1
+    extractors = pdf_extractors(installed_only=True)
+    if not extractors:
+        print("error: no PDF extractor is installed", file=sys.stderr)
+        return 1
+
+    total_bytes = sum(len(data) for _, data in corpus)
+    report: Dict[str, Any] = {
+        "benchmark": "pdf_backends",
+        "environment": environment(),
+        "config": {"corpus": args.corpus or "generated", "documents": len(corpus),
+                   "bytes": total_bytes, "repeat": args.repeat,
+                   "installed": [extractor.name for extractor in extractors],
+                   "not_installed": [e.name for e in pdf_extractors(installed_only=False)
+                                     if e not in extractors]},
+        "results": [],
+    }
+
+    for extractor in extractors:
+        result = _run(extractor, corpus, args.repeat)
+        seconds = max(result["seconds"], 1e-9)
+        report["results"].append({
+            "extractor": extractor.name,
+            "seconds": round(result["seconds"], 4),
+            "pages_per_second": round(result["pages"] / seconds, 1),
+            "mb_per_second": round(total_bytes / (1 << 20) / seconds, 2),
+            "fallback_pages": result["fallback_pages"],
+            "failed_documents": result["failed_documents"],
+        })
+
+    # Extractors that fail on documents go last, the rest by speed
+    ranking = sorted(report["results"],
+                     key=lambda r: (r["failed_documents"] > 0, -r["pages_per_second"]))
+    report["ranking"] = [r["extractor"] for r in ranking]
+
+    print(f"{len(corpus)} documents, {total_bytes / (1 << 20):.1f} MB")
+    print(f"{'rank':>4} {'extractor':<10} {'pages/s':>9} {'MB/s':>7} {'empty/garbled':>14} {'failed':>7}")
+    for rank, r in enumerate(ranking, 1):
+        print(f"{rank:>4} {r['extractor']:<10} {r['pages_per_second']:>9.1f} "
+              f"{r['mb_per_second']:>7.2f} {r['fallback_pages']:>14} {r['failed_documents']:>7}")
+    if report["config"]["not_installed"]:
+        print(f"not installed: {', '.join(report['config']['not_installed'])}")
+    print(f"\n{ENV_EXTRACTORS}={','.join(report['ranking'])}")
+
+    if args.json:
+        write_json(args.json, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
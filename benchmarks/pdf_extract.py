@@ -0,0 +1,102 @@
+# benchmarks/pdf_extract.py
+"""
+Serial vs. parallel PDF text extraction.
+
+Generates PDFs of increasing page count (by default with an OCR-style text
+layer, where every word is positioned separately) and times
+``FileParser.parse_pdf`` with ``parallel=False`` and ``parallel=True``. The
+worker pool is warmed up before timing, as it is in a long-running service,
+and both modes must return identical text. The speed-up column shows where
+``PARALLEL_PDF_MIN_PAGES`` should sit on this machine.
+
+Usage:
+    python benchmarks/pdf_extract.py
+    python benchmarks/pdf_extract.py --pages 16 64 256 --workers 8 --json pdf.json
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from common import environment, minimal_pdf, synthetic_contract, write_json
+
+from lexiguard_sdk.file_utils import PARALLEL_PDF_MIN_PAGES, FileParser
+
+DEFAULT_PAGES = (8, 32, 64, 128, 256)
+
+
+def _time(path: str, parallel: bool, workers: int, repeat: int) -> Dict[str, Any]:
+    timings: List[float] = []
+    text = ""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = FileParser.parse_pdf(path, parallel=parallel, max_workers=workers)
+        timings.append(time.perf_counter() - started)
+    return {"seconds": statistics.median(timings), "text": text}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serial vs. parallel PDF extraction benchmark")
+    parser.add_argument("--pages", nargs="+", type=int, default=list(DEFAULT_PAGES))
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes for parallel mode (default: CPU count)")
+    parser.add_argument("--chars-per-page", type=int, default=3000)
+    parser.add_argument("--plain", action="store_true",
+                        help="one text run per line instead of an OCR-style layer")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case (median is reported)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    workers = args.workers or os.cpu_count() or 1
+    report: Dict[str, Any] = {
+        "benchmark": "pdf_extract",
+        "environment": environment(),
+        "config": {"pages": args.pages, "workers": workers,
+                   "chars_per_page": args.chars_per_page, "ocr_layout": not args.plain,
+                   "repeat": args.repeat, "parallel_min_pages": PARALLEL_PDF_MIN_PAGES},
+        "results": [],
+    }
+    if workers < 2:
+        print("note: only one worker; parallel mode cannot be faster here", file=sys.stderr)
+
+    print(f"{'pages':>6} {'size':>9} {'serial ms':>10} {'parallel ms':>12} {'speed-up':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Start the worker processes before anything is timed
+        warmup = Path(tmp) / "warmup.pdf"
+        warmup.write_bytes(minimal_pdf(["warm up"] * workers))
+        FileParser.parse_pdf(str(warmup), parallel=True, max_workers=workers)
+
+        for count in args.pages:
+            pages = [synthetic_contract(args.chars_per_page, seed=i) for i in range(count)]
+            path = Path(tmp) / f"doc-{count}.pdf"
+            path.write_bytes(minimal_pdf(pages, ocr_layout=not args.plain))
+
+            serial = _time(str(path), False, workers, args.repeat)
+            parallel = _time(str(path), True, workers, args.repeat)
+            if serial["text"] != parallel["text"]:
+                print(f"error: parallel text differs from serial text at {count} pages",
+                      file=sys.stderr)
+                return 1
+            speedup = serial["seconds"] / parallel["seconds"]
+            report["results"].append({
+                "pages": count,
+                "bytes": path.stat().st_size,
+                "serial_ms": round(serial["seconds"] * 1000, 2),
+                "parallel_ms": round(parallel["seconds"] * 1000, 2),
+                "speedup": round(speedup, 3),
+            })
+            print(f"{count:>6} {path.stat().st_size:>9} {serial['seconds'] * 1000:>10.1f} "
+                  f"{parallel['seconds'] * 1000:>12.1f} {speedup:>8.2f}x")
+
+    if args.json:
+        write_json(args.json, report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
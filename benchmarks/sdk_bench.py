@@ -0,0 +1,240 @@
+# benchmarks/sdk_bench.py
+"""
+Latency and throughput benchmark for the LexiGuard SDK.
+
+Runs the SDK against the offline ``FakeBackend`` (no API key or network
+needed) with a configurable latency distribution, and measures p50/p95/p99
+latency and documents/second for each scenario across document sizes and
+concurrency levels:
+
+    analyze_text     threads calling LexiGuard.analyze_text
+    analyze_clauses  threads calling LexiGuard.analyze_clauses
+    batch            LexiGuard.analyze_many(mode="text")
+    stream           threads iterating analyze_clauses(stream=True); also
+                     reports time to the first clause
+    async            AsyncLexiGuard.analyze_text under asyncio.gather
+
+Every document in a run is distinct, so request coalescing never merges
+calls. Build and parse times come from the SDK's instrumentation hooks and
+show the SDK's own CPU cost next to the simulated model latency. With
+``--hedge-rate`` the non-streaming scenarios run with request hedging and
+report how many hedges were sent and won.
+
+Usage:
+    python benchmarks/sdk_bench.py
+    python benchmarks/sdk_bench.py --sizes 1KB 100KB --concurrency 1 8 32 \\
+        --scenarios analyze_text batch --json results.json
+    python benchmarks/sdk_bench.py --json new.json --compare old.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from common import (environment, format_size, parse_size, percentiles,
+                    synthetic_contract, write_json)
+
+from lexiguard_sdk import AsyncLexiGuard, LexiGuard
+from lexiguard_sdk.backends import FakeBackend, lognormal_latency
+from lexiguard_sdk.hedging import HedgePolicy
+from lexiguard_sdk.hooks import CallRecord, Hooks
+
+SCENARIOS = ("analyze_text", "analyze_clauses", "batch", "stream", "async")
+DEFAULT_SIZES = ("1KB", "10KB", "100KB", "1MB")
+DEFAULT_CONCURRENCY = (1, 4, 16)
+
+
+class RecordingHooks(Hooks):
+    """Keeps every finished call record."""
+
+    def __init__(self):
+        self.records: List[CallRecord] = []
+
+    def after_response(self, record: CallRecord) -> None:
+        self.records.append(record)
+
+    def on_error(self, record: CallRecord, error: BaseException) -> None:
+        self.records.append(record)
+
+
+def _timed(fn: Callable[[], Dict[str, Any]]) -> Tuple[float, bool]:
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, bool(result.get("success"))
+
+
+def _stream_one(lg: LexiGuard, text: str) -> Tuple[float, float, bool]:
+    started = time.perf_counter()
+    first = None
+    success = False
+    for event in lg.analyze_clauses(text, stream=True):
+        if first is None and event["type"] == "item":
+            first = time.perf_counter() - started
+        if event["type"] == "result":
+            success = bool(event["result"].get("success"))
+    total = time.perf_counter() - started
+    return total, (first if first is not None else total), success
+
+
+def run_case(scenario: str, texts: List[str], concurrency: int,
+             backend: FakeBackend, hedge_rate: float = 0.0) -> Dict[str, Any]:
+    """Run one scenario over ``texts`` and summarize it."""
+    hooks = RecordingHooks()
+    hedging = HedgePolicy(max_hedge_rate=hedge_rate) if hedge_rate > 0 else None
+    latencies: List[float] = []
+    first_item: List[float] = []
+    successes = 0
+
+    started = time.perf_counter()
+    if scenario == "async":
+        async def run_async() -> List[Tuple[float, bool]]:
+            client = AsyncLexiGuard(backend=backend, max_concurrency=concurrency,
+                                    hooks=[hooks], retry_policy=None,
+                                    hedge_policy=hedging)
+            # Admit calls like a worker pool would, so latency excludes queueing
+            slots = asyncio.Semaphore(concurrency)
+
+            async def one(text: str) -> Tuple[float, bool]:
+                async with slots:
+                    begun = time.perf_counter()
+                    result = await client.analyze_text(text)
+                    return time.perf_counter() - begun, bool(result.get("success"))
+
+            return await asyncio.gather(*[one(text) for text in texts])
+
+        for latency, ok in asyncio.run(run_async()):
+            latencies.append(latency)
+            successes += ok
+    else:
+        lg = LexiGuard(backend=backend, hooks=[hooks], retry_policy=None,
+                       hedge_policy=hedging)
+        if scenario == "batch":
+            results = lg.analyze_many(texts, mode="text", max_concurrency=concurrency)
+            successes = sum(bool(r.get("success")) for r in results)
+            latencies = [record.latency for record in hooks.records]
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                if scenario == "stream":
+                    for total, first, ok in pool.map(lambda t: _stream_one(lg, t), texts):
+                        latencies.append(total)
+                        first_item.append(first)
+                        successes += ok
+                else:
+                    method = getattr(lg, scenario)
+                    for latency, ok in pool.map(lambda t: _timed(lambda: method(t)), texts):
+                        latencies.append(latency)
+                        successes += ok
+    wall = time.perf_counter() - started
+
+    def ms(values: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: (round(v * 1000, 3) if v is not None else None) for k, v in values.items()}
+
+    summary = {
+        "scenario": scenario,
+        "size_bytes": len(texts[0]),
+        "concurrency": concurrency,
+        "documents": len(texts),
+        "success_rate": round(successes / len(texts), 4),
+        "wall_seconds": round(wall, 4),
+        "docs_per_second": round(len(texts) / wall, 3),
+        "latency_ms": ms(percentiles(latencies)),
+        "build_ms": ms(percentiles([r.build_seconds for r in hooks.records])),
+        "parse_ms": ms(percentiles([r.parse_seconds for r in hooks.records])),
+    }
+    if scenario == "stream":
+        summary["first_item_ms"] = ms(percentiles(first_item))
+    if hedging is not None:
+        summary["hedging"] = hedging.stats()
+        hedging.shutdown()
+    return summary
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print throughput and p95 ratios against a previous report."""
+    def key(r: Dict[str, Any]) -> Tuple[str, int, int]:
+        return r["scenario"], r["size_bytes"], r["concurrency"]
+
+    old = {key(r): r for r in baseline.get("results", [])}
+    print(f"\nCompared with {baseline.get('environment', {}).get('commit') or 'baseline'}:")
+    print(f"{'scenario':16} {'size':>6} {'conc':>5} {'docs/s':>9} {'p95':>9}")
+    for r in report["results"]:
+        prev = old.get(key(r))
+        if prev is None:
+            continue
+        throughput = r["docs_per_second"] / prev["docs_per_second"]
+        p95 = r["latency_ms"]["p95"] / prev["latency_ms"]["p95"]
+        print(f"{r['scenario']:16} {format_size(r['size_bytes']):>6} {r['concurrency']:>5} "
+              f"{throughput:>8.2f}x {p95:>8.2f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="LexiGuard SDK latency/throughput benchmark")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES),
+                        help="document sizes, e.g. 1KB 10KB 1MB")
+    parser.add_argument("--concurrency", nargs="+", type=int,
+                        default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--docs", type=int, default=32,
+                        help="documents per run (at least 4x the concurrency is used)")
+    parser.add_argument("--latency-median", type=float, default=0.05,
+                        help="median fake model latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5,
+                        help="log-normal spread of the fake latency")
+    parser.add_argument("--seconds-per-output-token", type=float, default=0.0)
+    parser.add_argument("--hedge-rate", type=float, default=0.0,
+                        help="enable request hedging with this max hedge rate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="previous JSON report to compare with")
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes]
+    report: Dict[str, Any] = {
+        "benchmark": "sdk",
+        "environment": environment(),
+        "config": {
+            "scenarios": args.scenarios, "sizes": sizes, "concurrency": args.concurrency,
+            "docs": args.docs, "latency_median": args.latency_median,
+            "latency_sigma": args.latency_sigma,
+            "seconds_per_output_token": args.seconds_per_output_token, "seed": args.seed,
+            "hedge_rate": args.hedge_rate,
+        },
+        "results": [],
+    }
+
+    print(f"{'scenario':16} {'size':>6} {'conc':>5} {'docs/s':>9} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ok':>5}")
+    for size in sizes:
+        base = synthetic_contract(size, seed=args.seed)
+        for concurrency in args.concurrency:
+            count = max(args.docs, concurrency * 4)
+            # Distinct documents of the same size, so nothing is coalesced
+            texts = [(f"Ref {i:06d}\n" + base)[:max(size, 11)] for i in range(count)]
+            for scenario in args.scenarios:
+                backend = FakeBackend(
+                    latency=lognormal_latency(args.latency_median, args.latency_sigma),
+                    seconds_per_output_token=args.seconds_per_output_token,
+                    seed=args.seed,
+                )
+                result = run_case(scenario, texts, concurrency, backend, args.hedge_rate)
+                report["results"].append(result)
+                latency = result["latency_ms"]
+                print(f"{scenario:16} {format_size(size):>6} {concurrency:>5} "
+                      f"{result['docs_per_second']:>9.1f} {latency['p50']:>9.1f} "
+                      f"{latency['p95']:>9.1f} {latency['p99']:>9.1f} "
+                      f"{result['success_rate']:>5.0%}")
+
+    if args.json:
+        write_json(args.json, report)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,7 +12,7 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from lexiguard_sdk import LexiGuard, FileParser, LexiGuardError
+from lexiguard_sdk import AsyncLexiGuard, FileParser, LexiGuardError
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -35,7 +35,10 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 
 # Initialize SDK
 try:
-    lexiguard = LexiGuard(api_key=GEMINI_API_KEY)
+    lexiguard = AsyncLexiGuard(
+        api_key=GEMINI_API_KEY,
+        max_concurrency=int(os.getenv("LEXIGUARD_MAX_CONCURRENCY", "20"))
+    )
 except LexiGuardError as e:
     print(f"Warning: Failed to initialize LexiGuard: {e}")
     lexiguard = None
@@ -93,7 +96,7 @@ async def analyze_text(request: AnalyzeTextRequest):
     if not lexiguard:
         raise HTTPException(status_code=500, detail="LexiGuard SDK not initialized")
     
-    result = lexiguard.analyze_text(request.text)
+    result = await lexiguard.analyze_text(request.text)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result.get("error", "Analysis failed"))
@@ -117,7 +120,7 @@ async def analyze_file(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail=parse_result["error"])
     
     # Analyze text
-    analysis = lexiguard.analyze_text(parse_result["text"])
+    analysis = await lexiguard.analyze_text(parse_result["text"])
     
     if not analysis["success"]:
         raise HTTPException(status_code=400, detail=analysis.get("error", "Analysis failed"))
@@ -137,7 +140,7 @@ async def analyze_clauses(request: AnalyzeClausesRequest):
     if not lexiguard:
         raise HTTPException(status_code=500, detail="LexiGuard SDK not initialized")
     
-    result = lexiguard.analyze_clauses(request.text, request.clause_types)
+    result = await lexiguard.analyze_clauses(request.text, request.clause_types)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result.get("error", "Analysis failed"))
@@ -151,7 +154,7 @@ async def analyze_extended(request: AnalyzeTextRequest):
     if not lexiguard:
         raise HTTPException(status_code=500, detail="LexiGuard SDK not initialized")
     
-    result = lexiguard.analyze_fairness(request.text)
+    result = await lexiguard.analyze_fairness(request.text)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result.get("error", "Analysis failed"))
@@ -165,7 +168,7 @@ async def draft_negotiation(request: DraftNegotiationRequest):
     if not lexiguard:
         raise HTTPException(status_code=500, detail="LexiGuard SDK not initialized")
     
-    result = lexiguard.draft_negotiation_email(
+    result = await lexiguard.draft_negotiation_email(
         request.document_text,
         request.concerns,
         request.recipient_name
@@ -183,7 +186,7 @@ async def draft_document_email(request: DraftDocumentEmailRequest):
     if not lexiguard:
         raise HTTPException(status_code=500, detail="LexiGuard SDK not initialized")
     
-    result = lexiguard.draft_document_review_email(
+    result = await lexiguard.draft_document_review_email(
         request.document_text,
         request.review_notes,
         request.recipient_name
@@ -201,7 +204,7 @@ async def chat(request: ChatRequest):
     if not lexiguard:
         raise HTTPException(status_code=500, detail="LexiGuard SDK not initialized")
     
-    result = lexiguard.chat(request.message, request.document_context)
+    result = await lexiguard.chat(request.message, request.document_context)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result.get("error", "Chat failed"))
@@ -9,18 +9,56 @@ Usage:
     
     lg = LexiGuard(api_key="YOUR_API_KEY")
     result = lg.analyze_text("Contract text here...")
+
+Submodules are imported on first attribute access, so ``import lexiguard_sdk``
+is cheap and ``from lexiguard_sdk import FileParser`` never loads the model
+clients. The Gemini client library itself is only imported when a client
+using the default backend is created.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "LexiGuard Team"
 
-from .core import LexiGuard, LexiGuardError
-from .file_utils import FileParser, FileParsingError, analyze_file_quick
+# Public name -> submodule defining it
+_EXPORTS = {
+    "LexiGuard": ".core",
+    "LexiGuardError": ".core",
+    "AsyncLexiGuard": ".async_core",
+    "ChatSession": ".chat",
+    "FileParser": ".file_utils",
+    "FileParsingError": ".file_utils",
+    "analyze_file_quick": ".file_utils",
+}
+
+if TYPE_CHECKING:
+    from .core import LexiGuard, LexiGuardError
+    from .async_core import AsyncLexiGuard
+    from .chat import ChatSession
+    from .file_utils import FileParser, FileParsingError, analyze_file_quick
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __all__ = [
     "LexiGuard",
     "LexiGuardError",
+    "AsyncLexiGuard",
+    "ChatSession",
     "FileParser",
     "FileParsingError",
     "analyze_file_quick"
-]
\ No newline at end of file
+]
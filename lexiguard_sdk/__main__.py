@@ -0,0 +1,10 @@
+# lexiguard_sdk/__main__.py
+"""
+Allow ``python -m lexiguard_sdk batch <dir>``.
+"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,549 @@
+# lexiguard_sdk/async_core.py
+"""
+LexiGuard SDK - asyncio client for legal document analysis
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator, Callable, Sequence, Union
+
+from . import operations
+from .backends import GeminiBackend, GenerationRequest, GenerationResult, ModelBackend
+from .base import ClientBase
+from .cache import ResponseCache
+from .chunking import estimate_tokens
+from .hedging import HedgePolicy, run_hedged_async
+from .core import BATCH_MODES, LexiGuardError, ProgressCallback
+from .hooks import CACHE_COALESCED, CallRecord, Hooks
+from .operations import Operation, InvalidInputError
+from .ratelimit import DEFAULT_RETRY_POLICY, AdaptiveRateLimiter, RetryPolicy, classify_error
+from .routing import RoutingPolicy
+from .singleflight import AsyncSingleFlight
+from .streaming import IncrementalJSONParser
+
+
+class AsyncLexiGuard(ClientBase):
+    """
+    Awaitable counterpart of ``LexiGuard`` for asyncio applications.
+
+    Every method mirrors the synchronous client and returns the same result
+    dictionaries, but model calls go through Gemini's async API so the event
+    loop keeps serving other requests while a generation is in flight.
+
+    Usage:
+        lg = AsyncLexiGuard(api_key="YOUR_API_KEY", max_concurrency=20)
+        result = await lg.analyze_text("Contract text here...")
+    """
+
+    def __init__(self, api_key: Optional[str] = None,
+                 model_name: str = "models/gemini-2.5-flash",
+                 max_concurrency: int = 10,
+                 cache: Optional[ResponseCache] = None,
+                 generation_config: Optional[Dict[str, Any]] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+                 backend: Optional[ModelBackend] = None,
+                 hooks: Optional[Sequence[Hooks]] = None,
+                 coalesce: bool = True,
+                 hedge_policy: Optional[HedgePolicy] = None,
+                 routing: Optional[RoutingPolicy] = None):
+        """
+        Initialize the async LexiGuard client.
+
+        Args:
+            api_key: Your Google Gemini API key (not needed with a custom backend)
+            model_name: Gemini model to use (default: gemini-2.5-flash)
+            max_concurrency: Maximum number of model calls this client keeps
+                in flight at once; further calls wait for a free slot
+            cache: Optional response cache (see ``lexiguard_sdk.cache``)
+            generation_config: Optional Gemini generation parameters
+            rate_limiter: Optional client-side quota limiter (see
+                ``lexiguard_sdk.ratelimit``); may be shared between clients
+            retry_policy: Backoff for throttled/transient errors (None disables retries)
+            backend: Model backend (see ``lexiguard_sdk.backends``); defaults to
+                Gemini, or pass ``FakeBackend()`` to run offline
+            hooks: Instrumentation hooks notified about every call (see
+                ``lexiguard_sdk.hooks``); more can be appended to ``hooks`` later
+            coalesce: Let concurrent identical requests share one in-flight
+                model call (see ``lexiguard_sdk.singleflight``)
+            hedge_policy: Optional request hedging for non-streaming calls (see
+                ``lexiguard_sdk.hedging``); may be shared between clients
+            routing: Optional model routing by task and prompt size, with
+                escalation on invalid JSON (see ``lexiguard_sdk.routing``)
+        """
+        if max_concurrency < 1:
+            raise LexiGuardError("max_concurrency must be at least 1")
+        if backend is None:
+            if not api_key:
+                raise LexiGuardError("API key is required")
+            backend = GeminiBackend(api_key)
+
+        self.backend = backend
+        self.model_name = model_name
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.generation_config = generation_config
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.hooks: List[Hooks] = list(hooks or [])
+        self.inflight: Optional[AsyncSingleFlight] = AsyncSingleFlight() if coalesce else None
+        self.hedge_policy = hedge_policy
+        self.routing = routing
+        # Created on first use: before Python 3.10 a semaphore binds to the
+        # event loop current at creation, which may not be the one that runs it
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        """The semaphore bounding this client's model calls in the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _cache_call(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Call a cache method, in a worker thread if the cache can block on I/O."""
+        if not self.cache.blocking:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    async def _call_model(self, prompt: str, generation_config: Optional[Dict[str, Any]],
+                          task: Optional[str] = None,
+                          record: Optional[CallRecord] = None,
+                          model_name: Optional[str] = None) -> GenerationResult:
+        """
+        Call the backend under the concurrency and rate limits, retrying
+        throttled/transient errors.
+
+        Raises:
+            LexiGuardError: When the call fails and retries are exhausted
+        """
+        request = GenerationRequest(prompt, model_name or self.model_name,
+                                    generation_config, task)
+        tokens = estimate_tokens(prompt)
+        attempt = 0
+        while True:
+            async with self._concurrency_limit():
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(tokens)
+                outcome = None
+                sent = time.perf_counter()
+                try:
+                    if self.hedge_policy is None:
+                        result = await self.backend.generate_async(request)
+                    else:
+                        result = await self._generate_hedged(request, tokens, record)
+                    self._note_usage(record, result)
+                    return result
+                except Exception as e:
+                    kind = classify_error(e)
+                    outcome = kind or "error"
+                    if self.retry_policy is None or not self.retry_policy.should_retry(kind, attempt):
+                        raise LexiGuardError(f"AI generation failed: {str(e)}") from e
+                finally:
+                    if record is not None:
+                        record.attempts += 1
+                        record.model_seconds += time.perf_counter() - sent
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.release(outcome)
+            await asyncio.sleep(self.retry_policy.delay(attempt))
+            attempt += 1
+
+    async def _generate_hedged(self, request: GenerationRequest, tokens: int,
+                               record: Optional[CallRecord]) -> GenerationResult:
+        """Run one backend call under the hedge policy."""
+        hedge_request = self._hedge_request(request)
+
+        async def hedge() -> GenerationResult:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(tokens)
+            outcome = None
+            try:
+                return await self.backend.generate_async(hedge_request)
+            except Exception as e:
+                outcome = classify_error(e) or "error"
+                raise
+            finally:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(outcome)
+
+        result, hedged, won = await run_hedged_async(
+            self.hedge_policy, lambda: self.backend.generate_async(request), hedge
+        )
+        self._note_hedge(record, hedged, won)
+        return result
+
+    async def _stream_model(self, prompt: str, generation_config: Optional[Dict[str, Any]],
+                            task: Optional[str] = None,
+                            record: Optional[CallRecord] = None,
+                            model_name: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Streaming counterpart of ``_call_model``; only failures before the first
+        chunk are retried.
+        """
+        request = GenerationRequest(prompt, model_name or self.model_name,
+                                    generation_config, task)
+        tokens = estimate_tokens(prompt)
+        attempt = 0
+        while True:
+            async with self._concurrency_limit():
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(tokens)
+                outcome = None
+                started = False
+                sent = time.perf_counter()
+                try:
+                    async for text in self.backend.stream_async(request):
+                        started = True
+                        yield text
+                    return
+                except Exception as e:
+                    kind = classify_error(e)
+                    outcome = kind or "error"
+                    if (started or self.retry_policy is None
+                            or not self.retry_policy.should_retry(kind, attempt)):
+                        raise LexiGuardError(f"AI generation failed: {str(e)}") from e
+                finally:
+                    if record is not None:
+                        # Includes time the caller spends between chunks
+                        record.attempts += 1
+                        record.model_seconds += time.perf_counter() - sent
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.release(outcome)
+            await asyncio.sleep(self.retry_policy.delay(attempt))
+            attempt += 1
+
+    async def _generate_response(self, prompt: str,
+                                 generation_config: Optional[Dict[str, Any]] = None,
+                                 task: Optional[str] = None,
+                                 record: Optional[CallRecord] = None,
+                                 model_name: Optional[str] = None) -> str:
+        """
+        Internal method to generate AI response without blocking the event loop.
+
+        Args:
+            prompt: The prompt to send to Gemini
+            generation_config: Generation parameters (defaults to the client's)
+            task: Name of the SDK operation issuing the call
+            record: Call record to fill in for hooks, if any
+            model_name: Model to call (defaults to the client's)
+
+        Returns:
+            Generated text response
+        """
+        if generation_config is None:
+            generation_config = self.generation_config
+
+        key = self._response_key(prompt, generation_config, model_name)
+        if self.cache is not None:
+            cached = await self._cache_call(self.cache.get, key)
+            self._note_cache_lookup(record, cached)
+            if cached is not None:
+                return cached
+
+        async def generate() -> str:
+            text = (await self._call_model(prompt, generation_config, task, record,
+                                            model_name)).text
+            # Cache before the in-flight entry is released so no caller misses both
+            if self.cache is not None:
+                await self._cache_call(self.cache.set, key, text)
+            return text
+
+        if self.inflight is None:
+            return await generate()
+        text, shared = await self.inflight.do(key, generate)
+        if shared and record is not None:
+            record.cache = CACHE_COALESCED
+        return text
+
+    async def _generate_stream(self, prompt: str,
+                               generation_config: Optional[Dict[str, Any]] = None,
+                               task: Optional[str] = None,
+                               record: Optional[CallRecord] = None,
+                               model_name: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Internal method to stream an AI response chunk by chunk.
+
+        Args:
+            prompt: The prompt to send to Gemini
+            generation_config: Generation parameters (defaults to the client's)
+            task: Name of the SDK operation issuing the call
+            record: Call record to fill in for hooks, if any
+            model_name: Model to call (defaults to the client's)
+
+        Yields:
+            Response text chunks as they arrive
+        """
+        if generation_config is None:
+            generation_config = self.generation_config
+
+        key = self._response_key(prompt, generation_config, model_name, coalesce=False)
+        if key is not None:
+            cached = await self._cache_call(self.cache.get, key)
+            self._note_cache_lookup(record, cached)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        async for text in self._stream_model(prompt, generation_config, task, record,
+                                              model_name):
+            parts.append(text)
+            yield text
+
+        if key is not None:
+            await self._cache_call(self.cache.set, key, "".join(parts))
+
+    async def _execute(self, operation: Operation,
+                       started: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send a prepared operation to the model and build its result.
+
+        Args:
+            operation: Operation built by one of the ``operations`` builders
+            started: ``time.perf_counter()`` before the operation was built
+
+        Returns:
+            Result dictionary produced by the operation
+        """
+        if started is None:
+            started = time.perf_counter()
+        record, route = self._begin_execution(operation, started)
+        generation_config = self._generation_config_for(operation)
+        while True:
+            sent = time.perf_counter()
+            try:
+                response = await self._generate_response(
+                    operation.prompt, generation_config, operation.name, record,
+                    route.model_name if route is not None else None
+                )
+            except Exception as e:
+                return self._execution_failed(route, sent, record, started, e)
+            result, route, stale_key = self._execution_result(operation, response, record,
+                                                              route, sent)
+            if stale_key is not None:
+                await self._cache_call(self.cache.delete, stale_key)
+            if route is None:
+                break
+        self._end_record(record, started)
+        return result
+
+    async def _execute_stream(self, operation: Operation,
+                              started: Optional[float] = None
+                              ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a prepared operation, yielding parse events as values complete.
+
+        Args:
+            operation: Operation built by one of the ``operations`` builders
+            started: ``time.perf_counter()`` before the operation was built
+
+        Yields:
+            "field" and "item" events (see ``lexiguard_sdk.streaming``), then a
+            final "result" event holding the usual result dictionary
+        """
+        if started is None:
+            started = time.perf_counter()
+        record, route = self._begin_execution(operation, started, stream=True)
+        parser = IncrementalJSONParser()
+        parts = []
+        sent = time.perf_counter()
+        try:
+            chunks = self._generate_stream(
+                operation.prompt, self._generation_config_for(operation), operation.name,
+                record, route.model_name if route is not None else None
+            )
+            async for chunk in chunks:
+                if record is not None and not parts:
+                    record.first_chunk_seconds = time.perf_counter() - started
+                parts.append(chunk)
+                for event in parser.feed(chunk):
+                    yield event
+        except Exception as e:
+            yield {"type": "result",
+                   "result": self._execution_failed(route, sent, record, started, e)}
+            return
+        # Events already delivered can't be taken back, so streams never escalate
+        result, _, stale_key = self._execution_result(operation, "".join(parts), record,
+                                                      route, sent, escalate=False)
+        if stale_key is not None:
+            await self._cache_call(self.cache.delete, stale_key)
+        self._end_record(record, started)
+        yield {"type": "result", "result": result}
+
+    async def _run_stream(self, builder: Callable[..., Operation], *args,
+                          **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming counterpart of ``_run``."""
+        started = time.perf_counter()
+        try:
+            operation = builder(*args, **kwargs)
+        except InvalidInputError as e:
+            yield {"type": "result", "result": {"success": False, "error": str(e)}}
+            return
+        async for event in self._execute_stream(operation, started):
+            yield event
+
+    async def _run(self, builder: Callable[..., Operation], *args, **kwargs) -> Dict[str, Any]:
+        """Build an operation, reporting rejected input as a failed result."""
+        started = time.perf_counter()
+        try:
+            operation = builder(*args, **kwargs)
+        except InvalidInputError as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        return await self._execute(operation, started)
+
+    async def analyze_text(self, text: str, stream: bool = False
+                           ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """
+        Analyze legal document text for key insights.
+
+        Args:
+            text: Legal document text to analyze
+            stream: If True, return an async iterator of events instead
+                (``async for event in await lg.analyze_text(text, stream=True)``);
+                see ``lexiguard_sdk.streaming``
+
+        Returns:
+            Dictionary with analysis results including summary, risks, and recommendations
+        """
+        if stream:
+            return self._run_stream(operations.analyze_text, text)
+        return await self._run(operations.analyze_text, text)
+
+    async def analyze_clauses(self, text: str,
+                              clause_types: Optional[List[str]] = None,
+                              stream: bool = False
+                              ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """
+        Perform detailed clause-by-clause analysis.
+
+        Args:
+            text: Legal document text
+            clause_types: Optional list of specific clause types to focus on
+            stream: If True, return an async iterator of events that reports
+                each clause as soon as it is generated
+
+        Returns:
+            Dictionary with detailed clause analysis
+        """
+        if stream:
+            return self._run_stream(operations.analyze_clauses, text, clause_types)
+        return await self._run(operations.analyze_clauses, text, clause_types)
+
+    async def analyze_fairness(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze document fairness and provide scoring.
+
+        Args:
+            text: Legal document text
+
+        Returns:
+            Dictionary with fairness scores and analysis
+        """
+        return await self._run(operations.analyze_fairness, text)
+
+    async def analyze_all(self, text: str,
+                          clause_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Produce the summary, clause breakdown and fairness assessment in one model call.
+
+        Args:
+            text: Legal document text
+            clause_types: Optional list of specific clause types to focus on
+
+        Returns:
+            Dictionary with "analysis", "clauses" and "fairness" entries shaped like
+            the results of analyze_text, analyze_clauses and analyze_fairness
+        """
+        return await self._run(operations.analyze_all, text, clause_types)
+
+    async def draft_negotiation_email(self, document_text: str, concerns: List[str],
+                                      recipient_name: str = "Recipient") -> Dict[str, Any]:
+        """
+        Generate a professional negotiation email based on document concerns.
+
+        Args:
+            document_text: The legal document text
+            concerns: List of specific concerns to address
+            recipient_name: Name of the email recipient
+
+        Returns:
+            Dictionary with generated email content
+        """
+        return await self._run(operations.draft_negotiation_email, document_text, concerns,
+                               recipient_name)
+
+    async def draft_document_review_email(self, document_text: str,
+                                          review_notes: str,
+                                          recipient_name: str = "Recipient") -> Dict[str, Any]:
+        """
+        Generate a professional email for document review sharing.
+
+        Args:
+            document_text: The legal document text
+            review_notes: Your review notes or summary
+            recipient_name: Name of the email recipient
+
+        Returns:
+            Dictionary with generated email content
+        """
+        return await self._run(operations.draft_document_review_email, document_text,
+                               review_notes, recipient_name)
+
+    async def chat(self, message: str, document_context: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Interactive chat about a legal document.
+
+        Args:
+            message: User's question or message
+            document_context: Optional document text for context
+
+        Returns:
+            Dictionary with chat response
+        """
+        return await self._run(operations.chat, message, document_context)
+
+    async def analyze_many(self, texts: Sequence[str], mode: str = "text",
+                           progress_callback: Optional[ProgressCallback] = None,
+                           **kwargs) -> List[Dict[str, Any]]:
+        """
+        Analyze many documents concurrently, bounded by the client's max_concurrency.
+
+        Args:
+            texts: Legal document texts to analyze
+            mode: "text", "clauses", "fairness" or "all" (selects the per-document method)
+            progress_callback: Optional callable invoked as ``(completed, total)``
+                after each document finishes
+            **kwargs: Extra arguments for the per-document method
+
+        Returns:
+            One result dictionary per input text, in input order
+        """
+        if mode not in BATCH_MODES:
+            raise LexiGuardError(
+                f"Unsupported batch mode: {mode}. Use one of: {', '.join(BATCH_MODES)}"
+            )
+
+        method = getattr(self, BATCH_MODES[mode])
+        total = len(texts)
+        completed = 0
+
+        async def run_one(text: str) -> Dict[str, Any]:
+            nonlocal completed
+            try:
+                result = await method(text, **kwargs)
+            except Exception as e:
+                result = {
+                    "success": False,
+                    "error": str(e)
+                }
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total)
+            return result
+
+        return list(await asyncio.gather(*(run_one(text) for text in texts)))
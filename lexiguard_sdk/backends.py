@@ -0,0 +1,371 @@
+# lexiguard_sdk/backends.py
+"""
+Model backends for LexiGuard SDK
+
+The clients never talk to Gemini directly; they hand a ``GenerationRequest`` to
+a ``ModelBackend``. ``GeminiBackend`` is the default. ``FakeBackend`` answers
+offline with schema-valid canned JSON and configurable latency, error rates and
+token counts, so everything above the model call can be load-tested and
+benchmarked without network access or quota.
+
+Usage:
+    from lexiguard_sdk import LexiGuard
+    from lexiguard_sdk.backends import FakeBackend, lognormal_latency
+
+    fake = FakeBackend(latency=lognormal_latency(median=0.8, sigma=0.5),
+                       error_rate=0.01, seed=42)
+    lg = LexiGuard(backend=fake)
+"""
+
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+import json
+import math
+import random
+import threading
+import time
+
+from .chunking import estimate_tokens
+
+LatencyModel = Callable[[random.Random], float]
+
+
+@dataclass(frozen=True)
+class GenerationRequest:
+    """
+    One model call.
+
+    Attributes:
+        prompt: Prompt text
+        model_name: Model to run the prompt on
+        generation_config: Generation parameters, if any
+        task: SDK operation name (e.g. "analyze_clauses"), if known
+        cached_content: Provider-side context cache handle, if any
+    """
+    prompt: str
+    model_name: str
+    generation_config: Optional[Dict[str, Any]] = None
+    task: Optional[str] = None
+    cached_content: Any = None
+
+
+@dataclass
+class GenerationResult:
+    """
+    Text and usage reported by a backend for one model call.
+    """
+    text: str
+    model_name: str
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+
+class ModelBackend:
+    """
+    Interface implemented by model backends.
+
+    ``generate`` is required. The async and streaming methods default to
+    wrappers around it, so a minimal backend only implements one method.
+    Errors should be raised as exceptions with an integer ``code`` attribute
+    (HTTP status) where possible so retries can classify them.
+    """
+
+    def generate(self, request: GenerationRequest) -> GenerationResult:
+        raise NotImplementedError
+
+    async def generate_async(self, request: GenerationRequest) -> GenerationResult:
+        # asyncio is imported here, not at module level, to keep sync-only
+        # startup fast; inside a coroutine it is always loaded already
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.generate, request)
+
+    def stream(self, request: GenerationRequest) -> Iterator[str]:
+        yield self.generate(request).text
+
+    async def stream_async(self, request: GenerationRequest) -> AsyncIterator[str]:
+        yield (await self.generate_async(request)).text
+
+    def create_context_cache(self, model_name: str, document: str,
+                             system_instruction: str, ttl: int) -> Any:
+        """
+        Upload ``document`` as provider-side cached context.
+
+        Returns:
+            Handle to pass as ``GenerationRequest.cached_content``
+
+        Raises:
+            NotImplementedError: If the backend has no context caching
+        """
+        raise NotImplementedError
+
+    def delete_context_cache(self, handle: Any) -> None:
+        """Release a handle returned by ``create_context_cache``."""
+        pass
+
+
+class GeminiBackend(ModelBackend):
+    """
+    Backend calling Google Gemini through ``google.generativeai``.
+
+    The Gemini client library (and its grpc/protobuf stack) is imported when
+    the first backend is created, not when the SDK is imported.
+    """
+
+    def __init__(self, api_key: str):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self._genai = genai
+        self._models: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_model(self, model_name: str, cached_content: Any = None) -> Any:
+        """Return the (memoized) ``GenerativeModel`` for ``model_name``."""
+        if cached_content is not None:
+            return self._genai.GenerativeModel.from_cached_content(cached_content)
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                model = self._genai.GenerativeModel(model_name)
+                self._models[model_name] = model
+            return model
+
+    @staticmethod
+    def _result(response: Any, model_name: str) -> GenerationResult:
+        usage = getattr(response, "usage_metadata", None)
+        return GenerationResult(
+            text=response.text,
+            model_name=model_name,
+            prompt_tokens=getattr(usage, "prompt_token_count", None),
+            output_tokens=getattr(usage, "candidates_token_count", None),
+        )
+
+    def generate(self, request: GenerationRequest) -> GenerationResult:
+        model = self.get_model(request.model_name, request.cached_content)
+        response = model.generate_content(
+            request.prompt, generation_config=request.generation_config
+        )
+        return self._result(response, request.model_name)
+
+    async def generate_async(self, request: GenerationRequest) -> GenerationResult:
+        model = self.get_model(request.model_name, request.cached_content)
+        response = await model.generate_content_async(
+            request.prompt, generation_config=request.generation_config
+        )
+        return self._result(response, request.model_name)
+
+    def stream(self, request: GenerationRequest) -> Iterator[str]:
+        model = self.get_model(request.model_name, request.cached_content)
+        response = model.generate_content(
+            request.prompt, generation_config=request.generation_config, stream=True
+        )
+        for chunk in response:
+            yield chunk.text
+
+    async def stream_async(self, request: GenerationRequest) -> AsyncIterator[str]:
+        model = self.get_model(request.model_name, request.cached_content)
+        response = await model.generate_content_async(
+            request.prompt, generation_config=request.generation_config, stream=True
+        )
+        async for chunk in response:
+            yield chunk.text
+
+    def create_context_cache(self, model_name: str, document: str,
+                             system_instruction: str, ttl: int) -> Any:
+        from datetime import timedelta
+        from google.generativeai import caching
+
+        return caching.CachedContent.create(
+            model=model_name,
+            system_instruction=system_instruction,
+            contents=[document],
+            ttl=timedelta(seconds=ttl),
+        )
+
+    def delete_context_cache(self, handle: Any) -> None:
+        handle.delete()
+
+
+def fixed_latency(seconds: float) -> LatencyModel:
+    """Latency model that always takes ``seconds``."""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyModel:
+    """Latency drawn uniformly from [low, high] seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyModel:
+    """Right-skewed latency with the given median, like real model calls."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+class FakeBackendError(Exception):
+    """Error injected by ``FakeBackend``; ``code`` is an HTTP status."""
+
+    def __init__(self, message: str, code: int):
+        super().__init__(message)
+        self.code = code
+
+
+class FakeBackend(ModelBackend):
+    """
+    Deterministic offline backend returning schema-valid canned responses.
+
+    Given the same seed and the same sequence of calls, latencies and injected
+    errors repeat exactly. Response content depends only on the request.
+    """
+
+    def __init__(self, latency: Optional[LatencyModel] = None,
+                 seconds_per_output_token: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0,
+                 chars_per_clause: int = 2000, max_clauses: int = 40,
+                 stream_chunk_chars: int = 64, seed: int = 0):
+        """
+        Args:
+            latency: Latency model for each call (default: no delay)
+            seconds_per_output_token: Extra delay proportional to response size
+            error_rate: Probability of a transient 500 error per call
+            throttle_rate: Probability of a 429 quota error per call
+            chars_per_clause: Prompt characters per generated clause (controls
+                response size for clause analyses)
+            max_clauses: Upper bound on clauses per response
+            stream_chunk_chars: Size of chunks yielded when streaming
+            seed: Random seed for latencies and injected errors
+        """
+        self.latency = latency or fixed_latency(0.0)
+        self.seconds_per_output_token = seconds_per_output_token
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.chars_per_clause = chars_per_clause
+        self.max_clauses = max_clauses
+        self.stream_chunk_chars = stream_chunk_chars
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _plan(self, request: GenerationRequest) -> tuple:
+        """Draw this call's latency and injected failure."""
+        with self._lock:
+            self.calls += 1
+            delay = max(0.0, self.latency(self._rng))
+            roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return delay, FakeBackendError("429 Resource has been exhausted (fake)", 429)
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, FakeBackendError("500 Internal error (fake)", 500)
+        return delay, None
+
+    def _clauses(self, prompt: str) -> list:
+        count = max(1, min(self.max_clauses, len(prompt) // self.chars_per_clause))
+        levels = ("low", "medium", "high")
+        return [{
+            "clause_number": i,
+            "clause_title": f"Clause {i}",
+            "clause_text": f"Excerpt of clause {i}.",
+            "analysis": f"Clause {i} sets out obligations of the parties.",
+            "risk_level": levels[i % 3],
+            "fairness_score": 4 + i % 6,
+            "concerns": [f"Concern about clause {i}"] if i % 3 == 2 else [],
+        } for i in range(1, count + 1)]
+
+    def render(self, request: GenerationRequest) -> str:
+        """Build the canned response text for ``request``."""
+        analysis = {
+            "summary": "Synthetic summary of the agreement.",
+            "document_type": "Service Agreement",
+            "key_clauses": ["Payment terms", "Termination", "Liability"],
+            "potential_risks": ["Broad indemnity", "Automatic renewal"],
+            "recommendations": ["Cap liability", "Add a termination notice period"],
+            "parties_involved": ["Provider", "Customer"],
+        }
+        fairness = {
+            "overall_fairness_score": 6,
+            "balance_analysis": "Obligations lean towards the provider.",
+            "one_sided_clauses": ["Unilateral price changes"],
+            "red_flags": ["Uncapped indemnity"],
+            "power_dynamics": "The provider drafted the agreement.",
+            "recommendations": ["Make price changes mutual"],
+        }
+        task = request.task
+        if task == "analyze_text":
+            payload: Any = analysis
+        elif task == "analyze_clauses":
+            payload = {"clauses": self._clauses(request.prompt)}
+        elif task == "analyze_fairness":
+            payload = fairness
+        elif task == "analyze_all":
+            payload = {"analysis": analysis, "clauses": self._clauses(request.prompt),
+                       "fairness": fairness}
+        elif task == "draft_negotiation_email":
+            payload = {"subject": "Proposed changes to the agreement",
+                       "body": "Dear Recipient,\n\nWe would like to discuss a few terms.",
+                       "tone": "professional"}
+        elif task == "draft_document_review_email":
+            payload = {"subject": "Document review",
+                       "body": "Dear Recipient,\n\nPlease find the review summary below."}
+        else:
+            return "This is a synthetic answer about the document."
+        return json.dumps(payload, indent=2)
+
+    def _respond(self, request: GenerationRequest) -> tuple:
+        delay, error = self._plan(request)
+        text = self.render(request)
+        output_tokens = estimate_tokens(text)
+        delay += output_tokens * self.seconds_per_output_token
+        result = GenerationResult(
+            text=text,
+            model_name=request.model_name,
+            prompt_tokens=estimate_tokens(request.prompt),
+            output_tokens=output_tokens,
+        )
+        return delay, error, result
+
+    def _chunks(self, text: str) -> list:
+        size = max(1, self.stream_chunk_chars)
+        return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+    def generate(self, request: GenerationRequest) -> GenerationResult:
+        delay, error, result = self._respond(request)
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+
+    async def generate_async(self, request: GenerationRequest) -> GenerationResult:
+        import asyncio
+
+        delay, error, result = self._respond(request)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+
+    def stream(self, request: GenerationRequest) -> Iterator[str]:
+        delay, error, result = self._respond(request)
+        chunks = self._chunks(result.text)
+        if error is not None:
+            time.sleep(delay / len(chunks))
+            raise error
+        for chunk in chunks:
+            time.sleep(delay / len(chunks))
+            yield chunk
+
+    async def stream_async(self, request: GenerationRequest) -> AsyncIterator[str]:
+        import asyncio
+
+        delay, error, result = self._respond(request)
+        chunks = self._chunks(result.text)
+        if error is not None:
+            await asyncio.sleep(delay / len(chunks))
+            raise error
+        for chunk in chunks:
+            await asyncio.sleep(delay / len(chunks))
+            yield chunk
+
+    def create_context_cache(self, model_name: str, document: str,
+                             system_instruction: str, ttl: int) -> Any:
+        return {"model": model_name, "tokens": estimate_tokens(document)}
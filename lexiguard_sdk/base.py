@@ -0,0 +1,208 @@
+# lexiguard_sdk/base.py
+"""
+Shared client logic for LexiGuard SDK
+
+``LexiGuard`` and ``AsyncLexiGuard`` only differ in how they wait for the
+model. Everything around the model call (cache keys, generation configs, call
+records for hooks, route selection and escalation, and turning a response
+into a result) is defined once in ``ClientBase``, and each client keeps just
+the code that blocks or awaits.
+"""
+
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+import time
+
+from .backends import GeminiBackend, GenerationRequest, GenerationResult
+from .cache import make_cache_key
+from .chunking import estimate_tokens
+from .hooks import CACHE_HIT, CACHE_MISS, PARSE_FAILED, PARSE_OK, CallRecord, dispatch
+from .operations import Operation
+from .routing import ESCALATION_ROUTE, Route
+
+
+class ClientBase:
+    """
+    Transport-independent helpers of the sync and async clients.
+
+    Subclasses set the attributes assigned in their ``__init__`` (backend,
+    model_name, cache, generation_config, hooks, inflight, hedge_policy,
+    routing, ...) and implement the model calls.
+    """
+
+    @property
+    def model(self) -> Any:
+        """The underlying ``GenerativeModel`` when using the Gemini backend."""
+        if isinstance(self.backend, GeminiBackend):
+            return self.backend.get_model(self.model_name)
+        return None
+
+    def _cache_key(self, prompt: str,
+                   generation_config: Optional[Dict[str, Any]] = None,
+                   model_name: Optional[str] = None) -> str:
+        return make_cache_key(model_name or self.model_name, prompt, generation_config)
+
+    def _generation_config_for(self, operation: Operation) -> Optional[Dict[str, Any]]:
+        """Merge the client's generation config with the operation's own."""
+        if not operation.generation_config:
+            return self.generation_config
+        return {**(self.generation_config or {}), **operation.generation_config}
+
+    def _response_key(self, prompt: str, generation_config: Optional[Dict[str, Any]],
+                      model_name: Optional[str], coalesce: bool = True) -> Optional[str]:
+        """Cache (and single-flight) key of a response, None when neither is used."""
+        if self.cache is None and (not coalesce or self.inflight is None):
+            return None
+        return self._cache_key(prompt, generation_config, model_name)
+
+    @staticmethod
+    def _note_cache_lookup(record: Optional[CallRecord], cached: Optional[str]) -> None:
+        if record is not None:
+            record.cache = CACHE_HIT if cached is not None else CACHE_MISS
+
+    @staticmethod
+    def _note_usage(record: Optional[CallRecord], result: GenerationResult) -> None:
+        """Copy the model and token counts a backend reported into ``record``."""
+        if record is not None:
+            record.model_name = result.model_name
+            record.prompt_tokens = result.prompt_tokens
+            record.output_tokens = result.output_tokens
+
+    def _hedge_request(self, request: GenerationRequest) -> GenerationRequest:
+        """The request a hedge sends: the same one, or one for the fallback model."""
+        # A provider context cache belongs to one model, so only hedge on that model
+        if self.hedge_policy.fallback_model and request.cached_content is None:
+            return replace(request, model_name=self.hedge_policy.fallback_model)
+        return request
+
+    @staticmethod
+    def _note_hedge(record: Optional[CallRecord], hedged: bool, won: bool) -> None:
+        if record is not None and hedged:
+            record.hedged = True
+            record.hedge_won = won
+
+    def _start_record(self, operation: Operation, started: float,
+                      stream: bool = False) -> Optional[CallRecord]:
+        """Open a call record and announce it to the hooks (None without hooks)."""
+        if not self.hooks:
+            return None
+        record = CallRecord(
+            method=operation.name,
+            model_name=self.model_name,
+            stream=stream,
+            prompt_chars=len(operation.prompt),
+            prompt_tokens_estimate=estimate_tokens(operation.prompt),
+            build_seconds=time.perf_counter() - started,
+        )
+        dispatch(self.hooks, "before_request", record)
+        return record
+
+    def _end_record(self, record: Optional[CallRecord], started: float,
+                    error: Optional[BaseException] = None) -> None:
+        """Close a call record and report it to the hooks."""
+        if record is None:
+            return
+        record.latency = time.perf_counter() - started
+        if error is None:
+            dispatch(self.hooks, "after_response", record)
+        else:
+            record.success = False
+            record.error = str(error)
+            dispatch(self.hooks, "on_error", record, error)
+
+    def _finish(self, operation: Operation, response: str,
+                record: Optional[CallRecord] = None,
+                model_name: Optional[str] = None) -> Dict[str, Any]:
+        """Build an operation's result from the complete response text."""
+        parse_started = time.perf_counter()
+        result = operation.finish(response)
+        if record is not None:
+            record.parse_seconds = time.perf_counter() - parse_started
+            record.response_chars = len(response)
+            record.success = bool(result.get("success"))
+            record.parse = PARSE_OK if record.success else PARSE_FAILED
+            record.error = result.get("error")
+        return result
+
+    def _select_route(self, operation: Operation,
+                      record: Optional[CallRecord] = None) -> Optional[Route]:
+        """Pick the routing rule for an operation (None without a routing policy)."""
+        if self.routing is None:
+            return None
+        route = self.routing.select(operation.name, estimate_tokens(operation.prompt))
+        if record is not None:
+            record.route = route.name
+            record.model_name = route.model_name or self.model_name
+        return route
+
+    def _observe_route(self, route: Optional[Route], sent: float,
+                       result: Optional[Dict[str, Any]], record: Optional[CallRecord] = None,
+                       escalate: bool = True) -> Optional[Route]:
+        """
+        Record a routed call's latency and decide whether to escalate it.
+
+        Args:
+            route: Route that served the call (None without a routing policy)
+            sent: ``time.perf_counter()`` when the request was sent
+            result: The call's result, or None when the model call failed
+            record: Call record to fill in for hooks, if any
+            escalate: Whether a failed validation may be retried
+
+        Returns:
+            The escalation route when the result failed validation and should
+            be retried on a larger model, else None
+        """
+        if route is None:
+            return None
+        success = bool(result and result.get("success"))
+        target = None
+        if escalate and result is not None and not success:
+            target = self.routing.escalation_target(route.model_name or self.model_name,
+                                                    self.model_name)
+        self.routing.observe(route.name, time.perf_counter() - sent, success,
+                             escalated=target is not None)
+        if target is None:
+            return None
+        if record is not None:
+            record.escalated = True
+            record.route = ESCALATION_ROUTE
+            record.model_name = target
+        return Route(ESCALATION_ROUTE, target)
+
+    def _begin_execution(self, operation: Operation, started: float,
+                         stream: bool = False) -> Tuple[Optional[CallRecord], Optional[Route]]:
+        """Open the call record of an operation and pick its route."""
+        record = self._start_record(operation, started, stream)
+        return record, self._select_route(operation, record)
+
+    def _execution_failed(self, route: Optional[Route], sent: float,
+                          record: Optional[CallRecord], started: float,
+                          error: BaseException) -> Dict[str, Any]:
+        """Report a failed model call and return the operation's failed result."""
+        self._observe_route(route, sent, None)
+        self._end_record(record, started, error)
+        return {
+            "success": False,
+            "error": str(error)
+        }
+
+    def _execution_result(self, operation: Operation, response: str,
+                          record: Optional[CallRecord], route: Optional[Route],
+                          sent: float, escalate: bool = True
+                          ) -> Tuple[Dict[str, Any], Optional[Route], Optional[str]]:
+        """
+        Build the result of a completed model call.
+
+        Returns:
+            The result; when it failed validation and may be retried on a
+            larger model, the escalation route to retry on (else None); and
+            when the response could not be parsed, its cache key, which the
+            caller deletes so the response isn't served again (else None)
+        """
+        model_name = route.model_name if route is not None else None
+        result = self._finish(operation, response, record, model_name)
+        stale_key = None
+        if not result.get("success") and self.cache is not None:
+            stale_key = self._cache_key(operation.prompt,
+                                        self._generation_config_for(operation), model_name)
+        return result, self._observe_route(route, sent, result, record, escalate), stale_key
@@ -0,0 +1,322 @@
+# lexiguard_sdk/cache.py
+"""
+Response caching for LexiGuard SDK
+
+Model responses are cached by (model name, prompt hash, generation config).
+An in-memory LRU tier serves repeated prompts within a process; an optional
+SQLite tier keeps responses across restarts. The same tiers back the
+extraction cache of ``FileParser`` (see ``file_utils.make_extraction_cache``).
+
+Usage:
+    from lexiguard_sdk import LexiGuard
+    from lexiguard_sdk.cache import MemoryCache, SQLiteCache, TieredCache
+
+    cache = TieredCache(MemoryCache(max_entries=512, ttl=3600),
+                        SQLiteCache("~/.cache/lexiguard/responses.db"))
+    lg = LexiGuard(api_key="YOUR_API_KEY", cache=cache)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+
+def make_cache_key(model_name: str, prompt: str,
+                   generation_config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a stable cache key for a model call.
+
+    Args:
+        model_name: Model the prompt is sent to
+        prompt: Prompt text
+        generation_config: Generation parameters that affect the output
+
+    Returns:
+        Hex SHA-256 digest identifying the call
+    """
+    payload = json.dumps({
+        "model": model_name,
+        "prompt": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        "config": generation_config or {},
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache tier"""
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["hit_rate"] = self.hit_rate
+        return data
+
+
+class ResponseCache:
+    """
+    Interface for response caches.
+
+    Implementations must be safe to call from multiple threads.
+    """
+
+    # Whether calls can block on I/O; AsyncLexiGuard runs such caches in a thread
+    blocking = True
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    Thread-safe in-memory LRU cache with optional time-to-live.
+    """
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            max_entries: Maximum number of entries before least recently
+                used ones are evicted
+            ttl: Seconds an entry stays valid (None keeps entries until evicted)
+        """
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._entries[key]
+                self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            self.stats.sets += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-disk cache backed by a SQLite database, surviving process restarts.
+
+    Values must be strings (model responses and extracted text are).
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            path: Database file; parent directories are created if missing
+            ttl: Seconds an entry stays valid (None keeps entries until evicted)
+            max_entries: Optional cap; least recently used entries are evicted
+            max_bytes: Optional cap on the total UTF-8 size of the stored
+                values; least recently used entries are evicted
+        """
+        super().__init__()
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                "size INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "size" not in columns:
+                # Databases created before max_bytes existed
+                self._conn.execute(
+                    "ALTER TABLE responses ADD COLUMN size INTEGER NOT NULL DEFAULT 0"
+                )
+                self._conn.execute("UPDATE responses SET size = length(CAST(value AS BLOB))")
+            # Covering index, so size totals never read the (large) values
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_size ON responses (accessed_at, size)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                value, created_at = row
+                if self.ttl is None or created_at + self.ttl > now:
+                    self._conn.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                    self.stats.hits += 1
+                    return value
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?)", (key, value, now, now, size)
+            )
+            self.stats.sets += 1
+            if self.max_entries is not None:
+                evicted = self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+                self.stats.evictions += max(evicted, 0)
+            if self.max_bytes is not None:
+                self._evict_bytes()
+
+    def _evict_bytes(self) -> None:
+        """Delete least recently used entries until the size cap is met."""
+        excess = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at, size"
+        ):
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache(ResponseCache):
+    """
+    Two-tier cache: a fast memory tier in front of a persistent tier.
+
+    Disk hits are promoted into the memory tier. ``stats`` counts lookups
+    against the cache as a whole; each tier keeps its own counters.
+    """
+
+    def __init__(self, memory: Optional[MemoryCache] = None,
+                 disk: Optional[ResponseCache] = None):
+        super().__init__()
+        self.memory = memory if memory is not None else MemoryCache()
+        self.disk = disk
+        self._lock = threading.Lock()
+
+    @property
+    def blocking(self) -> bool:
+        return self.disk is not None and self.disk.blocking
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+        with self._lock:
+            self.stats.sets += 1
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
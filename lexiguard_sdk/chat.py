@@ -0,0 +1,262 @@
+# lexiguard_sdk/chat.py
+"""
+Stateful document chat for LexiGuard SDK
+
+A ``ChatSession`` holds one document for a whole conversation. When the
+document is large enough, it is uploaded once as provider-side cached content and
+each turn only sends the question and recent history. Otherwise (or when
+context caching is unavailable) each turn sends just the excerpts most
+relevant to the question instead of the full document.
+
+Usage:
+    lg = LexiGuard(api_key="YOUR_API_KEY")
+    with lg.start_chat(document_text) as session:
+        session.ask("When can the landlord keep the deposit?")
+        session.ask("And how much notice do they have to give?")
+"""
+
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import math
+import re
+import time
+
+from . import operations
+from .chunking import estimate_tokens, split_into_chunks
+from .core import LexiGuardError
+from .operations import InvalidInputError
+
+if TYPE_CHECKING:
+    from .core import LexiGuard
+
+# Gemini rejects explicit context caches below a minimum input size
+MIN_CONTEXT_CACHE_TOKENS = 4096
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from has have how i if in is it its "
+    "me my of on or shall that the their there this to under was what when where "
+    "which who will with would you your".split()
+)
+
+
+def _terms(text: str) -> List[str]:
+    return [w for w in _WORD_PATTERN.findall(text.lower()) if w not in _STOPWORDS]
+
+
+def _context_cache_gone(error: BaseException) -> bool:
+    """
+    Whether a failed cached-context call means the provider cache expired or
+    was deleted (as opposed to throttling, outages or bad requests).
+    """
+    cause = error.__cause__ or error
+    if getattr(cause, "code", None) == 404:
+        return True
+    message = str(cause).lower()
+    # Gemini answers an expired cache with 403 "CachedContent not found (or permission denied)"
+    return "cache" in message and ("not found" in message or "expired" in message)
+
+
+class ExcerptIndex:
+    """
+    Small BM25 index over document chunks used to pick excerpts for a question.
+    """
+
+    def __init__(self, chunks: List[str], k1: float = 1.5, b: float = 0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self._term_counts = [Counter(_terms(chunk)) for chunk in chunks]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._avg_length = (sum(self._lengths) / len(chunks)) if chunks else 0.0
+        document_freq = Counter(term for counts in self._term_counts for term in counts)
+        total = len(chunks)
+        self._idf = {
+            term: math.log(1 + (total - freq + 0.5) / (freq + 0.5))
+            for term, freq in document_freq.items()
+        }
+
+    def search(self, query: str, max_tokens: int) -> List[str]:
+        """
+        Return the chunks most relevant to ``query`` within a token budget.
+
+        Args:
+            query: Question text
+            max_tokens: Token budget for all returned excerpts
+
+        Returns:
+            Selected chunks in document order (the opening chunk if nothing matches)
+        """
+        if not self.chunks:
+            return []
+        terms = set(_terms(query))
+        scores = []
+        for index, counts in enumerate(self._term_counts):
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[index] / (self._avg_length or 1))
+            score = sum(
+                self._idf[t] * counts[t] * (self.k1 + 1) / (counts[t] + norm)
+                for t in terms if t in counts
+            )
+            if score > 0:
+                scores.append((score, index))
+
+        if not scores:
+            return [self.chunks[0]]
+
+        selected = []
+        used = 0
+        for _, index in sorted(scores, reverse=True):
+            cost = estimate_tokens(self.chunks[index])
+            if selected and used + cost > max_tokens:
+                continue
+            selected.append(index)
+            used += cost
+        return [self.chunks[i] for i in sorted(selected)]
+
+
+class ChatSession:
+    """
+    Multi-turn chat about a single document with bounded history.
+    """
+
+    def __init__(self, client: "LexiGuard", document: str, max_turns: int = 10,
+                 use_context_cache: bool = True, cache_ttl: int = 3600,
+                 excerpt_tokens: int = 2000, chunk_tokens: int = 300):
+        """
+        Args:
+            client: LexiGuard client used for model calls
+            document: Full document text
+            max_turns: Number of previous question/answer pairs sent with each turn
+            use_context_cache: Try Gemini context caching for large documents
+            cache_ttl: Lifetime of the provider-side cache in seconds
+            excerpt_tokens: Token budget for excerpts when not using the cache
+            chunk_tokens: Size of the excerpts the document is split into
+        """
+        if not document or not document.strip():
+            raise LexiGuardError("Document text is required")
+        if max_turns < 0:
+            raise LexiGuardError("max_turns cannot be negative")
+
+        self.client = client
+        self.document = document
+        self.history: deque = deque(maxlen=max_turns)
+        self.excerpt_tokens = excerpt_tokens
+        self.chunk_tokens = chunk_tokens
+        self._cached_content = None
+        self._index: Optional[ExcerptIndex] = None
+
+        if use_context_cache and estimate_tokens(document) >= MIN_CONTEXT_CACHE_TOKENS:
+            self._create_context_cache(cache_ttl)
+        if self._cached_content is None:
+            self._use_excerpts()
+
+    @property
+    def context_mode(self) -> str:
+        """"cached" when the document lives in a provider cache, else "excerpts"."""
+        return "cached" if self._cached_content is not None else "excerpts"
+
+    def _create_context_cache(self, ttl: int) -> None:
+        try:
+            self._cached_content = self.client.backend.create_context_cache(
+                self.client.model_name,
+                self.document,
+                "You are a legal assistant. Answer questions about the attached "
+                "legal document.",
+                ttl,
+            )
+        except Exception:
+            # Backend, model or account without context caching: fall back to excerpts
+            self._cached_content = None
+
+    def _release_context_cache(self) -> None:
+        if self._cached_content is not None:
+            try:
+                self.client.backend.delete_context_cache(self._cached_content)
+            except Exception:
+                pass
+            self._cached_content = None
+
+    def _use_excerpts(self) -> None:
+        self._release_context_cache()
+        if self._index is None:
+            self._index = ExcerptIndex(split_into_chunks(self.document, self.chunk_tokens))
+
+    def ask(self, message: str) -> Dict[str, Any]:
+        """
+        Ask a question about the document.
+
+        Args:
+            message: User's question
+
+        Returns:
+            Dictionary shaped like ``LexiGuard.chat`` results, plus "context_mode".
+            A turn on the cached document that fails for any reason other than
+            the cache having expired is reported as failed, and the session
+            keeps its cache for the next turn.
+        """
+        if not message:
+            return {
+                "success": False,
+                "error": "Message cannot be empty"
+            }
+
+        result = None
+        if self._cached_content is not None:
+            started = time.perf_counter()
+            operation = operations.chat_turn(message, list(self.history))
+            record = self.client._start_record(operation, started)
+            try:
+                # Bypasses the response cache: the prompt alone doesn't identify the document
+                response = self.client._call_model(
+                    operation.prompt, self.client.generation_config,
+                    operation.name, self._cached_content, record
+                )
+            except Exception as e:
+                self.client._end_record(record, started, e)
+                if not _context_cache_gone(e):
+                    # Retries are exhausted, but the cache is still valid for the next turn
+                    result = {
+                        "success": False,
+                        "error": str(e)
+                    }
+                else:
+                    # Expired or deleted cache: continue the session on excerpts
+                    self._use_excerpts()
+            else:
+                result = self.client._finish(operation, response.text, record)
+                self.client._end_record(record, started)
+
+        if result is None:
+            query = message
+            if self.history:
+                query = f"{self.history[-1][0]} {message}"
+            try:
+                operation = operations.chat_turn(
+                    message, list(self.history),
+                    self._index.search(query, self.excerpt_tokens)
+                )
+            except InvalidInputError as e:
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
+            result = self.client._execute(operation)
+
+        if result.get("success"):
+            self.history.append((message, result["data"]["response"]))
+        result["context_mode"] = self.context_mode
+        return result
+
+    def reset(self) -> None:
+        """Forget the conversation history, keeping the document."""
+        self.history.clear()
+
+    def close(self) -> None:
+        """Delete the provider-side cache, if one was created."""
+        self._use_excerpts()
+
+    def __enter__(self) -> "ChatSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
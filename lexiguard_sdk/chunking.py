@@ -0,0 +1,213 @@
+# lexiguard_sdk/chunking.py
+"""
+Token-budgeted chunking and result merging for long legal documents.
+
+``split_into_chunks`` cuts a document on clause and heading boundaries into
+pieces that fit a token budget. ``merge_results`` combines the per-chunk
+results of analyze_text / analyze_clauses / analyze_fairness into one result
+of the same shape.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Sequence
+import json
+import re
+
+# Rough average for English legal prose with Gemini's tokenizer
+CHARS_PER_TOKEN = 4
+
+DEFAULT_CHUNK_TOKENS = 8000
+
+# Lines that start a new clause or section
+_BOUNDARY_PATTERN = re.compile(
+    r"""^[ \t]*(?:
+        (?:ARTICLE|Article|SECTION|Section|CLAUSE|Clause|SCHEDULE|Schedule|
+           EXHIBIT|Exhibit|ANNEX|Annex|APPENDIX|Appendix|PART|Part)\s+[\dIVXLCivxlc]+\b
+      | \d{1,3}(?:\.\d{1,3})*[.)]?\s+[A-Z(]
+      | [A-Z][A-Z0-9 ,;:&'()\-]{3,}$
+    )""",
+    re.MULTILINE | re.VERBOSE,
+)
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_PATTERN = re.compile(r"(?<=[.;:!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in ``text`` without calling the API.
+
+    Args:
+        text: Any text
+
+    Returns:
+        Approximate token count
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _split_at(text: str, pattern: "re.Pattern") -> List[str]:
+    starts = [m.start() for m in pattern.finditer(text) if m.start() > 0]
+    bounds = [0] + starts + [len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:]) if text[a:b].strip()]
+
+
+def _split_by_separator(text: str, pattern: "re.Pattern") -> List[str]:
+    pieces = []
+    last = 0
+    for match in pattern.finditer(text):
+        pieces.append(text[last:match.end()])
+        last = match.end()
+    pieces.append(text[last:])
+    return [p for p in pieces if p.strip()]
+
+
+def _fit_block(block: str, max_chars: int) -> List[str]:
+    """Break a block larger than the budget into paragraphs, sentences, then slices."""
+    if len(block) <= max_chars:
+        return [block]
+    for pattern in (_PARAGRAPH_PATTERN, _SENTENCE_PATTERN):
+        pieces = _split_by_separator(block, pattern)
+        if len(pieces) > 1:
+            return [part for piece in pieces for part in _fit_block(piece, max_chars)]
+    return [block[i:i + max_chars] for i in range(0, len(block), max_chars)]
+
+
+def split_into_chunks(text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> List[str]:
+    """
+    Split a document into chunks of at most ``max_tokens`` estimated tokens.
+
+    Chunks end on clause/heading boundaries where possible, so a clause is only
+    cut when it alone exceeds the budget.
+
+    Args:
+        text: Full document text
+        max_tokens: Token budget per chunk
+
+    Returns:
+        Chunks in document order (an empty list for blank text)
+    """
+    if max_tokens < 1:
+        raise ValueError("max_tokens must be at least 1")
+    if not text or not text.strip():
+        return []
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    blocks = [part for block in _split_at(text, _BOUNDARY_PATTERN)
+              for part in _fit_block(block, max_chars)]
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for block in blocks:
+        if current and current_len + len(block) > max_chars:
+            chunks.append("".join(current).strip())
+            current, current_len = [], 0
+        current.append(block)
+        current_len += len(block)
+    if current:
+        chunks.append("".join(current).strip())
+    return chunks
+
+
+def _dedupe(items: Sequence[Any]) -> List[Any]:
+    seen = set()
+    unique = []
+    for item in items:
+        if isinstance(item, str):
+            key = " ".join(item.lower().split())
+        else:
+            key = json.dumps(item, sort_keys=True, default=str).lower()
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _join_text(values: Sequence[Any]) -> str:
+    return "\n\n".join(str(v).strip() for v in values if v and str(v).strip())
+
+
+def _clause_key(clause: Any) -> str:
+    if not isinstance(clause, dict):
+        return json.dumps(clause, sort_keys=True, default=str).lower()
+    title = " ".join(str(clause.get("clause_title", "")).lower().split())
+    body = " ".join(str(clause.get("clause_text", "")).lower().split())
+    return f"{title}|{body}"
+
+
+def merge_clause_lists(clause_lists: Sequence[Sequence[Any]]) -> List[Any]:
+    """
+    Concatenate per-chunk clause lists, drop duplicates and renumber clauses.
+
+    Clauses repeated at chunk edges (same title and text) are kept once;
+    ``clause_number`` is reassigned sequentially from 1.
+    """
+    merged = []
+    seen = set()
+    for clauses in clause_lists:
+        for clause in clauses:
+            key = _clause_key(clause)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(dict(clause) if isinstance(clause, dict) else clause)
+    for number, clause in enumerate(merged, start=1):
+        if isinstance(clause, dict):
+            clause["clause_number"] = number
+    return merged
+
+
+def merge_results(mode: str, datas: Sequence[Dict[str, Any]],
+                  weights: Sequence[int] = ()) -> Dict[str, Any]:
+    """
+    Reduce per-chunk analysis data into a single analysis.
+
+    Args:
+        mode: "text", "clauses" or "fairness"
+        datas: The ``data`` dictionaries of each chunk's result, in order;
+            entries that are not dictionaries (a JSON list or string the
+            model returned instead of an object) are skipped
+        weights: Optional per-chunk weights (e.g. chunk length) for scores
+
+    Returns:
+        Merged ``data`` dictionary shaped like a single-call result
+    """
+    weights = list(weights) or [1] * len(datas)
+    kept = [(d, w) for d, w in zip(datas, weights) if isinstance(d, dict)]
+    datas = [d for d, _ in kept]
+    weights = [w for _, w in kept]
+
+    if mode == "clauses":
+        return {"clauses": merge_clause_lists([_as_list(d.get("clauses")) for d in datas])}
+
+    if mode == "text":
+        types = Counter(str(d["document_type"]) for d in datas if d.get("document_type"))
+        merged = {
+            "summary": _join_text([d.get("summary") for d in datas]),
+            "document_type": types.most_common(1)[0][0] if types else "",
+        }
+        for key in ("key_clauses", "potential_risks", "recommendations", "parties_involved"):
+            merged[key] = _dedupe([v for d in datas for v in _as_list(d.get(key))])
+        return merged
+
+    if mode == "fairness":
+        scored = [(d.get("overall_fairness_score"), w) for d, w in zip(datas, weights)]
+        scored = [(float(s), w) for s, w in scored if isinstance(s, (int, float))]
+        total_weight = sum(w for _, w in scored)
+        merged = {
+            "overall_fairness_score": (round(sum(s * w for s, w in scored) / total_weight, 1)
+                                       if total_weight else None),
+            "balance_analysis": _join_text([d.get("balance_analysis") for d in datas]),
+            "power_dynamics": _join_text([d.get("power_dynamics") for d in datas]),
+        }
+        for key in ("one_sided_clauses", "red_flags", "recommendations"):
+            merged[key] = _dedupe([v for d in datas for v in _as_list(d.get(key))])
+        return merged
+
+    raise ValueError(f"Unsupported mode: {mode}")
@@ -0,0 +1,451 @@
+# lexiguard_sdk/clauses.py
+"""
+Clause segmentation for LexiGuard SDK
+
+``segment_clauses`` splits a document into a tree of clauses: parts,
+articles, sections and schedules, numbered clauses ("7.", "7.2", "7.2.1"),
+unnumbered headings in capitals, and lettered or roman sub-clauses ("(a)",
+"(iv)") at the start of a line. Text before the first of these becomes a
+"preamble" clause.
+
+Every clause has a stable ID taken from its numbering ("7.2", "7.2(a)(iv)",
+"article-iii", "schedule-2/1.1", "definitions" for a heading), so the same
+clause keeps its ID across versions of a document as long as it keeps its
+number. It also has character offsets into the text and two content hashes:
+``hash`` covers the clause's own text (its heading and body up to its first
+sub-clause) and ``tree_hash`` the clause with all its sub-clauses. Hashes
+ignore whitespace, so re-extracting or re-wrapping the text does not change
+them.
+
+The index keeps offsets, tree links and hashes in parallel arrays (about 70
+bytes per clause, plus its ID) and builds ``Clause`` objects only when they
+are looked up:
+
+    index = segment_clauses(text)
+    clause = index["7.2"]
+    prompt_text = index.text("7.2")
+    clause_at_match = index.at(match.start())
+    changed = segment_clauses(old_text).diff(index)["changed"]
+
+To segment text from ``normalize``, pass ``normalized.text`` and map offsets
+back with ``normalized.original_span``.
+"""
+
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Union
+import hashlib
+import re
+
+PREAMBLE = "preamble"
+PART = "part"
+ARTICLE = "article"
+SECTION = "section"
+CLAUSE = "clause"
+SCHEDULE = "schedule"
+EXHIBIT = "exhibit"
+ANNEX = "annex"
+APPENDIX = "appendix"
+HEADING = "heading"
+NUMBERED = "numbered"
+ITEM = "item"
+
+_KINDS = (PREAMBLE, PART, ARTICLE, SECTION, CLAUSE, SCHEDULE, EXHIBIT, ANNEX, APPENDIX,
+          HEADING, NUMBERED, ITEM)
+_KIND_CODES = {kind: code for code, kind in enumerate(_KINDS)}
+
+# Nesting order: a clause contains the following clauses of higher rank
+_KEYWORD_RANKS = {PART: 0, ARTICLE: 1, SCHEDULE: 1, EXHIBIT: 1, ANNEX: 1, APPENDIX: 1,
+                  SECTION: 2, CLAUSE: 2}
+_HEADING_RANK = 2
+_NUMBERED_RANK = 2          # plus the number of levels: "7." is 3, "7.2" is 4
+_LETTER_RANK = 20           # (a)
+_ROMAN_RANK = 21            # (iv)
+_UPPER_RANK = 22            # (A), (IV)
+_DIGIT_RANK = 23            # (1)
+_PREAMBLE_RANK = 100        # closed by whatever comes next
+
+# Decimal clauses inside these restart their numbering, so their IDs are prefixed
+_ANNEX_KINDS = {SCHEDULE, EXHIBIT, ANNEX, APPENDIX}
+
+# Longer rests of a heading line are body text, not a title
+_MAX_TITLE_CHARS = 100
+
+_BOUNDARY = re.compile(
+    r"""^[ \t]*(?:
+        (?P<keyword>(?:PART|Part|ARTICLE|Article|SECTION|Section|CLAUSE|Clause|
+                       SCHEDULE|Schedule|EXHIBIT|Exhibit|ANNEX|Annex|APPENDIX|Appendix)
+            [ \t]+(?P<number>\d{1,3}(?:\.\d{1,3})*|[IVXLC]{1,7}|[A-Z])\b\.?)
+      | (?P<decimal>\d{1,3}(?:\.\d{1,3})+\.?(?=[ \t]+[A-Z("\u201c])|\d{1,3}[.)](?=[ \t]+\S))
+      | \(?(?P<item>[a-z]{1,2}|[ivx]{1,6}|[A-Z]{1,4}|\d{1,2})\)(?=[ \t]+\S)
+      | (?P<heading>[A-Z][A-Z0-9 ,;:&'()\-]{3,79}?)[ \t]*$
+    )""",
+    re.MULTILINE | re.VERBOSE,
+)
+_ROMAN = re.compile(r"[ivx]+|[IVX]+")
+_SLUG = re.compile(r"[^0-9a-z]+")
+
+
+@dataclass(frozen=True)
+class Clause:
+    """
+    One clause of a ``ClauseIndex``.
+
+    Attributes:
+        index: Position in document order
+        id: Stable ID (see the module docstring)
+        kind: "preamble", "part", "article", "section", "clause", "schedule",
+            "exhibit", "annex", "appendix", "heading", "numbered" or "item"
+        label: Number as written ("7.2", "(a)", "Article III"); empty for
+            headings and the preamble
+        title: Heading text ("Termination"), or empty
+        level: Depth in the tree (0 for top-level clauses)
+        start: Offset of the clause's first character
+        end: Offset after its last character, sub-clauses included
+        body_start: Offset after its label and title
+        parent: ID of the enclosing clause, or None
+        hash: Hex digest of the clause's own text
+        tree_hash: Hex digest of the clause with its sub-clauses
+    """
+    index: int
+    id: str
+    kind: str
+    label: str
+    title: str
+    level: int
+    start: int
+    end: int
+    body_start: int
+    parent: Optional[str]
+    hash: str
+    tree_hash: str
+
+
+def _digest(text: str) -> int:
+    data = " ".join(text.split()).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def _rstrip(text: str, end: int, start: int) -> int:
+    """``end`` moved back over trailing whitespace, but not before ``start``."""
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end
+
+
+class ClauseIndex:
+    """
+    Clause tree of a document, stored in parallel arrays.
+
+    Clauses can be looked up by position or by ID; both return ``Clause``
+    objects. Build it with ``segment_clauses``.
+    """
+
+    def __init__(self, text: str):
+        self._text = text
+        self._starts = array("q")
+        self._label_ends = array("q")
+        self._body_starts = array("q")
+        self._ends = array("q")
+        self._own_ends = array("q")
+        self._parents = array("l")
+        self._levels = array("b")
+        self._kinds = array("b")
+        self._hashes = array("Q")
+        self._tree_hashes = array("Q")
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+
+    @property
+    def source(self) -> str:
+        """The segmented text."""
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[Clause]:
+        for position in range(len(self._ids)):
+            yield self._clause(position)
+
+    def __contains__(self, clause_id: object) -> bool:
+        return clause_id in self._positions
+
+    def __getitem__(self, key: Union[int, str]) -> Clause:
+        return self._clause(self._position(key))
+
+    def get(self, clause_id: str) -> Optional[Clause]:
+        """Clause with ID ``clause_id``, or None."""
+        position = self._positions.get(clause_id)
+        return None if position is None else self._clause(position)
+
+    def _position(self, key: Union[int, str]) -> int:
+        if isinstance(key, str):
+            try:
+                return self._positions[key]
+            except KeyError:
+                raise KeyError(f"no clause {key!r}") from None
+        if not -len(self._ids) <= key < len(self._ids):
+            raise IndexError(f"clause index {key} out of range")
+        return key % len(self._ids)
+
+    def _clause(self, position: int) -> Clause:
+        text = self._text
+        start = self._starts[position]
+        label_end = self._label_ends[position]
+        body_start = self._body_starts[position]
+        kind = _KINDS[self._kinds[position]]
+        if kind in (HEADING, PREAMBLE):
+            label, title = "", text[start:body_start].strip() if kind == HEADING else ""
+        else:
+            label = text[start:label_end].strip()
+            title = " ".join(text[label_end:body_start].split()).strip(" -–—:.")
+        parent = self._parents[position]
+        return Clause(
+            index=position,
+            id=self._ids[position],
+            kind=kind,
+            label=label,
+            title=title,
+            level=self._levels[position],
+            start=start,
+            end=self._ends[position],
+            body_start=body_start,
+            parent=self._ids[parent] if parent >= 0 else None,
+            hash=f"{self._hashes[position]:016x}",
+            tree_hash=f"{self._tree_hashes[position]:016x}",
+        )
+
+    def text(self, key: Union[int, str], own: bool = False) -> str:
+        """
+        Text of a clause.
+
+        Args:
+            key: Clause ID or position
+            own: Only the clause's own text, without its sub-clauses
+
+        Returns:
+            The clause's text
+        """
+        position = self._position(key)
+        end = self._own_ends[position] if own else self._ends[position]
+        return self._text[self._starts[position]:end]
+
+    def children(self, key: Optional[Union[int, str]] = None) -> List[Clause]:
+        """Direct sub-clauses of a clause, or the top-level clauses for None."""
+        parent = -1 if key is None else self._position(key)
+        return [self._clause(position) for position in range(parent + 1, len(self._ids))
+                if self._parents[position] == parent]
+
+    def at(self, offset: int) -> Optional[Clause]:
+        """Innermost clause containing the character at ``offset``, or None."""
+        position = bisect_right(self._starts, offset) - 1
+        while position >= 0 and self._ends[position] <= offset:
+            position = self._parents[position]
+        return None if position < 0 else self._clause(position)
+
+    def diff(self, other: "ClauseIndex") -> Dict[str, List[str]]:
+        """
+        Compare with a newer version of the document.
+
+        Returns:
+            Clause IDs "added" in ``other``, "removed" from it, and "changed"
+            (present in both, with different own text)
+        """
+        return {
+            "added": [clause_id for clause_id in other._ids if clause_id not in self._positions],
+            "removed": [clause_id for clause_id in self._ids if clause_id not in other._positions],
+            "changed": [clause_id for position, clause_id in enumerate(self._ids)
+                        if clause_id in other._positions
+                        and other._hashes[other._positions[clause_id]] != self._hashes[position]],
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the index (without the text), e.g. for caching."""
+        return {
+            "ids": list(self._ids),
+            "starts": self._starts.tolist(),
+            "label_ends": self._label_ends.tolist(),
+            "body_starts": self._body_starts.tolist(),
+            "ends": self._ends.tolist(),
+            "own_ends": self._own_ends.tolist(),
+            "parents": self._parents.tolist(),
+            "levels": self._levels.tolist(),
+            "kinds": [_KINDS[code] for code in self._kinds],
+            "hashes": [f"{value:016x}" for value in self._hashes],
+            "tree_hashes": [f"{value:016x}" for value in self._tree_hashes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], text: str) -> "ClauseIndex":
+        """Rebuild an index saved with ``to_dict`` for the same ``text``."""
+        index = cls(text)
+        for name in ("starts", "label_ends", "body_starts", "ends", "own_ends", "parents",
+                     "levels"):
+            getattr(index, f"_{name}").extend(data[name])
+        index._kinds.extend(_KIND_CODES[kind] for kind in data["kinds"])
+        index._hashes.extend(int(value, 16) for value in data["hashes"])
+        index._tree_hashes.extend(int(value, 16) for value in data["tree_hashes"])
+        index._ids = list(data["ids"])
+        index._positions = {clause_id: position for position, clause_id in enumerate(index._ids)}
+        return index
+
+    def _add(self, clause_id: str, kind: str, start: int, label_end: int, body_start: int,
+             parent: int, level: int) -> int:
+        # IDs repeat when numbering does ("1.1" in two schedules without headings)
+        unique, copy = clause_id, 1
+        while unique in self._positions:
+            copy += 1
+            unique = f"{clause_id}~{copy}"
+        position = len(self._ids)
+        self._ids.append(unique)
+        self._positions[unique] = position
+        self._starts.append(start)
+        self._label_ends.append(label_end)
+        self._body_starts.append(body_start)
+        self._ends.append(start)
+        self._own_ends.append(start)
+        self._parents.append(parent)
+        self._levels.append(level)
+        self._kinds.append(_KIND_CODES[kind])
+        return position
+
+
+def _title_end(text: str, label_end: int, line_end: int) -> int:
+    """End of the title on the rest of a heading line, or ``label_end`` when
+    the rest is body text."""
+    rest = text[label_end:line_end].strip()
+    if not rest or len(rest) > _MAX_TITLE_CHARS or rest[-1] in ".;:,":
+        return label_end
+    return line_end
+
+
+def _item_rank(label: str, open_letter: Optional[str]) -> int:
+    if label.isdigit():
+        return _DIGIT_RANK
+    if label.isupper():
+        return _UPPER_RANK
+    if _ROMAN.fullmatch(label):
+        # "(i)" right after "(h)" is a letter, otherwise a roman numeral
+        if len(label) == 1 and open_letter is not None and ord(open_letter) + 1 == ord(label):
+            return _LETTER_RANK
+        return _ROMAN_RANK
+    return _LETTER_RANK
+
+
+def segment_clauses(text: str) -> ClauseIndex:
+    """
+    Split a document into its clause tree.
+
+    Args:
+        text: Document text, e.g. from ``FileParser.parse_file``
+
+    Returns:
+        ``ClauseIndex`` over ``text`` (which it keeps a reference to)
+    """
+    index = ClauseIndex(text)
+    ranks: List[int] = []
+    stack: List[int] = []
+
+    def close(until_rank: int, at: int) -> None:
+        while stack and ranks[stack[-1]] >= until_rank:
+            position = stack.pop()
+            index._ends[position] = _rstrip(text, at, index._starts[position])
+
+    def open_clause(clause_id: str, kind: str, rank: int, start: int, label_end: int,
+                    body_start: int) -> int:
+        close(rank, start)
+        parent = stack[-1] if stack else -1
+        if parent >= 0 and index._own_ends[parent] == index._starts[parent]:
+            # First sub-clause: the parent's own text ends here
+            index._own_ends[parent] = _rstrip(text, start, index._body_starts[parent])
+        position = index._add(clause_id, kind, start, label_end, body_start, parent, len(stack))
+        ranks.append(rank)
+        stack.append(position)
+        return position
+
+    def scope(parent: int) -> str:
+        """ID prefix: the enclosing schedule, exhibit, annex or appendix."""
+        while parent >= 0:
+            if _KINDS[index._kinds[parent]] in _ANNEX_KINDS:
+                return index._ids[parent] + "/"
+            parent = index._parents[parent]
+        return ""
+
+    untitled = -1  # keyword clause whose title may be on the next line
+    for match in _BOUNDARY.finditer(text):
+        line_end = text.find("\n", match.end())
+        if line_end < 0:
+            line_end = len(text)
+        start = match.start() + len(match.group()) - len(match.group().lstrip(" \t"))
+        if not stack and not index._ids and text[:start].strip():
+            first = len(text) - len(text.lstrip())
+            open_clause(PREAMBLE, PREAMBLE, _PREAMBLE_RANK, first, first, first)
+
+        if match.group("keyword"):
+            kind = match.group("keyword").split()[0].lower()
+            number = match.group("number")
+            parent = stack[-1] if stack else -1
+            label_end = match.end("keyword")
+            body_start = _title_end(text, label_end, line_end)
+            position = open_clause(f"{kind}-{number.lower()}", kind, _KEYWORD_RANKS[kind],
+                                   start, label_end, body_start)
+            untitled = position if body_start == label_end else -1
+            continue
+
+        if match.group("heading"):
+            if untitled >= 0 and not text[index._body_starts[untitled]:start].strip():
+                # "ARTICLE III" on one line and "TERMINATION" on the next
+                index._body_starts[untitled] = match.end("heading")
+                untitled = -1
+                continue
+            untitled = -1
+            slug = _SLUG.sub("-", match.group("heading").lower()).strip("-")[:40] or HEADING
+            open_clause(slug, HEADING, _HEADING_RANK, start, start, match.end("heading"))
+            continue
+
+        untitled = -1
+        if match.group("decimal"):
+            number = match.group("decimal").rstrip(".)")
+            rank = _NUMBERED_RANK + number.count(".") + 1
+            close(rank, start)
+            parent = stack[-1] if stack else -1
+            label_end = match.end("decimal")
+            open_clause(scope(parent) + number, NUMBERED, rank, start, label_end,
+                        _title_end(text, label_end, line_end))
+        else:
+            label = match.group("item")
+            open_letter = next((text[index._starts[p]:index._label_ends[p]].strip("() \t")
+                                for p in reversed(stack) if ranks[p] == _LETTER_RANK), None)
+            rank = _item_rank(label, open_letter)
+            close(rank, start)
+            parent = stack[-1] if stack else -1
+            prefix = index._ids[parent] if parent >= 0 else ""
+            open_clause(f"{prefix}({label})", ITEM, rank, start, match.end(), match.end())
+
+    if not index._ids and text.strip():
+        first = len(text) - len(text.lstrip())
+        open_clause(PREAMBLE, PREAMBLE, _PREAMBLE_RANK, first, first, first)
+    close(-1, len(text))
+
+    # Own text runs to the first sub-clause; hashes go bottom-up
+    tree_hashes = [0] * len(index)
+    children: List[List[int]] = [[] for _ in range(len(index))]
+    for position in range(len(index)):
+        if index._own_ends[position] == index._starts[position]:
+            index._own_ends[position] = index._ends[position]
+        index._hashes.append(_digest(text[index._starts[position]:index._own_ends[position]]))
+        parent = index._parents[position]
+        if parent >= 0:
+            children[parent].append(position)
+    for position in reversed(range(len(index))):
+        if children[position]:
+            combined = b"".join(value.to_bytes(8, "big") for value in
+                                [index._hashes[position]] + [tree_hashes[c] for c in children[position]])
+            tree_hashes[position] = int.from_bytes(
+                hashlib.blake2b(combined, digest_size=8).digest(), "big")
+        else:
+            tree_hashes[position] = index._hashes[position]
+    index._tree_hashes.extend(tree_hashes)
+    return index
@@ -0,0 +1,338 @@
+# lexiguard_sdk/cli.py
+"""
+Command-line interface for LexiGuard SDK
+
+    lexiguard batch ./contracts --output results.jsonl --mode clauses --concurrency 32
+
+``batch`` analyzes every PDF, DOCX and TXT file under a directory. Files are
+parsed in a process pool, model calls run in a thread pool (optionally under
+a client-side quota limiter), and each result is appended to a JSONL file as
+soon as it is ready. A manifest next to the output records every file that
+finished and whether it succeeded, so rerunning the same command after an
+interruption skips the files that succeeded and only redoes failed and
+unfinished ones. Files that changed since they were recorded are analyzed
+again. A file analyzed again gets another line in the output; the last line
+for a path is the current one.
+"""
+
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, TextIO
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+
+from .file_utils import FileParser
+
+# Legacy binary .doc files are not ZIP-based DOCX, so they are left out
+SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".txt"}
+
+# Documents above this many estimated tokens go through analyze_long_document
+DEFAULT_LONG_DOCUMENT_TOKENS = 100_000
+
+
+def _ignore_sigint() -> None:
+    # Ctrl-C is handled by the parent, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _parse_job(path: str, normalize: bool = False) -> Dict[str, Any]:
+    """Process-pool entry point: extract text from one file."""
+    # Files are already spread over processes, so don't nest a page-level pool
+    return FileParser.parse_file(path, parallel_pdf=False, normalize=normalize)
+
+
+def iter_documents(root: Path, recursive: bool = True) -> Iterator[Path]:
+    """Yield supported files under ``root`` in a stable (sorted) order."""
+    pattern = "**/*" if recursive else "*"
+    for path in sorted(root.glob(pattern)):
+        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS:
+            yield path
+
+
+class BatchManifest:
+    """
+    Append-only record of finished files.
+
+    Each line is a JSON object with the file's relative path, size,
+    modification time and whether its analysis succeeded; the last line for a
+    path wins. A file counts as done only if it succeeded and its size and
+    modification time still match.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Partially written last line of an interrupted run
+                        continue
+                    self._entries[entry["path"]] = entry
+        self._file: Optional[TextIO] = None
+
+    @staticmethod
+    def _fingerprint(path: Path) -> Dict[str, int]:
+        stat = path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def is_done(self, key: str, path: Path) -> bool:
+        entry = self._entries.get(key)
+        # Manifests written before failures were recorded only list successes
+        if entry is None or not entry.get("success", True):
+            return False
+        fingerprint = self._fingerprint(path)
+        return entry["size"] == fingerprint["size"] and entry["mtime_ns"] == fingerprint["mtime_ns"]
+
+    def is_recorded(self, key: str) -> bool:
+        """Whether ``key`` finished in an earlier run, successfully or not."""
+        return key in self._entries
+
+    def mark_done(self, key: str, path: Path, success: bool = True) -> None:
+        entry = {"path": key, **self._fingerprint(path), "success": success,
+                 "finished_at": time.time()}
+        self._entries[key] = entry
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def run_batch(client: Any, root: Path, output: Path, manifest_path: Optional[Path] = None,
+              mode: str = "text", recursive: bool = True,
+              parse_workers: Optional[int] = None, concurrency: int = 16,
+              long_document_tokens: int = DEFAULT_LONG_DOCUMENT_TOKENS,
+              normalize: bool = False,
+              progress: Optional[TextIO] = None) -> Dict[str, int]:
+    """
+    Analyze every supported file under ``root`` and append results to ``output``.
+
+    Args:
+        client: ``LexiGuard`` client used for model calls
+        root: Directory to scan
+        output: JSONL file receiving one line per analyzed file
+        manifest_path: Checkpoint file (defaults to ``<output>.manifest``)
+        mode: "text", "clauses", "fairness" or "all"
+        recursive: Also scan subdirectories
+        parse_workers: Processes used for text extraction (default: CPU count)
+        concurrency: Model calls in flight at once
+        long_document_tokens: Use map-reduce analysis above this size
+            (not available for mode "all")
+        normalize: Strip headers, footers, page numbers and redundant
+            whitespace before analysis (see ``normalize``); each output line
+            then records the savings under "normalization"
+        progress: Stream for progress lines (None for silence)
+
+    Returns:
+        Counts of files found, skipped (already done), succeeded and failed,
+        and of files analyzed again after an earlier run recorded them (a
+        failure or a changed file); their new output line supersedes the old
+    """
+    from .chunking import estimate_tokens
+    from .core import BATCH_MODES, LexiGuardError
+
+    if mode not in BATCH_MODES:
+        raise LexiGuardError(f"Unsupported batch mode: {mode}")
+    if concurrency < 1:
+        raise LexiGuardError("concurrency must be at least 1")
+
+    manifest = BatchManifest(manifest_path or output.with_name(output.name + ".manifest"))
+    method = getattr(client, BATCH_MODES[mode])
+    counts = {"found": 0, "skipped": 0, "succeeded": 0, "failed": 0, "rerun": 0}
+    started = time.monotonic()
+
+    def analyze(text: str) -> Dict[str, Any]:
+        if mode != "all" and estimate_tokens(text) > long_document_tokens:
+            # Chunks run one at a time: each io_pool thread is one model call,
+            # so --concurrency stays the bound on calls in flight
+            return client.analyze_long_document(text, mode=mode, max_concurrency=1)
+        return method(text)
+
+    def report(force: bool = False) -> None:
+        done = counts["succeeded"] + counts["failed"]
+        if progress is not None and (force or done % 25 == 0):
+            rate = done / max(time.monotonic() - started, 1e-9)
+            progress.write(f"[lexiguard] {done} analyzed ({counts['failed']} failed), "
+                           f"{counts['skipped']} skipped, {rate:.1f} files/s\n")
+            if force and counts["rerun"]:
+                progress.write(f"[lexiguard] {counts['rerun']} files from an earlier run were "
+                               f"analyzed again; the last line for a path in {output} "
+                               f"is the current one\n")
+            progress.flush()
+
+    pending_files = []
+    for path in iter_documents(root, recursive):
+        counts["found"] += 1
+        key = path.relative_to(root).as_posix()
+        if manifest.is_done(key, path):
+            counts["skipped"] += 1
+        else:
+            counts["rerun"] += manifest.is_recorded(key)
+            pending_files.append((key, path))
+
+    # Keep only a bounded amount of extracted text in memory at once
+    max_parsing = (parse_workers or os.cpu_count() or 1) * 2
+    max_analyzing = concurrency * 2
+    parse_pool = ProcessPoolExecutor(max_workers=parse_workers, initializer=_ignore_sigint)
+    io_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="lexiguard-batch")
+    parsing: Dict[Future, tuple] = {}
+    analyzing: Dict[Future, tuple] = {}
+    queue = iter(pending_files)
+    exhausted = False
+
+    def fill_parsing() -> None:
+        nonlocal exhausted
+        while not exhausted and len(parsing) < max_parsing and len(analyzing) < max_analyzing:
+            item = next(queue, None)
+            if item is None:
+                exhausted = True
+                return
+            parsing[parse_pool.submit(_parse_job, str(item[1]), normalize)] = item
+
+    try:
+        with open(output, "a", encoding="utf-8") as out:
+            def emit(key: str, path: Path, record: Dict[str, Any]) -> None:
+                out.write(json.dumps({"path": key, **record}, default=str) + "\n")
+                out.flush()
+                success = bool(record["result"].get("success"))
+                counts["succeeded" if success else "failed"] += 1
+                manifest.mark_done(key, path, success)
+                report()
+
+            fill_parsing()
+            while parsing or analyzing:
+                done, _ = wait(list(parsing) + list(analyzing), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in parsing:
+                        key, path = parsing.pop(future)
+                        try:
+                            parsed = future.result()
+                        except Exception as e:
+                            parsed = {"success": False, "error": f"Parser crashed: {e}"}
+                        if not parsed.get("success"):
+                            emit(key, path, {"result": parsed})
+                            continue
+                        info = {"file_type": parsed["file_type"], "chars": len(parsed["text"])}
+                        if "normalization" in parsed:
+                            info["normalization"] = parsed["normalization"]
+                        analyzing[io_pool.submit(analyze, parsed["text"])] = (key, path, info)
+                    else:
+                        key, path, info = analyzing.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {"success": False, "error": str(e)}
+                        emit(key, path, {**info, "result": result})
+                fill_parsing()
+    finally:
+        manifest.close()
+        for future in list(parsing) + list(analyzing):
+            future.cancel()
+        io_pool.shutdown(wait=False)
+        parse_pool.shutdown(wait=False)
+    report(force=True)
+    return counts
+
+
+def _build_client(args: argparse.Namespace) -> Any:
+    from .core import LexiGuard
+    from .ratelimit import AdaptiveRateLimiter
+
+    limiter = None
+    if args.rpm or args.tpm:
+        limiter = AdaptiveRateLimiter(requests_per_minute=args.rpm,
+                                      tokens_per_minute=args.tpm,
+                                      max_concurrency=args.concurrency)
+    backend = None
+    if args.fake:
+        from .backends import FakeBackend
+        backend = FakeBackend()
+    api_key = args.api_key or os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+    return LexiGuard(api_key=api_key, model_name=args.model, rate_limiter=limiter,
+                     backend=backend)
+
+
+def _cmd_batch(args: argparse.Namespace) -> int:
+    from .core import LexiGuardError
+
+    root = Path(args.directory)
+    if not root.is_dir():
+        print(f"lexiguard: not a directory: {root}", file=sys.stderr)
+        return 2
+    try:
+        client = _build_client(args)
+        counts = run_batch(
+            client, root, Path(args.output),
+            manifest_path=Path(args.manifest) if args.manifest else None,
+            mode=args.mode, recursive=not args.no_recursive,
+            parse_workers=args.parse_workers, concurrency=args.concurrency,
+            long_document_tokens=args.long_document_tokens,
+            normalize=args.normalize,
+            progress=None if args.quiet else sys.stderr,
+        )
+    except LexiGuardError as e:
+        print(f"lexiguard: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("lexiguard: interrupted; rerun the same command to resume", file=sys.stderr)
+        return 130
+    print(json.dumps(counts))
+    return 1 if counts["failed"] else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lexiguard", description="LexiGuard legal document analysis")
+    commands = parser.add_subparsers(dest="command")
+
+    batch = commands.add_parser("batch", help="analyze every document in a directory")
+    batch.add_argument("directory", help="directory containing PDF, DOCX and TXT files")
+    batch.add_argument("-o", "--output", default="lexiguard-results.jsonl",
+                       help="JSONL file to append results to (default: %(default)s)")
+    batch.add_argument("--manifest", help="checkpoint file (default: <output>.manifest)")
+    batch.add_argument("--mode", default="text", choices=["text", "clauses", "fairness", "all"])
+    batch.add_argument("--no-recursive", action="store_true", help="don't scan subdirectories")
+    batch.add_argument("--parse-workers", type=int, default=None,
+                       help="processes for text extraction (default: CPU count)")
+    batch.add_argument("--concurrency", type=int, default=16,
+                       help="model calls in flight (default: %(default)s)")
+    batch.add_argument("--rpm", type=float, help="requests-per-minute quota")
+    batch.add_argument("--tpm", type=float, help="input-tokens-per-minute quota")
+    batch.add_argument("--long-document-tokens", type=int, default=DEFAULT_LONG_DOCUMENT_TOKENS,
+                       help="map-reduce documents above this many tokens (default: %(default)s)")
+    batch.add_argument("--normalize", action="store_true",
+                       help="strip headers, footers, page numbers and extra whitespace before analysis")
+    batch.add_argument("--model", default="models/gemini-2.5-flash")
+    batch.add_argument("--api-key", help="Gemini API key (default: $GEMINI_API_KEY or $GOOGLE_API_KEY)")
+    batch.add_argument("--fake", action="store_true",
+                       help="use the offline fake backend (dry runs and load tests)")
+    batch.add_argument("-q", "--quiet", action="store_true", help="no progress output")
+    batch.set_defaults(handler=_cmd_batch)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not getattr(args, "handler", None):
+        parser.print_help()
+        return 2
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,25 @@
 LexiGuard SDK - Core functionality for legal document analysis
 """
 
-import google.generativeai as genai
-from typing import Dict, Any, Optional, List
-import json
-from pathlib import Path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Callable, Iterator, Sequence, Union, TYPE_CHECKING
+
+from . import chunking, operations
+from .backends import GeminiBackend, GenerationRequest, GenerationResult, ModelBackend
+from .base import ClientBase
+from .cache import MemoryCache, ResponseCache, make_cache_key
+from .hedging import HedgePolicy, run_hedged
+from .hooks import CACHE_COALESCED, CallRecord, Hooks
+from .operations import Operation, InvalidInputError
+from .ratelimit import DEFAULT_RETRY_POLICY, AdaptiveRateLimiter, RetryPolicy, classify_error
+from .routing import RoutingPolicy
+from .singleflight import SingleFlight
+from .streaming import IncrementalJSONParser
+
+if TYPE_CHECKING:
+    from .chat import ChatSession
 
 
 class LexiGuardError(Exception):
@@ -14,7 +29,18 @@ class LexiGuardError(Exception):
     pass
 
 
-class LexiGuard:
+# Batch modes accepted by analyze_many, mapped to the per-document method
+BATCH_MODES = {
+    "text": "analyze_text",
+    "clauses": "analyze_clauses",
+    "fairness": "analyze_fairness",
+    "all": "analyze_all",
+}
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class LexiGuard(ClientBase):
     """
     Main SDK class for legal document analysis using Google Gemini AI.
     
@@ -23,160 +49,405 @@ class LexiGuard:
         result = lg.analyze_text("Contract text here...")
     """
     
-    def __init__(self, api_key: str, model_name: str = "models/gemini-2.5-flash"):
+    def __init__(self, api_key: Optional[str] = None,
+                 model_name: str = "models/gemini-2.5-flash",
+                 cache: Optional[ResponseCache] = None,
+                 generation_config: Optional[Dict[str, Any]] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+                 backend: Optional[ModelBackend] = None,
+                 hooks: Optional[Sequence[Hooks]] = None,
+                 coalesce: bool = True,
+                 hedge_policy: Optional[HedgePolicy] = None,
+                 routing: Optional[RoutingPolicy] = None):
         """
         Initialize LexiGuard SDK.
         
         Args:
-            api_key: Your Google Gemini API key
+            api_key: Your Google Gemini API key (not needed with a custom backend)
             model_name: Gemini model to use (default: gemini-1.5-flash)
+            cache: Optional response cache (see ``lexiguard_sdk.cache``); identical
+                prompts are then answered from the cache instead of the model
+            generation_config: Optional Gemini generation parameters
+            rate_limiter: Optional client-side quota limiter (see
+                ``lexiguard_sdk.ratelimit``); may be shared between clients
+            retry_policy: Backoff for throttled/transient errors (None disables retries)
+            backend: Model backend (see ``lexiguard_sdk.backends``); defaults to
+                Gemini, or pass ``FakeBackend()`` to run offline
+            hooks: Instrumentation hooks notified about every call (see
+                ``lexiguard_sdk.hooks``); more can be appended to ``hooks`` later
+            coalesce: Let concurrent identical requests share one in-flight
+                model call (see ``lexiguard_sdk.singleflight``)
+            hedge_policy: Optional request hedging for non-streaming calls (see
+                ``lexiguard_sdk.hedging``); may be shared between clients
+            routing: Optional model routing by task and prompt size, with
+                escalation on invalid JSON (see ``lexiguard_sdk.routing``)
         """
-        if not api_key:
-            raise LexiGuardError("API key is required")
+        if backend is None:
+            if not api_key:
+                raise LexiGuardError("API key is required")
+            backend = GeminiBackend(api_key)
         
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model_name)
+        self.backend = backend
         self.model_name = model_name
+        self.cache = cache
+        self.generation_config = generation_config
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.hooks: List[Hooks] = list(hooks or [])
+        self.inflight: Optional[SingleFlight] = SingleFlight() if coalesce else None
+        self.hedge_policy = hedge_policy
+        self.routing = routing
+        # Successful per-chunk results of analyze_long_document
+        self.chunk_cache = MemoryCache(max_entries=4096)
+    
+    def _call_model(self, prompt: str, generation_config: Optional[Dict[str, Any]],
+                    task: Optional[str] = None, cached_content: Any = None,
+                    record: Optional[CallRecord] = None,
+                    model_name: Optional[str] = None) -> GenerationResult:
+        """
+        Call the backend under the rate limiter, retrying throttled/transient errors.
+        
+        Raises:
+            LexiGuardError: When the call fails and retries are exhausted
+        """
+        request = GenerationRequest(prompt, model_name or self.model_name,
+                                    generation_config, task, cached_content)
+        tokens = chunking.estimate_tokens(prompt)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(tokens)
+            outcome = None
+            sent = time.perf_counter()
+            try:
+                if self.hedge_policy is None:
+                    result = self.backend.generate(request)
+                else:
+                    result = self._generate_hedged(request, tokens, record)
+                self._note_usage(record, result)
+                return result
+            except Exception as e:
+                kind = classify_error(e)
+                outcome = kind or "error"
+                if self.retry_policy is None or not self.retry_policy.should_retry(kind, attempt):
+                    raise LexiGuardError(f"AI generation failed: {str(e)}") from e
+            finally:
+                if record is not None:
+                    record.attempts += 1
+                    record.model_seconds += time.perf_counter() - sent
+                # A hedged first call releases its own slot when it really ends
+                if self.rate_limiter is not None and self.hedge_policy is None:
+                    self.rate_limiter.release(outcome)
+            time.sleep(self.retry_policy.delay(attempt))
+            attempt += 1
+    
+    def _generate_hedged(self, request: GenerationRequest, tokens: int,
+                         record: Optional[CallRecord]) -> GenerationResult:
+        """
+        Run one backend call under the hedge policy.
+        
+        The caller has acquired a rate-limiter slot for the first call. Each
+        call releases its slot when it finishes, which for a call that lost
+        the race is after its answer was already discarded. A first call
+        that never started (it could not be submitted, or was cancelled
+        before it ran) has its slot released here.
+        """
+        hedge_request = self._hedge_request(request)
+        # Held until the first call's slot is released, so it is released once
+        first_slot = threading.Lock()
+        first_started = False
+        
+        def release_first(outcome: Optional[str]) -> None:
+            if self.rate_limiter is not None and first_slot.acquire(blocking=False):
+                self.rate_limiter.release(outcome)
+        
+        def first() -> GenerationResult:
+            nonlocal first_started
+            first_started = True
+            outcome = None
+            try:
+                return self.backend.generate(request)
+            except Exception as e:
+                outcome = classify_error(e) or "error"
+                raise
+            finally:
+                release_first(outcome)
+        
+        def hedge() -> GenerationResult:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(tokens)
+            outcome = None
+            try:
+                return self.backend.generate(hedge_request)
+            except Exception as e:
+                outcome = classify_error(e) or "error"
+                raise
+            finally:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(outcome)
+        
+        try:
+            result, hedged, won = run_hedged(self.hedge_policy, first, hedge)
+        finally:
+            if not first_started:
+                release_first(None)
+        self._note_hedge(record, hedged, won)
+        return result
+    
+    def _stream_model(self, prompt: str, generation_config: Optional[Dict[str, Any]],
+                      task: Optional[str] = None,
+                      record: Optional[CallRecord] = None,
+                      model_name: Optional[str] = None) -> Iterator[str]:
+        """
+        Streaming counterpart of ``_call_model``; only failures before the first
+        chunk are retried.
+        """
+        request = GenerationRequest(prompt, model_name or self.model_name,
+                                    generation_config, task)
+        tokens = chunking.estimate_tokens(prompt)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(tokens)
+            outcome = None
+            started = False
+            sent = time.perf_counter()
+            try:
+                for text in self.backend.stream(request):
+                    started = True
+                    yield text
+                return
+            except Exception as e:
+                kind = classify_error(e)
+                outcome = kind or "error"
+                if (started or self.retry_policy is None
+                        or not self.retry_policy.should_retry(kind, attempt)):
+                    raise LexiGuardError(f"AI generation failed: {str(e)}") from e
+            finally:
+                if record is not None:
+                    # Includes time the caller spends between chunks
+                    record.attempts += 1
+                    record.model_seconds += time.perf_counter() - sent
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(outcome)
+            time.sleep(self.retry_policy.delay(attempt))
+            attempt += 1
     
-    def _generate_response(self, prompt: str) -> str:
+    def _generate_response(self, prompt: str,
+                           generation_config: Optional[Dict[str, Any]] = None,
+                           task: Optional[str] = None,
+                           record: Optional[CallRecord] = None,
+                           model_name: Optional[str] = None) -> str:
         """
         Internal method to generate AI response.
         
         Args:
             prompt: The prompt to send to Gemini
+            generation_config: Generation parameters (defaults to the client's)
+            task: Name of the SDK operation issuing the call
+            record: Call record to fill in for hooks, if any
+            model_name: Model to call (defaults to the client's)
             
         Returns:
             Generated text response
         """
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            raise LexiGuardError(f"AI generation failed: {str(e)}")
+        if generation_config is None:
+            generation_config = self.generation_config
+        
+        key = self._response_key(prompt, generation_config, model_name)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            self._note_cache_lookup(record, cached)
+            if cached is not None:
+                return cached
+        
+        def generate() -> str:
+            text = self._call_model(prompt, generation_config, task, record=record,
+                                   model_name=model_name).text
+            # Cache before the in-flight entry is released so no caller misses both
+            if self.cache is not None:
+                self.cache.set(key, text)
+            return text
+        
+        if self.inflight is None:
+            return generate()
+        text, shared = self.inflight.do(key, generate)
+        if shared and record is not None:
+            record.cache = CACHE_COALESCED
+        return text
     
-    def analyze_text(self, text: str) -> Dict[str, Any]:
+    def _generate_stream(self, prompt: str,
+                         generation_config: Optional[Dict[str, Any]] = None,
+                         task: Optional[str] = None,
+                         record: Optional[CallRecord] = None,
+                         model_name: Optional[str] = None) -> Iterator[str]:
         """
-        Analyze legal document text for key insights.
+        Internal method to stream an AI response chunk by chunk.
         
         Args:
-            text: Legal document text to analyze
+            prompt: The prompt to send to Gemini
+            generation_config: Generation parameters (defaults to the client's)
+            task: Name of the SDK operation issuing the call
+            record: Call record to fill in for hooks, if any
+            model_name: Model to call (defaults to the client's)
             
-        Returns:
-            Dictionary with analysis results including summary, risks, and recommendations
+        Yields:
+            Response text chunks as they arrive
         """
-        if not text or not text.strip():
-            return {
-                "success": False,
-                "error": "Text cannot be empty"
-            }
-        
-        prompt = f"""
-        You are a legal document analysis expert. Analyze the following legal document text:
-        
-        {text}
-        
-        Provide a comprehensive analysis in JSON format with:
-        1. "summary": Brief overview of the document
-        2. "document_type": Type of legal document
-        3. "key_clauses": List of important clauses
-        4. "potential_risks": List of risks or concerning terms
-        5. "recommendations": List of actionable recommendations
-        6. "parties_involved": List of parties mentioned
-        
-        Return ONLY valid JSON.
+        if generation_config is None:
+            generation_config = self.generation_config
+        
+        key = self._response_key(prompt, generation_config, model_name, coalesce=False)
+        if key is not None:
+            cached = self.cache.get(key)
+            self._note_cache_lookup(record, cached)
+            if cached is not None:
+                yield cached
+                return
+        
+        parts = []
+        for text in self._stream_model(prompt, generation_config, task, record, model_name):
+            parts.append(text)
+            yield text
+        
+        if key is not None:
+            self.cache.set(key, "".join(parts))
+    
+    def _execute(self, operation: Operation,
+                 started: Optional[float] = None) -> Dict[str, Any]:
         """
+        Send a prepared operation to the model and build its result.
         
-        try:
-            response = self._generate_response(prompt)
-            # Clean response to extract JSON
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
+        Args:
+            operation: Operation built by one of the ``operations`` builders
+            started: ``time.perf_counter()`` before the operation was built
             
-            analysis = json.loads(response.strip())
+        Returns:
+            Result dictionary produced by the operation
+        """
+        if started is None:
+            started = time.perf_counter()
+        record, route = self._begin_execution(operation, started)
+        generation_config = self._generation_config_for(operation)
+        while True:
+            sent = time.perf_counter()
+            try:
+                response = self._generate_response(
+                    operation.prompt, generation_config, operation.name, record,
+                    route.model_name if route is not None else None
+                )
+            except Exception as e:
+                return self._execution_failed(route, sent, record, started, e)
+            result, route, stale_key = self._execution_result(operation, response, record,
+                                                              route, sent)
+            if stale_key is not None:
+                self.cache.delete(stale_key)
+            if route is None:
+                break
+        self._end_record(record, started)
+        return result
+    
+    def _execute_stream(self, operation: Operation,
+                        started: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a prepared operation, yielding parse events as values complete.
+        
+        Args:
+            operation: Operation built by one of the ``operations`` builders
+            started: ``time.perf_counter()`` before the operation was built
             
-            return {
-                "success": True,
-                "data": analysis
-            }
-        except json.JSONDecodeError as e:
-            return {
-                "success": False,
-                "error": f"Failed to parse AI response: {str(e)}",
-                "raw_response": response
-            }
+        Yields:
+            "field" and "item" events (see ``lexiguard_sdk.streaming``), then a
+            final "result" event holding the usual result dictionary
+        """
+        if started is None:
+            started = time.perf_counter()
+        record, route = self._begin_execution(operation, started, stream=True)
+        parser = IncrementalJSONParser()
+        parts = []
+        sent = time.perf_counter()
+        try:
+            chunks = self._generate_stream(
+                operation.prompt, self._generation_config_for(operation), operation.name,
+                record, route.model_name if route is not None else None
+            )
+            for chunk in chunks:
+                if record is not None and not parts:
+                    record.first_chunk_seconds = time.perf_counter() - started
+                parts.append(chunk)
+                for event in parser.feed(chunk):
+                    yield event
         except Exception as e:
+            yield {"type": "result",
+                   "result": self._execution_failed(route, sent, record, started, e)}
+            return
+        # Events already delivered can't be taken back, so streams never escalate
+        result, _, stale_key = self._execution_result(operation, "".join(parts), record,
+                                                      route, sent, escalate=False)
+        if stale_key is not None:
+            self.cache.delete(stale_key)
+        self._end_record(record, started)
+        yield {"type": "result", "result": result}
+    
+    def _run_stream(self, builder: Callable[..., Operation], *args,
+                    **kwargs) -> Iterator[Dict[str, Any]]:
+        """Streaming counterpart of ``_run``."""
+        started = time.perf_counter()
+        try:
+            operation = builder(*args, **kwargs)
+        except InvalidInputError as e:
+            yield {"type": "result", "result": {"success": False, "error": str(e)}}
+            return
+        yield from self._execute_stream(operation, started)
+    
+    def _run(self, builder: Callable[..., Operation], *args, **kwargs) -> Dict[str, Any]:
+        """Build an operation, reporting rejected input as a failed result."""
+        started = time.perf_counter()
+        try:
+            operation = builder(*args, **kwargs)
+        except InvalidInputError as e:
             return {
                 "success": False,
                 "error": str(e)
             }
+        return self._execute(operation, started)
+    
+    def analyze_text(self, text: str,
+                     stream: bool = False) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """
+        Analyze legal document text for key insights.
+        
+        Args:
+            text: Legal document text to analyze
+            stream: If True, return an iterator of events that reports each
+                top-level field (and each list element) as soon as it is
+                generated; see ``lexiguard_sdk.streaming``
+            
+        Returns:
+            Dictionary with analysis results including summary, risks, and recommendations
+        """
+        if stream:
+            return self._run_stream(operations.analyze_text, text)
+        return self._run(operations.analyze_text, text)
     
-    def analyze_clauses(self, text: str, clause_types: Optional[List[str]] = None) -> Dict[str, Any]:
+    def analyze_clauses(self, text: str, clause_types: Optional[List[str]] = None,
+                        stream: bool = False) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """
         Perform detailed clause-by-clause analysis.
         
         Args:
             text: Legal document text
             clause_types: Optional list of specific clause types to focus on
+            stream: If True, return an iterator of events that reports each
+                clause as soon as it is generated; see ``lexiguard_sdk.streaming``
             
         Returns:
             Dictionary with detailed clause analysis
         """
-        if not text or not text.strip():
-            return {
-                "success": False,
-                "error": "Text cannot be empty"
-            }
-        
-        clause_focus = ""
-        if clause_types:
-            clause_focus = f"\nFocus especially on these clause types: {', '.join(clause_types)}"
-        
-        prompt = f"""
-        Analyze the following legal document and break it down clause by clause:
-        
-        {text}
-        {clause_focus}
-        
-        For each significant clause, provide:
-        1. "clause_number": Sequential number
-        2. "clause_title": Short descriptive title
-        3. "clause_text": The actual clause text (excerpt)
-        4. "analysis": Detailed analysis of what this clause means
-        5. "risk_level": "low", "medium", or "high"
-        6. "fairness_score": 1-10 (10 being most fair)
-        7. "concerns": List of specific concerns if any
-        
-        Return as JSON with a "clauses" array.
-        """
-        
-        try:
-            response = self._generate_response(prompt)
-            # Clean JSON response
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            
-            analysis = json.loads(response.strip())
-            
-            return {
-                "success": True,
-                "data": analysis,
-                "total_clauses": len(analysis.get("clauses", []))
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        if stream:
+            return self._run_stream(operations.analyze_clauses, text, clause_types)
+        return self._run(operations.analyze_clauses, text, clause_types)
     
     def analyze_fairness(self, text: str) -> Dict[str, Any]:
         """
@@ -188,50 +459,26 @@ class LexiGuard:
         Returns:
             Dictionary with fairness scores and analysis
         """
-        if not text or not text.strip():
-            return {
-                "success": False,
-                "error": "Text cannot be empty"
-            }
-        
-        prompt = f"""
-        Analyze the fairness of this legal document:
-        
-        {text}
-        
-        Provide a fairness assessment in JSON format:
-        1. "overall_fairness_score": 1-10 (10 being most fair)
-        2. "balance_analysis": Analysis of balance between parties
-        3. "one_sided_clauses": List of clauses that favor one party
-        4. "red_flags": List of concerning terms or conditions
-        5. "power_dynamics": Description of power balance
-        6. "recommendations": How to improve fairness
-        
-        Return ONLY valid JSON.
+        return self._run(operations.analyze_fairness, text)
+    
+    def analyze_all(self, text: str,
+                    clause_types: Optional[List[str]] = None) -> Dict[str, Any]:
         """
+        Produce the summary, clause breakdown and fairness assessment in one model call.
         
-        try:
-            response = self._generate_response(prompt)
-            # Clean JSON
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            
-            analysis = json.loads(response.strip())
+        The document is sent once and the model answers with a single JSON object,
+        which is split back into the results of the three individual methods.
+        
+        Args:
+            text: Legal document text
+            clause_types: Optional list of specific clause types to focus on
             
-            return {
-                "success": True,
-                "data": analysis
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        Returns:
+            Dictionary with "analysis", "clauses" and "fairness" entries shaped like
+            the results of analyze_text, analyze_clauses and analyze_fairness;
+            "success" is True only when all three sections were returned
+        """
+        return self._run(operations.analyze_all, text, clause_types)
     
     def draft_negotiation_email(self, document_text: str, concerns: List[str], 
                                 recipient_name: str = "Recipient") -> Dict[str, Any]:
@@ -246,57 +493,8 @@ class LexiGuard:
         Returns:
             Dictionary with generated email content
         """
-        if not document_text or not concerns:
-            return {
-                "success": False,
-                "error": "Document text and concerns are required"
-            }
-        
-        concerns_text = "\n".join([f"- {c}" for c in concerns])
-        
-        prompt = f"""
-        Draft a professional, polite negotiation email regarding a legal document.
-        
-        Document context: {document_text[:500]}...
-        
-        Concerns to address:
-        {concerns_text}
-        
-        The email should:
-        1. Be addressed to {recipient_name}
-        2. Be professional and diplomatic
-        3. Clearly state the concerns
-        4. Propose constructive solutions
-        5. Request a discussion or revision
-        
-        Return JSON with:
-        - "subject": Email subject line
-        - "body": Full email body
-        - "tone": The tone used (professional/diplomatic/etc)
-        """
-        
-        try:
-            response = self._generate_response(prompt)
-            # Clean JSON
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            
-            email_data = json.loads(response.strip())
-            
-            return {
-                "success": True,
-                "data": email_data
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return self._run(operations.draft_negotiation_email, document_text, concerns,
+                         recipient_name)
     
     def draft_document_review_email(self, document_text: str, 
                                    review_notes: str,
@@ -312,51 +510,8 @@ class LexiGuard:
         Returns:
             Dictionary with generated email content
         """
-        if not document_text:
-            return {
-                "success": False,
-                "error": "Document text is required"
-            }
-        
-        prompt = f"""
-        Draft a professional email to share a document review.
-        
-        Document context: {document_text[:500]}...
-        Review notes: {review_notes}
-        
-        The email should:
-        1. Be addressed to {recipient_name}
-        2. Introduce the reviewed document
-        3. Summarize key findings
-        4. Be clear and actionable
-        
-        Return JSON with:
-        - "subject": Email subject line
-        - "body": Full email body
-        """
-        
-        try:
-            response = self._generate_response(prompt)
-            # Clean JSON
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            
-            email_data = json.loads(response.strip())
-            
-            return {
-                "success": True,
-                "data": email_data
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return self._run(operations.draft_document_review_email, document_text,
+                         review_notes, recipient_name)
     
     def chat(self, message: str, document_context: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -369,38 +524,195 @@ class LexiGuard:
         Returns:
             Dictionary with chat response
         """
-        if not message:
-            return {
-                "success": False,
-                "error": "Message cannot be empty"
-            }
+        return self._run(operations.chat, message, document_context)
+    
+    def start_chat(self, document: str, **kwargs) -> "ChatSession":
+        """
+        Start a multi-turn chat that keeps ``document`` for the whole conversation.
         
-        context_text = ""
-        if document_context:
-            context_text = f"\n\nDocument context:\n{document_context}\n\n"
+        Unlike ``chat``, follow-up questions do not resend the full document:
+        it is held in Gemini's context cache when the document is large enough,
+        otherwise only the excerpts relevant to each question are sent.
         
-        prompt = f"""
-        You are a legal assistant helping users understand legal documents.
-        {context_text}
-        User question: {message}
+        Args:
+            document: The legal document text
+            **kwargs: Options for ``ChatSession`` (max_turns, use_context_cache, ...)
+            
+        Returns:
+            A ``ChatSession``; call ``ask(message)`` for each turn
+        """
+        from .chat import ChatSession
+        return ChatSession(self, document, **kwargs)
+    
+    def analyze_many(self, texts: Sequence[str], mode: str = "text",
+                     max_concurrency: int = 8,
+                     progress_callback: Optional[ProgressCallback] = None,
+                     **kwargs) -> List[Dict[str, Any]]:
+        """
+        Analyze many documents in parallel through a bounded worker pool.
         
-        Provide a helpful, clear, and accurate response. If the question is about the document,
-        reference specific parts of it. Be concise but thorough.
+        Args:
+            texts: Legal document texts to analyze
+            mode: "text", "clauses", "fairness" or "all" (selects the per-document method)
+            max_concurrency: Maximum number of documents analyzed at once
+            progress_callback: Optional callable invoked as ``(completed, total)``
+                after each document finishes
+            **kwargs: Extra arguments for the per-document method
+                (e.g. ``clause_types`` for mode "clauses")
+            
+        Returns:
+            One result dictionary per input text, in input order. Each result has
+            the same success/error shape as the per-document method.
+        """
+        if mode not in BATCH_MODES:
+            raise LexiGuardError(
+                f"Unsupported batch mode: {mode}. Use one of: {', '.join(BATCH_MODES)}"
+            )
+        if max_concurrency < 1:
+            raise LexiGuardError("max_concurrency must be at least 1")
+        
+        method = getattr(self, BATCH_MODES[mode])
+        total = len(texts)
+        if total == 0:
+            return []
+        results: List[Optional[Dict[str, Any]]] = [None] * total
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, total)) as pool:
+            futures = {
+                pool.submit(method, text, **kwargs): index
+                for index, text in enumerate(texts)
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = {
+                        "success": False,
+                        "error": str(e)
+                    }
+                if progress_callback:
+                    progress_callback(completed, total)
+        
+        return results
+    
+    def analyze_clauses_many(self, texts: Sequence[str],
+                             clause_types: Optional[List[str]] = None,
+                             max_concurrency: int = 8,
+                             progress_callback: Optional[ProgressCallback] = None
+                             ) -> List[Dict[str, Any]]:
         """
+        Batch variant of ``analyze_clauses``; see ``analyze_many``.
+        """
+        return self.analyze_many(texts, mode="clauses", max_concurrency=max_concurrency,
+                                 progress_callback=progress_callback,
+                                 clause_types=clause_types)
+    
+    def analyze_fairness_many(self, texts: Sequence[str], max_concurrency: int = 8,
+                              progress_callback: Optional[ProgressCallback] = None
+                              ) -> List[Dict[str, Any]]:
+        """
+        Batch variant of ``analyze_fairness``; see ``analyze_many``.
+        """
+        return self.analyze_many(texts, mode="fairness", max_concurrency=max_concurrency,
+                                 progress_callback=progress_callback)
+    
+    def analyze_long_document(self, text: str, mode: str = "text",
+                              max_chunk_tokens: int = chunking.DEFAULT_CHUNK_TOKENS,
+                              max_concurrency: int = 4,
+                              clause_types: Optional[List[str]] = None,
+                              progress_callback: Optional[ProgressCallback] = None
+                              ) -> Dict[str, Any]:
+        """
+        Analyze a document too long for a single prompt using map-reduce.
         
-        try:
-            response = self._generate_response(prompt)
+        The text is split on clause/heading boundaries into chunks of at most
+        ``max_chunk_tokens`` estimated tokens, the chunks are analyzed
+        concurrently, and the chunk results are merged: summaries are joined,
+        list entries and clauses are de-duplicated, and ``clause_number`` is
+        renumbered across the whole document.
+        
+        Successful chunk results are kept in ``chunk_cache``, so calling this
+        again after a partial failure only re-analyzes the failed chunks.
+        
+        Args:
+            text: Full legal document text
+            mode: "text", "clauses" or "fairness"
+            max_chunk_tokens: Token budget per chunk
+            max_concurrency: Maximum number of chunks analyzed at once
+            clause_types: Optional clause types to focus on (mode "clauses")
+            progress_callback: Optional callable invoked as ``(completed, total)``
+                for the chunks that had to be analyzed
             
+        Returns:
+            Dictionary shaped like the single-call result for ``mode`` plus
+            "total_chunks"; on failure, "failed_chunks" lists chunk indices
+        """
+        if mode not in ("text", "clauses", "fairness"):
+            raise LexiGuardError(f"Unsupported mode for long documents: {mode}")
+        if not text or not text.strip():
             return {
-                "success": True,
-                "data": {
-                    "message": message,
-                    "response": response,
-                    "has_context": document_context is not None
-                }
+                "success": False,
+                "error": "Text cannot be empty"
             }
-        except Exception as e:
+        
+        chunks = chunking.split_into_chunks(text, max_chunk_tokens)
+        keys = [self._chunk_cache_key(chunk, mode, clause_types) for chunk in chunks]
+        results: List[Optional[Dict[str, Any]]] = [self.chunk_cache.get(key) for key in keys]
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            kwargs = {"clause_types": clause_types} if mode == "clauses" else {}
+            fresh = self.analyze_many([chunks[i] for i in pending], mode=mode,
+                                      max_concurrency=max_concurrency,
+                                      progress_callback=progress_callback, **kwargs)
+            for index, result in zip(pending, fresh):
+                if result.get("success") and not isinstance(result.get("data"), dict):
+                    result = {
+                        "success": False,
+                        "error": f"Chunk {index} response is not a JSON object"
+                    }
+                results[index] = result
+                if result.get("success"):
+                    self.chunk_cache.set(keys[index], result)
+        
+        failed = [i for i, result in enumerate(results) if not result.get("success")]
+        if failed:
             return {
                 "success": False,
-                "error": str(e)
-            }
\ No newline at end of file
+                "error": f"{len(failed)} of {len(chunks)} chunks failed: "
+                         f"{results[failed[0]].get('error', 'unknown error')}",
+                "failed_chunks": failed,
+                "total_chunks": len(chunks)
+            }
+        
+        data = chunking.merge_results(mode, [r["data"] for r in results],
+                                      weights=[len(chunk) for chunk in chunks])
+        result = {
+            "success": True,
+            "data": data,
+            "total_chunks": len(chunks)
+        }
+        if mode == "clauses":
+            result["total_clauses"] = len(data["clauses"])
+        return result
+    
+    def _chunk_cache_key(self, chunk: str, mode: str,
+                         clause_types: Optional[List[str]]) -> str:
+        """
+        ``chunk_cache`` key of one chunk's result.
+        
+        Covers everything that changes the result: the model and route the
+        chunk's call is routed to and the generation config it is sent with.
+        """
+        builder = getattr(operations, BATCH_MODES[mode])
+        operation = builder(chunk, clause_types) if mode == "clauses" else builder(chunk)
+        route = self._select_route(operation)
+        options = {
+            "mode": mode,
+            "clause_types": clause_types,
+            "route": route.name if route is not None else None,
+            "generation_config": self._generation_config_for(operation),
+        }
+        model_name = route.model_name if route is not None else None
+        return make_cache_key(model_name or self.model_name, chunk, options)
@@ -0,0 +1,245 @@
+# lexiguard_sdk/docx_reader.py
+"""
+Streaming DOCX text reader for LexiGuard SDK
+
+Reads the text of a Word document straight from the XML parts in the DOCX
+archive with ``ElementTree.iterparse``, without building python-docx's object
+model. Parts are decompressed as they are parsed and elements are discarded
+once their text has been taken, so memory stays flat however long the
+document is.
+
+Besides body paragraphs, the reader returns what ``Document.paragraphs``
+leaves out: tables (one block per row, cells separated by ``CELL_SEPARATOR``),
+text boxes, headers, footers, footnotes and endnotes. Blocks come in page
+order: headers, the body, footnotes, endnotes, then footers.
+
+Usage:
+    from lexiguard_sdk.docx_reader import iter_docx
+
+    with open("contract.docx", "rb") as f:
+        for block in iter_docx(f):
+            print(block.part, block.page, block.text)
+"""
+
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Generator, Iterator, List, Sequence, Tuple
+from xml.etree import ElementTree
+import posixpath
+import zipfile
+
+HEADER = "header"
+BODY = "body"
+FOOTNOTE = "footnote"
+ENDNOTE = "endnote"
+FOOTER = "footer"
+
+DEFAULT_PARTS = (HEADER, BODY, FOOTNOTE, ENDNOTE, FOOTER)
+
+CELL_SEPARATOR = " | "
+
+# Transitional and Strict OOXML
+_NAMESPACES = (
+    "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "http://purl.oclc.org/ooxml/wordprocessingml/main",
+)
+_TAGS = {
+    f"{{{namespace}}}{name}": name
+    for namespace in _NAMESPACES
+    for name in ("p", "t", "tab", "ptab", "br", "cr", "noBreakHyphen", "lastRenderedPageBreak",
+                 "tbl", "tr", "tc", "body", "hdr", "ftr", "footnotes", "endnotes")
+}
+_CONTAINERS = {"body", "hdr", "ftr", "footnotes", "endnotes"}
+_BREAK_TYPES = [f"{{{namespace}}}type" for namespace in _NAMESPACES]
+
+# Text boxes are stored twice, as DrawingML and as a VML fallback
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_RELATIONSHIPS = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+# Relationship type (last URI segment) of the parts each block kind comes from
+_PART_RELATIONSHIPS = {HEADER: "header", FOOTNOTE: "footnotes", ENDNOTE: "endnotes",
+                       FOOTER: "footer"}
+
+
+@dataclass(frozen=True)
+class DocxBlock:
+    """
+    One non-empty paragraph or table row.
+
+    Attributes:
+        part: "header", "body", "footnote", "endnote" or "footer"
+        page: Page index (from 0) following the document's page breaks and
+            the breaks Word recorded when the file was last saved
+        text: Paragraph text, or the row's cells joined by ``CELL_SEPARATOR``
+        table: Whether the block is a table row
+    """
+    part: str
+    page: int
+    text: str
+    table: bool = False
+
+
+def _relationships(archive: zipfile.ZipFile, part_name: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(relationship type, part name)`` for the internal relationships of a part."""
+    folder, name = posixpath.split(part_name)
+    try:
+        data = archive.read(posixpath.join(folder, "_rels", name + ".rels"))
+    except KeyError:
+        return
+    for relationship in ElementTree.fromstring(data).iter(_RELATIONSHIPS):
+        if relationship.get("TargetMode") == "External":
+            continue
+        target = relationship.get("Target", "")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(folder, target))
+        yield relationship.get("Type", "").rpartition("/")[2], target
+
+
+def _blocks(stream: BinaryIO, part: str, page: int) -> Generator[DocxBlock, None, int]:
+    """Stream the blocks of one XML part; returns the page index at its end."""
+    paragraphs: List[List[str]] = []  # text of the open paragraphs, innermost last
+    cells: List[List[str]] = []       # paragraph texts of the open table cells
+    rows: List[List[str]] = []        # cell texts of the open table rows
+    breaks = 0
+    # Word also records a manual page break as rendered where the next page
+    # starts; it is the same break until some text follows it
+    after_break = False
+    fallback = 0
+    depth = 0
+    container = None
+    container_depth = 0
+
+    for event, element in ElementTree.iterparse(stream, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            depth += 1
+            if tag == _MC_FALLBACK:
+                fallback += 1
+            elif not fallback:
+                name = _TAGS.get(tag)
+                if name == "p":
+                    paragraphs.append([])
+                elif name == "tc":
+                    cells.append([])
+                elif name == "tr":
+                    rows.append([])
+                elif name in _CONTAINERS and container is None:
+                    container, container_depth = element, depth
+            continue
+
+        depth -= 1
+        if tag == _MC_FALLBACK:
+            fallback -= 1
+            element.clear()
+            continue
+        if fallback:
+            continue
+        name = _TAGS.get(tag)
+        if name is None:
+            pass
+        elif name == "t":
+            if paragraphs:
+                paragraphs[-1].append(element.text or "")
+            after_break = after_break and not element.text
+        elif name in ("tab", "ptab"):
+            if paragraphs:
+                paragraphs[-1].append("\t")
+        elif name == "br":
+            if any(element.get(key) == "page" for key in _BREAK_TYPES):
+                breaks += 1
+                after_break = True
+            elif paragraphs:
+                paragraphs[-1].append("\n")
+        elif name == "cr":
+            if paragraphs:
+                paragraphs[-1].append("\n")
+        elif name == "noBreakHyphen":
+            if paragraphs:
+                paragraphs[-1].append("-")
+        elif name == "lastRenderedPageBreak":
+            if not after_break:
+                breaks += 1
+            after_break = False
+        elif name == "p":
+            text = "".join(paragraphs.pop())
+            element.clear()
+            if cells:
+                if text.strip():
+                    cells[-1].append(text)
+            else:
+                if text.strip():
+                    yield DocxBlock(part, page, text)
+                page, breaks = page + breaks, 0
+        elif name == "tc":
+            text = " ".join(cells.pop())
+            if rows:
+                rows[-1].append(text)
+        elif name == "tr":
+            row = rows.pop()
+            element.clear()
+            text = CELL_SEPARATOR.join(row) if any(cell.strip() for cell in row) else ""
+            if cells:
+                # Row of a table nested in a cell
+                if text:
+                    cells[-1].append(text)
+            else:
+                if text:
+                    yield DocxBlock(part, page, text, table=True)
+                page, breaks = page + breaks, 0
+        # Drop each finished top-level block so the tree never grows
+        if container is not None and depth == container_depth:
+            container.clear()
+    return page + breaks
+
+
+def iter_docx(file: BinaryIO, parts: Sequence[str] = DEFAULT_PARTS) -> Iterator[DocxBlock]:
+    """
+    Yield the text blocks of a DOCX file.
+
+    Args:
+        file: Seekable binary file object with the DOCX archive
+        parts: Kinds of blocks to return (see ``DEFAULT_PARTS``); identical
+            headers or footers (e.g. first-page and default) are returned once
+
+    Yields:
+        ``DocxBlock`` for each non-empty paragraph and table row
+
+    Raises:
+        ValueError: If the archive has no main document part
+        zipfile.BadZipFile: If the file is not a ZIP archive
+    """
+    with zipfile.ZipFile(file) as archive:
+        main = next((target for kind, target in _relationships(archive, "")
+                     if kind == "officeDocument"), "word/document.xml")
+        names = set(archive.namelist())
+        if main not in names:
+            raise ValueError("not a Word document: no main document part")
+        related: Dict[str, List[str]] = {}
+        for kind, target in _relationships(archive, main):
+            if target in names:
+                related.setdefault(kind, []).append(target)
+        for targets in related.values():
+            # header1.xml, header2.xml, ..., header10.xml
+            targets.sort(key=lambda name: (len(name), name))
+
+        def part_blocks(part: str, page: int) -> Iterator[DocxBlock]:
+            seen = set()
+            for name in related.get(_PART_RELATIONSHIPS[part], []):
+                with archive.open(name) as stream:
+                    blocks = list(_blocks(stream, part, page))
+                key = tuple(block.text for block in blocks)
+                if key and key not in seen:
+                    seen.add(key)
+                    yield from blocks
+
+        if HEADER in parts:
+            yield from part_blocks(HEADER, 0)
+        page = 0
+        if BODY in parts:
+            with archive.open(main) as stream:
+                page = yield from _blocks(stream, BODY, 0)
+        for part in (FOOTNOTE, ENDNOTE, FOOTER):
+            if part in parts:
+                yield from part_blocks(part, page)
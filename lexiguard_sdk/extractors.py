@@ -0,0 +1,416 @@
+# lexiguard_sdk/extractors.py
+"""
+PDF text extraction backends for LexiGuard SDK
+
+``FileParser`` extracts PDF text through a chain of registered extractors.
+The first installed extractor in the chain (by default the fastest one)
+handles every page; a page is handed to the next extractor in the chain only
+when the text it returned is empty or garbled (see ``needs_fallback``), so
+the slower, more robust libraries only run where they are needed.
+
+Registered by default, from fastest to slowest:
+
+    pymupdf     PyMuPDF (pip install pymupdf)
+    pypdfium2   PDFium bindings (pip install pypdfium2)
+    pypdf       pypdf (pip install pypdf)
+    pypdf2      PyPDF2, installed with the SDK
+    pdfminer    pdfminer.six (pip install pdfminer.six)
+
+``pip install lexiguard-sdk[pdf]`` installs PyMuPDF, pypdfium2 and pdfminer.six.
+
+The order can be changed with ``set_pdf_extractor_order`` or the
+``LEXIGUARD_PDF_EXTRACTORS`` environment variable (comma-separated names);
+``benchmarks/pdf_backends.py`` ranks the installed extractors on a sample
+corpus. Custom extractors subclass ``PdfExtractor`` and are added with
+``register_pdf_extractor``. Parallel extraction sends the chain to worker
+processes, so extractor classes must be defined at the top level of an
+importable module.
+"""
+
+from importlib.util import find_spec
+from typing import Dict, List, Optional, Sequence
+import io
+import os
+import re
+import threading
+import unicodedata
+
+from .file_utils import _BufferReader
+
+ENV_EXTRACTORS = "LEXIGUARD_PDF_EXTRACTORS"
+
+# Share of unusable characters above which page text counts as garbled
+GARBLED_THRESHOLD = 0.1
+
+# Pages with fewer visible characters than this are judged by content alone
+_MIN_CHECKED_CHARS = 20
+
+_CID = re.compile(r"\(cid:\d+\)")
+
+
+def needs_fallback(text: str) -> bool:
+    """
+    Whether page text is empty or garbled enough to try another extractor.
+
+    Text counts as garbled when more than ``GARBLED_THRESHOLD`` of its visible
+    characters are replacement characters, control or private-use characters,
+    unassigned code points or unmapped ``(cid:N)`` glyphs, or when a longer
+    page contains almost no letters or digits.
+    """
+    if not text or not text.strip():
+        return True
+    cids = _CID.findall(text)
+    if cids:
+        text = _CID.sub("", text)
+    visible = [ch for ch in text if not ch.isspace()]
+    if not visible:
+        return True
+    bad = len(cids)
+    alnum = 0
+    for ch in visible:
+        if ch.isalnum():
+            alnum += 1
+        elif ch == "\ufffd" or unicodedata.category(ch) in ("Cc", "Cf", "Co", "Cn", "Cs"):
+            bad += 1
+    if bad > GARBLED_THRESHOLD * (len(visible) + len(cids)):
+        return True
+    return len(visible) >= _MIN_CHECKED_CHARS and alnum < 0.3 * len(visible)
+
+
+class PdfDocument:
+    """
+    An open PDF in one extractor.
+
+    Attributes:
+        page_count: Number of pages
+    """
+    page_count: int = 0
+
+    def page_text(self, index: int) -> str:
+        """Text of page ``index`` (from 0)."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PdfExtractor:
+    """
+    Interface for PDF text extraction backends.
+
+    Attributes:
+        name: Registry name
+        modules: Import names; the extractor is installed when any exists
+        distribution: Package name, whose version is part of extraction
+            cache keys
+    """
+    name: str = ""
+    modules: Sequence[str] = ()
+    distribution: str = ""
+
+    def available(self) -> bool:
+        """Whether the library is installed (checked without importing it)."""
+        return any(find_spec(module) is not None for module in self.modules)
+
+    def open(self, view: memoryview, path: Optional[str] = None) -> PdfDocument:
+        """
+        Open a PDF.
+
+        Args:
+            view: The file's bytes
+            path: The file's path, when it came from one (libraries that read
+                files themselves may use it instead of ``view``)
+
+        Returns:
+            The open document
+        """
+        raise NotImplementedError
+
+
+class _PyPDFDocument(PdfDocument):
+    def __init__(self, reader):
+        self._reader = reader
+        self.page_count = len(reader.pages)
+
+    def page_text(self, index: int) -> str:
+        return self._reader.pages[index].extract_text()
+
+
+class PyPDF2Extractor(PdfExtractor):
+    name = "pypdf2"
+    modules = ("PyPDF2",)
+    distribution = "PyPDF2"
+
+    def open(self, view: memoryview, path: Optional[str] = None) -> PdfDocument:
+        import PyPDF2
+
+        return _PyPDFDocument(PyPDF2.PdfReader(_BufferReader(view)))
+
+
+class PypdfExtractor(PdfExtractor):
+    name = "pypdf"
+    modules = ("pypdf",)
+    distribution = "pypdf"
+
+    def open(self, view: memoryview, path: Optional[str] = None) -> PdfDocument:
+        import pypdf
+
+        return _PyPDFDocument(pypdf.PdfReader(_BufferReader(view)))
+
+
+class _PyMuPDFDocument(PdfDocument):
+    def __init__(self, document):
+        self._document = document
+        self.page_count = document.page_count
+
+    def page_text(self, index: int) -> str:
+        return self._document.load_page(index).get_text()
+
+    def close(self) -> None:
+        self._document.close()
+
+
+class PyMuPDFExtractor(PdfExtractor):
+    name = "pymupdf"
+    modules = ("pymupdf", "fitz")
+    distribution = "PyMuPDF"
+
+    def open(self, view: memoryview, path: Optional[str] = None) -> PdfDocument:
+        try:
+            import pymupdf
+        except ImportError:
+            import fitz as pymupdf
+
+        if path is not None:
+            return _PyMuPDFDocument(pymupdf.open(path))
+        # PyMuPDF only takes bytes for in-memory documents
+        return _PyMuPDFDocument(pymupdf.open(stream=bytes(view), filetype="pdf"))
+
+
+class _PdfiumDocument(PdfDocument):
+    def __init__(self, document):
+        self._document = document
+        self.page_count = len(document)
+
+    def page_text(self, index: int) -> str:
+        page = self._document[index]
+        try:
+            textpage = page.get_textpage()
+            try:
+                return textpage.get_text_range().replace("\r\n", "\n")
+            finally:
+                textpage.close()
+        finally:
+            page.close()
+
+    def close(self) -> None:
+        self._document.close()
+
+
+class PdfiumExtractor(PdfExtractor):
+    name = "pypdfium2"
+    modules = ("pypdfium2",)
+    distribution = "pypdfium2"
+
+    def open(self, view: memoryview, path: Optional[str] = None) -> PdfDocument:
+        import pypdfium2
+
+        return _PdfiumDocument(pypdfium2.PdfDocument(path if path is not None
+                                                     else _BufferReader(view)))
+
+
+class _PdfminerDocument(PdfDocument):
+    def __init__(self, view: memoryview):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        document = PDFDocument(PDFParser(_BufferReader(view)))
+        self._pages = list(PDFPage.create_pages(document))
+        self.page_count = len(self._pages)
+        self._output = io.StringIO()
+        resources = PDFResourceManager()
+        self._device = TextConverter(resources, self._output, laparams=LAParams())
+        self._interpreter = PDFPageInterpreter(resources, self._device)
+
+    def page_text(self, index: int) -> str:
+        self._output.seek(0)
+        self._output.truncate()
+        self._interpreter.process_page(self._pages[index])
+        # pdfminer ends every page with a form feed
+        return self._output.getvalue().rstrip("\f")
+
+    def close(self) -> None:
+        self._device.close()
+
+
+class PdfminerExtractor(PdfExtractor):
+    name = "pdfminer"
+    modules = ("pdfminer",)
+    distribution = "pdfminer.six"
+
+    def open(self, view: memoryview, path: Optional[str] = None) -> PdfDocument:
+        return _PdfminerDocument(view)
+
+
+_registry: Dict[str, PdfExtractor] = {}
+_order: Optional[List[str]] = None
+_registry_lock = threading.Lock()
+
+
+def register_pdf_extractor(extractor: PdfExtractor, before: Optional[str] = None) -> None:
+    """
+    Add (or replace) an extractor in the registry.
+
+    Args:
+        extractor: Extractor instance with a unique ``name``
+        before: Name of the extractor it should be tried before (default: last)
+    """
+    if not extractor.name:
+        raise ValueError("extractor needs a name")
+    with _registry_lock:
+        _registry.pop(extractor.name, None)
+        items = list(_registry.items())
+        position = len(items)
+        if before is not None:
+            names = [name for name, _ in items]
+            if before not in names:
+                raise ValueError(f"unknown PDF extractor: {before}")
+            position = names.index(before)
+        items.insert(position, (extractor.name, extractor))
+        _registry.clear()
+        _registry.update(items)
+
+
+def get_pdf_extractor(name: str) -> PdfExtractor:
+    """Registered extractor called ``name``."""
+    try:
+        return _registry[name]
+    except KeyError:
+        raise ValueError(f"unknown PDF extractor: {name}") from None
+
+
+def set_pdf_extractor_order(names: Optional[Sequence[str]]) -> None:
+    """
+    Set the extraction chain, e.g. from a ``benchmarks/pdf_backends.py`` ranking.
+
+    Args:
+        names: Extractor names, first choice first; extractors not listed are
+            not used. None restores the registration order (or the
+            ``LEXIGUARD_PDF_EXTRACTORS`` environment variable).
+    """
+    global _order
+    if names is not None:
+        for name in names:
+            get_pdf_extractor(name)
+    _order = list(names) if names is not None else None
+
+
+def pdf_extractors(installed_only: bool = True) -> List[PdfExtractor]:
+    """
+    The extraction chain: extractors in the order they are tried.
+
+    Args:
+        installed_only: Leave out extractors whose library is not installed
+
+    Returns:
+        Extractors, first choice first
+    """
+    names = _order
+    if names is None and os.environ.get(ENV_EXTRACTORS):
+        names = [name.strip() for name in os.environ[ENV_EXTRACTORS].split(",") if name.strip()]
+    extractors = ([get_pdf_extractor(name) for name in names] if names is not None
+                  else list(_registry.values()))
+    if installed_only:
+        extractors = [extractor for extractor in extractors if extractor.available()]
+    return extractors
+
+
+class FallbackDocument(PdfDocument):
+    """
+    A PDF opened in an extraction chain.
+
+    Pages come from the first extractor that could open the file. When its
+    text for a page needs a fallback, the following extractors are opened (on
+    first use) and tried in order; the first usable text wins. If none is
+    usable, the first extractor's text is kept.
+
+    Attributes:
+        page_count: Number of pages, as reported by the first extractor
+        fallback_pages: Pages whose text came from a fallback extractor
+    """
+
+    def __init__(self, extractors: Sequence[PdfExtractor], view: memoryview,
+                 path: Optional[str] = None):
+        if not extractors:
+            raise ValueError("no PDF extractor given")
+        self._extractors = list(extractors)
+        self._view = view
+        self._path = path
+        self._documents: List[Optional[PdfDocument]] = [None] * len(self._extractors)
+        self._failed = [False] * len(self._extractors)
+        self.fallback_pages = 0
+
+        error: Optional[Exception] = None
+        for position in range(len(self._extractors)):
+            try:
+                self._documents[position] = self._extractors[position].open(view, path)
+            except Exception as e:
+                error = error or e
+                self._failed[position] = True
+                continue
+            self._primary = position
+            break
+        else:
+            raise error
+        self.page_count = self._documents[self._primary].page_count
+
+    def _document(self, position: int) -> Optional[PdfDocument]:
+        if self._documents[position] is None and not self._failed[position]:
+            try:
+                self._documents[position] = self._extractors[position].open(self._view, self._path)
+            except Exception:
+                self._failed[position] = True
+        return self._documents[position]
+
+    def page_text(self, index: int) -> str:
+        first_text: Optional[str] = None
+        first_error: Optional[Exception] = None
+        for position in range(self._primary, len(self._extractors)):
+            document = self._document(position)
+            if document is None:
+                continue
+            try:
+                text = document.page_text(index)
+            except Exception as e:
+                first_error = first_error or e
+                continue
+            if not needs_fallback(text):
+                if position != self._primary:
+                    self.fallback_pages += 1
+                return text
+            if first_text is None:
+                first_text = text
+        if first_text is None:
+            raise first_error
+        return first_text
+
+    def close(self) -> None:
+        for document in self._documents:
+            if document is not None:
+                document.close()
+        self._documents = [None] * len(self._extractors)
+
+
+for _extractor in (PyMuPDFExtractor(), PdfiumExtractor(), PypdfExtractor(),
+                   PyPDF2Extractor(), PdfminerExtractor()):
+    register_pdf_extractor(_extractor)
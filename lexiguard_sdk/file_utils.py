@@ -2,11 +2,80 @@
 """
 File parsing utilities for LexiGuard SDK
 Supports PDF, DOCX, and TXT files
+
+DOCX text is streamed from the document XML by ``docx_reader``, including
+tables, headers, footers and footnotes. PDF text comes from the extraction
+chain in ``extractors``: the fastest installed PDF library, with a per-page
+fallback to slower ones for pages it returns empty or garbled.
+
+Long PDFs can be extracted in parallel: the page range is split into
+contiguous slices, each slice is extracted in a worker process, and the page
+texts are joined in order. By default (``parallel=None``) this happens for
+files given by path with at least ``PARALLEL_PDF_MIN_PAGES`` pages; file
+objects and buffers are extracted in the calling process unless
+``parallel=True``, and uploads always are.
+
+``FileParser.iter_pages`` and ``FileParser.iter_paragraphs`` yield a document
+piece by piece instead of building one string, and can stop early at a
+character or token budget:
+    
+    for page in FileParser.iter_pages("contract.pdf", max_tokens=8000):
+        redact(page["index"], page["text"])
+
+Besides paths and ``BytesIO`` objects, every parser accepts ``bytes``,
+``bytearray``, ``memoryview`` and ``mmap`` buffers without copying them. Paths
+are memory-mapped, so the PDF and DOCX readers fetch only the parts of the
+file they need instead of reading the whole file into memory first.
+
+``parse_file`` and ``parse_uploaded_file`` take an optional extraction cache
+keyed by the SHA-256 of the file's bytes and the parser version, so a file
+uploaded again is not extracted again:
+    
+    cache = make_extraction_cache()  # memory LRU + ~/.cache/lexiguard/extractions.db
+    result = FileParser.parse_uploaded_file(data, "contract.pdf", cache=cache)
+
+With ``normalize=True`` they also strip running headers and footers, page
+numbers, line-break hyphenation and redundant whitespace before the text goes
+to the model (see ``normalize``), and report the savings under
+"normalization".
 """
 
-from typing import Dict, Any, Union
+from contextlib import contextmanager
+from typing import Dict, Any, BinaryIO, Iterator, List, Optional, Union, TYPE_CHECKING
 from pathlib import Path
+import hashlib
 import io
+import mmap
+import os
+import re
+import threading
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from .cache import ResponseCache, TieredCache
+    from .extractors import FallbackDocument, PdfExtractor
+
+# Page count from which PDFs given by path are extracted in a process pool
+PARALLEL_PDF_MIN_PAGES = 64
+
+# One pool per worker count, never shut down while shared; multiprocessing is
+# imported on first use, so importing FileParser stays cheap
+_pdf_pools: Dict[int, "ProcessPoolExecutor"] = {}
+_pdf_pool_lock = threading.Lock()
+
+# Bump whenever a change to the extraction code changes its output, so
+# cached extractions made by older versions are no longer used
+PARSER_VERSION = "2"
+
+DEFAULT_EXTRACTION_CACHE = "~/.cache/lexiguard/extractions.db"
+
+# Pages per task when iter_pages extracts in parallel
+_STREAM_SLICE_PAGES = 4
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+# Anything the parsers accept: a path, a binary file object or a raw buffer
+FileSource = Union[str, Path, BinaryIO, bytes, bytearray, memoryview, mmap.mmap]
 
 
 class FileParsingError(Exception):
@@ -14,18 +83,384 @@ class FileParsingError(Exception):
     pass
 
 
+class _BufferReader(io.RawIOBase):
+    """Read-only, seekable file object over a memoryview; only the bytes
+    actually read are copied."""
+    
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._pos + size)
+        data = bytes(self._view[self._pos:end])
+        self._pos = max(self._pos, end)
+        return data
+    
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            # OSError, as for real files (zipfile relies on it)
+            raise OSError("negative seek position")
+        self._pos = offset
+        return offset
+    
+    def tell(self) -> int:
+        return self._pos
+
+
+def _is_path(file_path: Any) -> bool:
+    return isinstance(file_path, (str, Path))
+
+
+@contextmanager
+def _open_buffer(file_path: FileSource) -> Iterator[memoryview]:
+    """
+    Expose any accepted input as a memoryview without copying it.
+    
+    Paths are memory-mapped read-only and ``BytesIO`` objects are viewed from
+    their current position. Other file objects are read into memory.
+    """
+    if _is_path(file_path):
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                mapped = None
+            else:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped is None:
+            yield memoryview(b"")
+            return
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # A reader still holds a slice; the map is closed when it is freed
+                pass
+        return
+    
+    if isinstance(file_path, io.BytesIO):
+        # getvalue() returns the BytesIO's own bytes object (getbuffer() would
+        # copy a BytesIO that still shares the bytes it was created from)
+        view = memoryview(file_path.getvalue())[file_path.tell():]
+    elif isinstance(file_path, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(file_path).cast('B')
+    else:
+        view = memoryview(file_path.read())
+    try:
+        yield view
+    finally:
+        view.release()
+
+
+def _pdf_worker_source(file_path: FileSource, view: memoryview) -> Union[str, bytes]:
+    """What to send to extraction workers: the path when there is one (each
+    worker maps the file itself), otherwise a copy of the bytes."""
+    return str(file_path) if _is_path(file_path) else bytes(view)
+
+
+def _get_pdf_pool(max_workers: int) -> "ProcessPoolExecutor":
+    """
+    Process pool with ``max_workers`` workers shared by parallel PDF
+    extractions (kept warm between calls).
+    
+    Pools are never resized or shut down here: another thread may be
+    submitting to the same pool, and a shut-down executor rejects new tasks.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with _pdf_pool_lock:
+        pool = _pdf_pools.get(max_workers)
+        if pool is None:
+            pool = _pdf_pools[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+        return pool
+
+
+def _discard_pdf_pool(pool: "ProcessPoolExecutor") -> None:
+    """
+    Stop handing out a pool that failed. It is not shut down: callers still
+    holding it finish (or fail) on their own, and its workers exit once the
+    last reference to the executor is gone.
+    """
+    with _pdf_pool_lock:
+        for workers, current in list(_pdf_pools.items()):
+            if current is pool:
+                del _pdf_pools[workers]
+
+
+def _pdf_extractors() -> List["PdfExtractor"]:
+    """The PDF extraction chain; fails when no PDF library is installed."""
+    from .extractors import pdf_extractors
+    
+    chain = pdf_extractors()
+    if not chain:
+        raise FileParsingError(
+            "No PDF extractor is installed. Install one with: pip install PyPDF2"
+        )
+    return chain
+
+
+def _open_pdf(file_path: FileSource, view: memoryview,
+              chain: List["PdfExtractor"]) -> "FallbackDocument":
+    from .extractors import FallbackDocument
+    
+    return FallbackDocument(chain, view, str(file_path) if _is_path(file_path) else None)
+
+
+def _extract_pdf_pages(source: Union[str, bytes], start: int, stop: int,
+                       chain: List["PdfExtractor"]) -> List[str]:
+    """Worker entry point: extract the text of pages ``start`` to ``stop - 1``."""
+    with _open_buffer(source) as view, _open_pdf(source, view, chain) as document:
+        return [document.page_text(index) for index in range(start, stop)]
+
+
+def _extract_pdf_parallel(pool: "ProcessPoolExecutor", source: Union[str, bytes],
+                          page_count: int, workers: int,
+                          chain: List["PdfExtractor"]) -> List[str]:
+    """Extract all pages in contiguous slices, one per worker, in page order."""
+    workers = min(workers, page_count)
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    futures = [pool.submit(_extract_pdf_pages, source, start, stop, chain)
+               for start, stop in zip(bounds, bounds[1:])]
+    pages: List[str] = []
+    for future in futures:
+        pages.extend(future.result())
+    return pages
+
+
+def _iter_pdf_parallel(source: Union[str, bytes], page_count: int, workers: int,
+                       chain: List["PdfExtractor"]) -> Iterator[str]:
+    """
+    Yield page texts in order while later pages are extracted in the pool.
+    
+    At most ``2 * workers`` slices are queued ahead of the consumer; slices
+    not yet started are cancelled when the consumer stops early.
+    """
+    pool = _get_pdf_pool(workers)
+    workers = min(workers, page_count)
+    # Bytes are sent with every task, so use fewer, larger slices for them
+    size = _STREAM_SLICE_PAGES
+    if isinstance(source, bytes):
+        size = max(size, -(-page_count // (workers * 2)))
+    starts = iter(range(0, page_count, size))
+    pending: List[Any] = []
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                start = next(starts, None)
+                if start is None:
+                    break
+                pending.append(pool.submit(_extract_pdf_pages, source, start,
+                                           min(start + size, page_count), chain))
+            if not pending:
+                return
+            yield from pending.pop(0).result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _pdf_units(file_path: FileSource, parallel: Optional[bool],
+               max_workers: Optional[int]) -> Iterator[str]:
+    chain = _pdf_extractors()
+    with _open_buffer(file_path) as view, _open_pdf(file_path, view, chain) as document:
+        page_count = document.page_count
+        if parallel is None:
+            parallel = _is_path(file_path) and page_count >= PARALLEL_PDF_MIN_PAGES
+        workers = max_workers or os.cpu_count() or 1
+        if parallel and workers > 1 and page_count > 1:
+            source = _pdf_worker_source(file_path, view)
+        else:
+            for index in range(page_count):
+                yield document.page_text(index)
+            return
+    yield from _iter_pdf_parallel(source, page_count, workers, chain)
+
+
+def _docx_paragraphs(file_path: FileSource) -> Iterator[tuple]:
+    """Yield ``(page, text)`` for the non-empty paragraphs and table rows of a
+    DOCX file (see ``docx_reader.iter_docx``).
+    
+    Word documents have no fixed pages; page numbers follow explicit page
+    breaks and the page breaks Word recorded when the file was last saved.
+    """
+    from .docx_reader import iter_docx
+    
+    with _open_buffer(file_path) as view:
+        for block in iter_docx(_BufferReader(view)):
+            yield block.page, block.text
+
+
+def _txt_pages(file_path: FileSource) -> Iterator[str]:
+    """Yield form-feed separated pages of a text file, decoding it incrementally."""
+    with _open_buffer(file_path) as view:
+        stream = io.TextIOWrapper(io.BufferedReader(_BufferReader(view)), encoding='utf-8')
+        with stream:
+            buffer = ""
+            while True:
+                block = stream.read(65536)
+                if not block:
+                    break
+                buffer += block
+                *pages, buffer = buffer.split("\f")
+                yield from pages
+            yield buffer
+
+
+def _limit(units: Iterator[Dict[str, Any]], max_chars: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """Stop once ``max_chars`` characters were yielded, cutting the last unit."""
+    remaining = max_chars
+    for unit in units:
+        if remaining is not None and len(unit["text"]) >= remaining:
+            truncated = len(unit["text"]) > remaining
+            unit["text"] = unit["text"][:remaining]
+            unit["truncated"] = truncated
+            yield unit
+            return
+        if remaining is not None:
+            remaining -= len(unit["text"])
+        unit["truncated"] = False
+        yield unit
+
+
+def _resolve_file_type(file_path: FileSource, file_type: Optional[str]) -> str:
+    """Check ``file_type`` or derive it from the file extension."""
+    if file_type is None:
+        if not _is_path(file_path):
+            raise FileParsingError("file_type is required for file objects and buffers")
+        extension = Path(file_path).suffix.lower()
+        file_type = {'.pdf': 'pdf', '.docx': 'docx', '.doc': 'docx', '.txt': 'txt'}.get(extension)
+        if file_type is None:
+            raise FileParsingError(f"Unsupported file type: {extension}")
+    if file_type not in ('pdf', 'docx', 'txt'):
+        raise FileParsingError(f"Unsupported file type: {file_type}")
+    return file_type
+
+
+def _docx_pages(file_path: FileSource) -> Iterator[str]:
+    """Group DOCX paragraphs into pages (see ``_docx_paragraphs``)."""
+    page, lines = 0, []
+    for paragraph_page, text in _docx_paragraphs(file_path):
+        while page < paragraph_page:
+            yield "\n".join(lines)
+            page, lines = page + 1, []
+        lines.append(text)
+    yield "\n".join(lines)
+
+
+def _budgeted(units: Iterator[Dict[str, Any]], file_type: str, max_chars: Optional[int],
+              max_tokens: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """Apply the character/token budget and report parser failures uniformly."""
+    from .chunking import CHARS_PER_TOKEN
+    
+    if max_tokens is not None:
+        token_chars = max_tokens * CHARS_PER_TOKEN
+        max_chars = token_chars if max_chars is None else min(max_chars, token_chars)
+    try:
+        yield from _limit(units, max_chars)
+    except FileParsingError:
+        raise
+    except Exception as e:
+        raise FileParsingError(f"Failed to parse {file_type.upper()}: {str(e)}")
+
+
+_library_versions: Dict[str, str] = {}
+
+
+def _library_version(distribution: str) -> str:
+    version = _library_versions.get(distribution)
+    if version is None:
+        from importlib import metadata
+        
+        try:
+            version = metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        _library_versions[distribution] = version
+    return version
+
+
+def _parser_version(file_type: str) -> str:
+    """``PARSER_VERSION`` plus the versions of the libraries extracting ``file_type``."""
+    distributions = []
+    if file_type == 'pdf':
+        distributions = [extractor.distribution for extractor in _pdf_extractors()]
+    return "/".join([PARSER_VERSION] + [f"{distribution}-{_library_version(distribution)}"
+                                        for distribution in distributions])
+
+
+def _extraction_key(file_path: FileSource, file_type: str, pages: bool = False) -> str:
+    """Cache key for the text (or page texts) of a file: hash of its raw bytes,
+    type and parser version."""
+    with _open_buffer(file_path) as view:
+        digest = hashlib.sha256(view).hexdigest()
+    variant = file_type
+    if file_type == 'txt' and _is_path(file_path) and not pages:
+        # parse_txt translates newlines only for paths
+        variant = 'txt-universal-newlines'
+    if pages:
+        variant += '-pages'
+    return hashlib.sha256(
+        f"{variant}:{_parser_version(file_type)}:{digest}".encode("utf-8")
+    ).hexdigest()
+
+
+def make_extraction_cache(path: Optional[Union[str, Path]] = DEFAULT_EXTRACTION_CACHE,
+                          max_entries: int = 32,
+                          max_bytes: int = 256 * 1024 * 1024) -> "TieredCache":
+    """
+    Build a cache for ``FileParser.parse_file`` and ``parse_uploaded_file``.
+    
+    Args:
+        path: SQLite file for the on-disk tier (None for memory only)
+        max_entries: Extracted texts kept in the in-memory LRU tier
+        max_bytes: Size cap of the on-disk tier; least recently used texts
+            are evicted
+            
+    Returns:
+        A ``TieredCache`` with a memory tier in front of the disk tier
+    """
+    from .cache import MemoryCache, SQLiteCache, TieredCache
+    
+    disk = SQLiteCache(path, max_bytes=max_bytes) if path is not None else None
+    return TieredCache(MemoryCache(max_entries=max_entries), disk)
+
+
 class FileParser:
     """
     Utility class for parsing different file formats.
     """
     
     @staticmethod
-    def parse_pdf(file_path: Union[str, Path, io.BytesIO]) -> str:
+    def parse_pdf(file_path: FileSource, parallel: Optional[bool] = None,
+                  max_workers: Optional[int] = None) -> str:
         """
         Extract text from PDF file.
         
         Args:
-            file_path: Path to PDF file or BytesIO object
+            file_path: Path to PDF file, file object or bytes-like buffer
+            parallel: Extract pages in a process pool shared between calls.
+                None (the default) does so for paths to documents with at
+                least ``PARALLEL_PDF_MIN_PAGES`` pages
+            max_workers: Worker processes for parallel extraction (default:
+                CPU count)
             
         Returns:
             Extracted text content
@@ -33,39 +468,42 @@ class FileParser:
         Raises:
             FileParsingError: If PDF parsing fails
         """
-        try:
-            import PyPDF2
-        except ImportError:
-            raise FileParsingError(
-                "PyPDF2 is not installed. Install with: pip install PyPDF2"
-            )
+        chain = _pdf_extractors()
         
         try:
-            if isinstance(file_path, io.BytesIO):
-                reader = PyPDF2.PdfReader(file_path)
-            else:
-                with open(file_path, 'rb') as file:
-                    reader = PyPDF2.PdfReader(file)
-                    text_content = []
-                    for page in reader.pages:
-                        text_content.append(page.extract_text())
-                    return "\n".join(text_content)
-            
-            text_content = []
-            for page in reader.pages:
-                text_content.append(page.extract_text())
-            return "\n".join(text_content)
-            
+            with _open_buffer(file_path) as view, _open_pdf(file_path, view, chain) as document:
+                page_count = document.page_count
+                if parallel is None:
+                    parallel = _is_path(file_path) and page_count >= PARALLEL_PDF_MIN_PAGES
+                workers = max_workers or os.cpu_count() or 1
+                if parallel and workers > 1 and page_count > 1:
+                    from concurrent.futures.process import BrokenProcessPool
+                    
+                    pool = _get_pdf_pool(workers)
+                    try:
+                        source = _pdf_worker_source(file_path, view)
+                        return "\n".join(_extract_pdf_parallel(pool, source, page_count,
+                                                               workers, chain))
+                    except (BrokenProcessPool, OSError):
+                        # No usable worker processes here; extract in this process
+                        _discard_pdf_pool(pool)
+                
+                text_content = []
+                for index in range(page_count):
+                    text_content.append(document.page_text(index))
+                return "\n".join(text_content)
+        
         except Exception as e:
             raise FileParsingError(f"Failed to parse PDF: {str(e)}")
     
     @staticmethod
-    def parse_docx(file_path: Union[str, Path, io.BytesIO]) -> str:
+    def parse_docx(file_path: FileSource) -> str:
         """
-        Extract text from DOCX file.
+        Extract text from DOCX file: headers, body paragraphs and table
+        rows, footnotes, endnotes and footers, one per line.
         
         Args:
-            file_path: Path to DOCX file or BytesIO object
+            file_path: Path to DOCX file, file object or bytes-like buffer
             
         Returns:
             Extracted text content
@@ -73,23 +511,11 @@ class FileParser:
         Raises:
             FileParsingError: If DOCX parsing fails
         """
-        try:
-            import docx
-        except ImportError:
-            raise FileParsingError(
-                "python-docx is not installed. Install with: pip install python-docx"
-            )
+        from .docx_reader import iter_docx
         
         try:
-            if isinstance(file_path, io.BytesIO):
-                doc = docx.Document(file_path)
-            else:
-                doc = docx.Document(file_path)
-            
-            text_content = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_content.append(paragraph.text)
+            with _open_buffer(file_path) as view:
+                text_content = [block.text for block in iter_docx(_BufferReader(view))]
             
             return "\n".join(text_content)
             
@@ -97,12 +523,12 @@ class FileParser:
             raise FileParsingError(f"Failed to parse DOCX: {str(e)}")
     
     @staticmethod
-    def parse_txt(file_path: Union[str, Path, io.BytesIO]) -> str:
+    def parse_txt(file_path: FileSource) -> str:
         """
         Read text from TXT file.
         
         Args:
-            file_path: Path to TXT file or BytesIO object
+            file_path: Path to TXT file, file object or bytes-like buffer
             
         Returns:
             File content
@@ -111,23 +537,108 @@ class FileParser:
             FileParsingError: If TXT reading fails
         """
         try:
-            if isinstance(file_path, io.BytesIO):
-                return file_path.read().decode('utf-8')
-            else:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-                    
+            with _open_buffer(file_path) as view:
+                text = str(view, 'utf-8')
+            if _is_path(file_path) and '\r' in text:
+                # Files are read with universal newlines
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
+        
         except Exception as e:
             raise FileParsingError(f"Failed to read TXT: {str(e)}")
     
     @staticmethod
-    def parse_file(file_path: Union[str, Path], file_type: str = None) -> Dict[str, Any]:
+    def iter_pages(file_path: FileSource, file_type: Optional[str] = None,
+                   max_chars: Optional[int] = None, max_tokens: Optional[int] = None,
+                   parallel: Optional[bool] = None,
+                   max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a document page by page.
+        
+        PDF pages are extracted as they are requested (or, in parallel mode,
+        a few pages ahead in the worker pool). DOCX pages follow the document's
+        page breaks; text files are split on form feeds.
+        
+        Args:
+            file_path: Path to file, file object or bytes-like buffer
+            file_type: 'pdf', 'docx' or 'txt' (required unless a path is given)
+            max_chars: Stop after this many characters; the last page is cut
+            max_tokens: Stop after about this many model tokens
+            parallel: PDF only, as for ``parse_pdf``
+            max_workers: PDF only, as for ``parse_pdf``
+            
+        Yields:
+            Dictionaries with the page "index" (from 0), its "text" and
+            "truncated" (True when the budget cut the page short)
+            
+        Raises:
+            FileParsingError: If the file cannot be parsed
+        """
+        file_type = _resolve_file_type(file_path, file_type)
+        if file_type == 'pdf':
+            pages = _pdf_units(file_path, parallel, max_workers)
+        elif file_type == 'docx':
+            pages = _docx_pages(file_path)
+        else:
+            pages = _txt_pages(file_path)
+        units = ({"index": index, "text": text} for index, text in enumerate(pages))
+        yield from _budgeted(units, file_type, max_chars, max_tokens)
+    
+    @staticmethod
+    def iter_paragraphs(file_path: FileSource, file_type: Optional[str] = None,
+                        max_chars: Optional[int] = None, max_tokens: Optional[int] = None,
+                        parallel: Optional[bool] = None,
+                        max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the non-empty paragraphs of a document.
+        
+        Paragraphs are blank-line separated blocks for PDF and text files and
+        Word paragraphs and table rows for DOCX files.
+        
+        Args:
+            file_path: Path to file, file object or bytes-like buffer
+            file_type: 'pdf', 'docx' or 'txt' (required unless a path is given)
+            max_chars: Stop after this many characters; the last paragraph is cut
+            max_tokens: Stop after about this many model tokens
+            parallel: PDF only, as for ``parse_pdf``
+            max_workers: PDF only, as for ``parse_pdf``
+            
+        Yields:
+            Dictionaries with the paragraph "index" (from 0), the "page" index
+            it starts on, its "text" and "truncated"
+            
+        Raises:
+            FileParsingError: If the file cannot be parsed
+        """
+        file_type = _resolve_file_type(file_path, file_type)
+        if file_type == 'docx':
+            paragraphs = _docx_paragraphs(file_path)
+        else:
+            pages = (_pdf_units(file_path, parallel, max_workers) if file_type == 'pdf'
+                     else _txt_pages(file_path))
+            paragraphs = ((page, block.strip()) for page, text in enumerate(pages)
+                          for block in _PARAGRAPH_SPLIT.split(text) if block.strip())
+        units = ({"index": index, "page": page, "text": text}
+                 for index, (page, text) in enumerate(paragraphs))
+        yield from _budgeted(units, file_type, max_chars, max_tokens)
+    
+    @staticmethod
+    def parse_file(file_path: Union[str, Path], file_type: str = None,
+                   parallel_pdf: Optional[bool] = None,
+                   cache: Optional["ResponseCache"] = None,
+                   normalize: bool = False) -> Dict[str, Any]:
         """
         Auto-detect and parse file based on extension.
         
         Args:
             file_path: Path to file
             file_type: Optional file type override ('pdf', 'docx', 'txt')
+            parallel_pdf: Passed to ``parse_pdf`` as ``parallel`` (by default,
+                long PDFs are extracted in parallel)
+            cache: Extraction cache (see ``make_extraction_cache``); files
+                with the same bytes are extracted only once
+            normalize: Return normalized text (see ``normalize.normalize_pages``)
+                and its statistics under "normalization"
             
         Returns:
             Dictionary with success status and extracted text
@@ -151,17 +662,14 @@ class FileParser:
         
         # Parse based on type
         try:
-            if file_type == 'pdf':
-                text = FileParser.parse_pdf(file_path)
-            elif file_type == 'docx':
-                text = FileParser.parse_docx(file_path)
-            elif file_type == 'txt':
-                text = FileParser.parse_txt(file_path)
-            else:
+            if file_type not in ('pdf', 'docx', 'txt'):
                 return {
                     "success": False,
                     "error": f"Unsupported file type: {file_type}"
                 }
+            if normalize:
+                return _normalized_result(file_path, file_type, cache, parallel_pdf, path.name)
+            text = _extract(file_path, file_type, cache, parallel_pdf)
             
             return {
                 "success": True,
@@ -182,37 +690,47 @@ class FileParser:
             }
     
     @staticmethod
-    def parse_uploaded_file(file_bytes: bytes, filename: str) -> Dict[str, Any]:
+    def parse_uploaded_file(file_bytes: Union[bytes, bytearray, memoryview, mmap.mmap],
+                            filename: str,
+                            cache: Optional["ResponseCache"] = None,
+                            normalize: bool = False) -> Dict[str, Any]:
         """
         Parse file from uploaded bytes (useful for web frameworks).
         
+        PDFs are always extracted in the calling process: this runs inside
+        web servers, where forking worker processes is not wanted.
+        
         Args:
-            file_bytes: File content as bytes
+            file_bytes: File content as bytes, bytearray, memoryview or mmap
+                (parsed in place, without copying)
             filename: Original filename (used to detect type)
+            cache: Extraction cache (see ``make_extraction_cache``); uploads
+                with the same bytes are extracted only once
+            normalize: As for ``parse_file``
             
         Returns:
             Dictionary with success status and extracted text
         """
-        file_obj = io.BytesIO(file_bytes)
+        file_obj = file_bytes
         
         # Detect file type from filename
         extension = Path(filename).suffix.lower()
         
         try:
             if extension == '.pdf':
-                text = FileParser.parse_pdf(file_obj)
                 file_type = 'pdf'
             elif extension in ['.docx', '.doc']:
-                text = FileParser.parse_docx(file_obj)
                 file_type = 'docx'
             elif extension == '.txt':
-                text = FileParser.parse_txt(file_obj)
                 file_type = 'txt'
             else:
                 return {
                     "success": False,
                     "error": f"Unsupported file type: {extension}"
                 }
+            if normalize:
+                return _normalized_result(file_obj, file_type, cache, False, filename)
+            text = _extract(file_obj, file_type, cache, parallel_pdf=False)
             
             return {
                 "success": True,
@@ -233,6 +751,69 @@ class FileParser:
             }
 
 
+def _extract(file_path: FileSource, file_type: str, cache: Optional["ResponseCache"],
+             parallel_pdf: Optional[bool] = None) -> str:
+    """Extract text with the ``FileParser`` method for ``file_type``, through ``cache``."""
+    key = None
+    if cache is not None:
+        try:
+            key = _extraction_key(file_path, file_type)
+        except OSError:
+            # Unreadable file; let the parser report it
+            key = None
+        if key is not None:
+            text = cache.get(key)
+            if text is not None:
+                return text
+    if file_type == 'pdf':
+        text = FileParser.parse_pdf(file_path, parallel=parallel_pdf)
+    elif file_type == 'docx':
+        text = FileParser.parse_docx(file_path)
+    else:
+        text = FileParser.parse_txt(file_path)
+    if key is not None:
+        cache.set(key, text)
+    return text
+
+
+def _extract_pages(file_path: FileSource, file_type: str, cache: Optional["ResponseCache"],
+                   parallel_pdf: Optional[bool] = None) -> List[str]:
+    """Extract the page texts of a file (see ``FileParser.iter_pages``), through ``cache``."""
+    import json
+    
+    key = None
+    if cache is not None:
+        try:
+            key = _extraction_key(file_path, file_type, pages=True)
+        except OSError:
+            key = None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return json.loads(cached)
+    pages = [page["text"] for page in FileParser.iter_pages(file_path, file_type,
+                                                             parallel=parallel_pdf)]
+    if key is not None:
+        cache.set(key, json.dumps(pages))
+    return pages
+
+
+def _normalized_result(file_path: FileSource, file_type: str, cache: Optional["ResponseCache"],
+                       parallel_pdf: Optional[bool], file_name: str) -> Dict[str, Any]:
+    """``parse_file`` result with normalized text; header and footer detection
+    needs the page texts, so these are extracted (and cached) instead."""
+    from .normalize import normalize_pages
+    
+    normalized = normalize_pages(_extract_pages(file_path, file_type, cache, parallel_pdf))
+    return {
+        "success": True,
+        "text": normalized.text,
+        "file_type": file_type,
+        "file_name": file_name,
+        "normalization": normalized.stats
+    }
+
+
 # Convenience function for quick file analysis
 def analyze_file_quick(api_key: str, file_path: str) -> Dict[str, Any]:
     """
@@ -0,0 +1,241 @@
+# lexiguard_sdk/hedging.py
+"""
+Hedged requests for LexiGuard SDK
+
+A hedged call sends the request once and, if no answer has arrived after an
+adaptive delay (by default the observed p95 latency), sends a duplicate,
+optionally to a faster fallback model. Whichever answer arrives first is used
+and the other call is cancelled. A hedge budget caps the share of calls that
+may be duplicated, so the extra cost stays bounded.
+
+Usage:
+    from lexiguard_sdk import LexiGuard
+    from lexiguard_sdk.hedging import HedgePolicy
+
+    hedging = HedgePolicy(max_hedge_rate=0.05, fallback_model="models/gemini-2.5-flash-lite")
+    lg = LexiGuard(api_key="YOUR_API_KEY", hedge_policy=hedging)
+    ...
+    print(hedging.stats())
+
+Synchronous backends cannot abort a call that is already running, so in the
+threaded client the losing call finishes in the background and its answer is
+discarded; it keeps its rate-limiter slot until then. The async client
+cancels the losing task.
+
+The hedging delay adapts to how long first calls take to succeed, including
+first calls that lost to their hedge (threaded client) and leaving out those
+that were cancelled (async client), so hedging never pulls its own threshold
+down.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import threading
+import time
+
+from .hooks import percentile
+
+
+class HedgePolicy:
+    """
+    Adaptive hedging delay, hedge budget and win statistics.
+
+    Safe to share between threads and between a sync and an async client.
+    """
+
+    def __init__(self, percentile: float = 0.95, initial_delay: float = 2.0,
+                 min_delay: float = 0.05, max_delay: float = 60.0,
+                 max_hedge_rate: float = 0.05, burst: float = 10.0,
+                 fallback_model: Optional[str] = None, window: int = 500,
+                 min_samples: int = 20, max_workers: int = 64):
+        """
+        Args:
+            percentile: Latency percentile after which a call is hedged
+            initial_delay: Hedging delay until ``min_samples`` latencies are known
+            min_delay: Lower bound for the hedging delay, in seconds
+            max_delay: Upper bound for the hedging delay, in seconds
+            max_hedge_rate: Long-run fraction of calls that may be hedged
+            burst: Hedges that may be spent at once after a quiet period
+            fallback_model: Model for the duplicate call (defaults to the
+                client's model)
+            window: Number of recent latencies the percentile is computed over
+            min_samples: Latencies required before the delay adapts
+            max_workers: Threads the threaded client runs model calls on while
+                hedging is enabled; keep it above the number of concurrent calls
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if max_hedge_rate < 0:
+            raise ValueError("max_hedge_rate cannot be negative")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_hedge_rate = max_hedge_rate
+        self.burst = burst
+        self.fallback_model = fallback_model
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+        self._latencies: deque = deque(maxlen=window)
+        self._budget = 0.0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def delay(self) -> float:
+        """Seconds to wait for the first call before hedging."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                delay = percentile(self._latencies, self.percentile)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def observe(self, seconds: float) -> None:
+        """Record how long a first (non-hedge) call took to resolve."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def observe_first_call(self, call: Any, started: float) -> None:
+        """
+        Feed the latency of a first call (a future or task started at
+        ``started``, a ``time.monotonic()`` value) to ``observe`` once it
+        succeeds, even if a hedge has already won.
+        """
+        def done(finished: Any) -> None:
+            if not finished.cancelled() and finished.exception() is None:
+                self.observe(time.monotonic() - started)
+
+        call.add_done_callback(done)
+
+    def start_call(self) -> None:
+        """Count a call and earn hedge budget for it."""
+        with self._lock:
+            self.calls += 1
+            self._budget = min(self.burst, self._budget + self.max_hedge_rate)
+
+    def try_hedge(self) -> bool:
+        """Spend budget on a hedge; False when the hedge rate cap is reached."""
+        with self._lock:
+            if self._budget < 1.0:
+                return False
+            self._budget -= 1.0
+            self.hedged += 1
+            return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool running hedged calls for the threaded client."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="lexiguard-hedge")
+            return self._executor
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hedging statistics.
+
+        Returns:
+            Dictionary with calls, hedged calls, hedges that won, the hedge
+            rate, the win rate and the current hedging delay in seconds
+        """
+        delay = self.delay()
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": (self.hedged / self.calls) if self.calls else 0.0,
+                "win_rate": (self.hedge_wins / self.hedged) if self.hedged else 0.0,
+                "delay": delay,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the hedging thread pool (running calls are not interrupted)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def run_hedged(policy: HedgePolicy, primary: Callable[[], Any],
+               hedge: Callable[[], Any]) -> Tuple[Any, bool, bool]:
+    """
+    Run ``primary`` in the policy's thread pool, hedging with ``hedge`` if it
+    is slow.
+
+    Returns:
+        ``(result, hedged, hedge_won)``
+
+    Raises:
+        The first call's exception when every call failed
+    """
+    policy.start_call()
+    started = time.monotonic()
+    first = policy.executor.submit(primary)
+    policy.observe_first_call(first, started)
+    done, _ = wait([first], timeout=policy.delay())
+    if done or not policy.try_hedge():
+        return first.result(), False, False
+
+    second = policy.executor.submit(hedge)
+    pending = {first, second}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in _first_call_first(done, first):
+            if future.exception() is None:
+                for other in pending:
+                    other.cancel()
+                won = future is second
+                if won:
+                    policy.record_win()
+                return future.result(), True, won
+    raise first.exception()
+
+
+async def run_hedged_async(policy: HedgePolicy, primary: Callable[[], Awaitable[Any]],
+                           hedge: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool, bool]:
+    """
+    Awaitable ``run_hedged``; the losing call is cancelled.
+    """
+    import asyncio
+
+    policy.start_call()
+    started = time.monotonic()
+    first = asyncio.ensure_future(primary())
+    policy.observe_first_call(first, started)
+    try:
+        done, _ = await asyncio.wait({first}, timeout=policy.delay())
+        if done or not policy.try_hedge():
+            return await first, False, False
+
+        second = asyncio.ensure_future(hedge())
+        pending = {first, second}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in _first_call_first(done, first):
+                    if task.exception() is None:
+                        won = task is second
+                        if won:
+                            policy.record_win()
+                        return task.result(), True, won
+            raise first.exception()
+        finally:
+            second.cancel()
+    finally:
+        first.cancel()
+
+
+def _first_call_first(done: Any, first: Any) -> list:
+    """Order completed calls so the first call wins ties."""
+    return sorted(done, key=lambda call: call is not first)
@@ -0,0 +1,242 @@
+# lexiguard_sdk/hooks.py
+"""
+Instrumentation hooks for LexiGuard SDK
+
+Every SDK call produces one ``CallRecord``. Hooks registered on a client are
+told when the request starts (``before_request``), when a response has been
+turned into a result (``after_response``) and when the model call fails
+(``on_error``). The record breaks the call down into prompt building, model
+time, rate-limit/backoff waits and parsing, and carries prompt and response
+sizes, token usage, cache status and parse outcome.
+
+Usage:
+    from lexiguard_sdk import LexiGuard
+    from lexiguard_sdk.hooks import Hooks, MetricsHooks
+
+    class PrintHooks(Hooks):
+        def after_response(self, record):
+            print(record.method, round(record.latency, 3), record.cache, record.parse)
+
+    metrics = MetricsHooks()
+    lg = LexiGuard(api_key="YOUR_API_KEY", hooks=[PrintHooks(), metrics])
+    ...
+    print(metrics.snapshot())
+"""
+
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional, Sequence
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_DISABLED = "disabled"
+CACHE_COALESCED = "coalesced"
+
+PARSE_OK = "ok"
+PARSE_FAILED = "failed"
+
+
+@dataclass
+class CallRecord:
+    """
+    Measurements for one SDK call.
+
+    Attributes:
+        method: SDK operation name (e.g. "analyze_clauses")
+        model_name: Model that served the call
+        stream: Whether the call was streamed
+        prompt_chars: Prompt size in characters
+        prompt_tokens_estimate: Prompt size estimated before the call
+        build_seconds: Time spent building and validating the prompt
+        model_seconds: Time spent inside the backend, summed over attempts
+        first_chunk_seconds: Time from request start to the first streamed chunk
+        parse_seconds: Time spent cleaning and parsing the response
+        latency: Wall time from the start of prompt building to the result
+        attempts: Backend calls made (0 on a cache hit or a coalesced call,
+            >1 after retries)
+        hedged: Whether a duplicate (hedge) request was sent
+        hedge_won: Whether the hedge answered first
+        route: Routing rule that picked the model (None without routing)
+        escalated: Whether the response failed validation and the call was
+            retried on the escalation model
+        cache: "hit", "miss", "disabled", or "coalesced" when the response was
+            shared from an identical call already in flight
+        response_chars: Response size in characters
+        prompt_tokens: Input tokens reported by the backend
+        output_tokens: Output tokens reported by the backend
+        parse: "ok", "failed", or None when no response was received
+        success: Whether the call produced a successful result
+        error: Error message for failed calls
+        started_at: Unix timestamp when the call started
+    """
+    method: str
+    model_name: str
+    stream: bool = False
+    prompt_chars: int = 0
+    prompt_tokens_estimate: int = 0
+    build_seconds: float = 0.0
+    model_seconds: float = 0.0
+    first_chunk_seconds: Optional[float] = None
+    parse_seconds: float = 0.0
+    latency: float = 0.0
+    attempts: int = 0
+    hedged: bool = False
+    hedge_won: bool = False
+    route: Optional[str] = None
+    escalated: bool = False
+    cache: str = CACHE_DISABLED
+    response_chars: Optional[int] = None
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    parse: Optional[str] = None
+    success: Optional[bool] = None
+    error: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def wait_seconds(self) -> float:
+        """Time not accounted for by building, the model or parsing
+        (rate limiting, retry backoff, cache lookups)."""
+        return max(0.0, self.latency - self.build_seconds
+                   - self.model_seconds - self.parse_seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["wait_seconds"] = self.wait_seconds
+        return data
+
+
+class Hooks:
+    """
+    Base class for instrumentation hooks; override any of the methods.
+
+    Hooks run synchronously on the thread (or event loop) making the call, so
+    they should be quick. Exceptions raised by a hook are logged and ignored.
+    """
+
+    def before_request(self, record: CallRecord) -> None:
+        """Called once the prompt is built, before the cache or model is consulted."""
+        pass
+
+    def after_response(self, record: CallRecord) -> None:
+        """Called with the finished record when a response was received
+        (including responses that failed to parse)."""
+        pass
+
+    def on_error(self, record: CallRecord, error: BaseException) -> None:
+        """Called when the model call itself failed after any retries."""
+        pass
+
+
+def dispatch(hooks: Sequence[Hooks], event: str, *args) -> None:
+    """Call ``event`` on every hook, logging and swallowing hook exceptions."""
+    for hook in hooks:
+        try:
+            getattr(hook, event)(*args)
+        except Exception:
+            logger.exception("LexiGuard hook %r failed in %s", hook, event)
+
+
+def percentile(values: Sequence[float], fraction: float) -> Optional[float]:
+    """
+    Nearest-rank percentile of ``values`` (``fraction`` 0.95 for p95).
+
+    Shared by the metrics hooks, routing statistics, the hedge delay and the
+    benchmarks, so they all report the same number for the same samples.
+
+    Returns:
+        The percentile, or None when ``values`` is empty
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class MetricsHooks(Hooks):
+    """
+    Hooks that aggregate per-method counters and latency percentiles in memory.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window: Number of recent latencies kept per method for percentiles
+        """
+        self.window = window
+        self._methods: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, method: str) -> Dict[str, Any]:
+        entry = self._methods.get(method)
+        if entry is None:
+            entry = {
+                "calls": 0, "errors": 0, "parse_failures": 0, "cache_hits": 0,
+                "coalesced": 0, "retries": 0, "hedged": 0, "hedge_wins": 0, "escalations": 0,
+                "prompt_tokens": 0, "output_tokens": 0,
+                "latencies": deque(maxlen=self.window),
+                "model_seconds": deque(maxlen=self.window),
+            }
+            self._methods[method] = entry
+        return entry
+
+    def after_response(self, record: CallRecord) -> None:
+        with self._lock:
+            entry = self._entry(record.method)
+            entry["calls"] += 1
+            entry["retries"] += max(0, record.attempts - 1)
+            if record.cache == CACHE_HIT:
+                entry["cache_hits"] += 1
+            elif record.cache == CACHE_COALESCED:
+                entry["coalesced"] += 1
+            if record.parse == PARSE_FAILED:
+                entry["parse_failures"] += 1
+            entry["hedged"] += record.hedged
+            entry["hedge_wins"] += record.hedge_won
+            entry["escalations"] += record.escalated
+            entry["prompt_tokens"] += record.prompt_tokens or 0
+            entry["output_tokens"] += record.output_tokens or 0
+            entry["latencies"].append(record.latency)
+            if record.attempts:
+                entry["model_seconds"].append(record.model_seconds)
+
+    def on_error(self, record: CallRecord, error: BaseException) -> None:
+        with self._lock:
+            entry = self._entry(record.method)
+            entry["calls"] += 1
+            entry["errors"] += 1
+            entry["retries"] += max(0, record.attempts - 1)
+            entry["latencies"].append(record.latency)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregated metrics.
+
+        Returns:
+            Per-method dictionary with call/error/parse-failure/cache-hit/retry
+            counts, token totals, and p50/p95/p99 latency and model time in seconds
+        """
+        with self._lock:
+            snapshot = {}
+            for method, entry in self._methods.items():
+                latencies = list(entry["latencies"])
+                model_seconds = list(entry["model_seconds"])
+                snapshot[method] = {
+                    key: entry[key] for key in ("calls", "errors", "parse_failures",
+                                                "cache_hits", "coalesced", "retries",
+                                                "hedged", "hedge_wins", "escalations",
+                                                "prompt_tokens", "output_tokens")
+                }
+                for prefix, values in (("latency", latencies), ("model", model_seconds)):
+                    for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                        snapshot[method][f"{prefix}_{name}"] = percentile(values, fraction)
+            return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
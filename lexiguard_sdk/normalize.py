@@ -0,0 +1,358 @@
+# lexiguard_sdk/normalize.py
+"""
+Token-reducing text normalization for LexiGuard SDK
+
+Extracted text carries a lot that is billed as input tokens on every model
+call without telling the model anything: running headers and footers on
+every page, page numbers, words hyphenated across line breaks and runs of
+whitespace left over from the PDF layout. ``normalize_pages`` removes them in
+three passes:
+
+    1. lines repeated at the top or bottom of most pages (running headers
+       and footers) and page numbers there are dropped
+    2. words hyphenated across a line break are joined ("termi-\\nnation")
+       and soft hyphens are removed
+    3. runs of spaces and tabs become one space, indentation and trailing
+       spaces are dropped and runs of blank lines become one blank line
+
+The result keeps a map from positions in the normalized text back to the
+original, so offsets found in the normalized text (a quoted clause, a
+redaction) can be shown in the document as extracted:
+
+    pages = [page["text"] for page in FileParser.iter_pages("contract.pdf")]
+    normalized = normalize_pages(pages)
+    result = lg.analyze_text(normalized.text)
+    start, end = normalized.original_span(match.start(), match.end())
+    print(normalized.stats["token_savings"])
+
+``FileParser.parse_file(..., normalize=True)`` runs the same pipeline and
+reports the statistics with the parsed text.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import math
+import re
+
+from .chunking import estimate_tokens
+
+# A line counts as a running header or footer when it appears at the top or
+# bottom of at least this share of pages, in documents of HEADER_MIN_PAGES+
+HEADER_MIN_FRACTION = 0.5
+HEADER_MIN_PAGES = 3
+
+# Non-blank lines at each end of a page that can be headers or footers
+EDGE_LINES = 3
+
+# Non-blank lines at each end of a page that can be page numbers
+_PAGE_NUMBER_LINES = 2
+
+# Longer lines are body text, however often they repeat
+_MAX_HEADER_CHARS = 100
+
+# Numbers in a (casefolded) header or footer line that can be its page
+# number: after "page", before "of N" or "/N", or alone at either end
+_HEADER_PAGE_NUMBER = re.compile(
+    r"(?:(?<=page)|(?<=page )|^)\d{1,4}\b"
+    r"|\b\d{1,4}(?= ?(?:of|/) ?\d)"
+    r"|\b(?<!of )(?<!/ )(?<!/)\d{1,4}$"
+)
+
+# "7", "- 7 -", "Page 7", "Page 7 of 12", "7/12", "vii"
+_PAGE_NUMBER = re.compile(
+    r"(?:(?i:page)\s*)?[-–—]?\s*"
+    r"(?:\d{1,4}|(?=[ivxlcdm])m{0,3}(?:cm|cd|d?c{0,3})(?:xc|xl|l?x{0,3})(?:ix|iv|v?i{0,3}))"
+    r"\s*[-–—]?(?:\s*(?:(?i:of)|/)\s*\d{1,4})?"
+)
+
+# Soft hyphens, and a hyphen at a line end between two letters
+_HYPHEN_BREAK = re.compile(
+    r"\u00ad(?:[ \t]*\n[ \t]*)?|-(?<=[^\W\d_]-)[ \t]*\n[ \t]*(?=[^\W\d_])"
+)
+
+# The lookahead skips the single spaces between words cheaply
+_WHITESPACE = re.compile(
+    r"(?=[\n\t\r\u00a0]|[ \t\r\u00a0]{2}|[ \t\r\u00a0]$|(?<![^\n]) )"
+    r"(?:(?P<ends>\A\n+|\n+\Z)"
+    r"|(?P<blank>\n(?:[ \t\r\u00a0]*\n){2,})"
+    r"|(?P<edge>^[ \t\r\u00a0]+|[ \t\r\u00a0]+$)"
+    r"|(?P<run>[ \t\r\u00a0]{2,}|[\t\u00a0]))",
+    re.MULTILINE,
+)
+
+# (start, end, replacement) in the text being edited
+_Edit = Tuple[int, int, str]
+
+
+class _Segments:
+    """
+    Map from positions in an edited text back to the text it was made from.
+
+    Stored as three parallel arrays with one entry per stretch of the output
+    that was either copied from the source or written in place of a span of
+    it, so the map stays small next to the text.
+    """
+    __slots__ = ("_starts", "_sources", "_copied")
+
+    def __init__(self):
+        self._starts = array("q")
+        self._sources = array("q")
+        self._copied = array("b")
+
+    def add(self, start: int, source: int, copied: bool) -> None:
+        self._starts.append(start)
+        self._sources.append(source)
+        self._copied.append(copied)
+
+    def map(self, index: int) -> int:
+        # Empty replacements share their start with the next segment, which wins
+        segment = bisect_right(self._starts, index) - 1
+        if self._copied[segment]:
+            return self._sources[segment] + index - self._starts[segment]
+        return self._sources[segment]
+
+
+def _apply(text: str, edits: Iterable[_Edit]) -> Tuple[str, Optional[_Segments]]:
+    """Apply sorted edits to ``text``; overlapping parts of later edits are dropped."""
+    parts: List[str] = []
+    segments = _Segments()
+    position = 0
+    length = 0
+    for start, end, replacement in edits:
+        start = max(start, position)
+        if end <= start:
+            continue
+        if start > position:
+            segments.add(length, position, True)
+            parts.append(text[position:start])
+            length += start - position
+        segments.add(length, start, False)
+        parts.append(replacement)
+        length += len(replacement)
+        position = end
+    if not parts:
+        return text, None
+    # Always close with a copied segment, so the end of the text maps to the end
+    segments.add(length, position, True)
+    parts.append(text[position:])
+    return "".join(parts), segments
+
+
+@dataclass
+class NormalizedText:
+    """
+    Normalized document text.
+
+    Attributes:
+        text: The normalized text
+        original: The text it was made from (the pages joined with newlines)
+        stats: "original_chars", "normalized_chars", "original_tokens",
+            "normalized_tokens", "tokens_saved", "token_savings" (share of
+            tokens removed), and what each pass removed: "header_footer_lines",
+            "page_numbers", "hyphenations" and "whitespace_chars"
+    """
+    text: str = field(repr=False)
+    original: str = field(repr=False)
+    stats: Dict[str, Any]
+    _maps: List[_Segments] = field(default_factory=list, repr=False)
+
+    def original_offset(self, index: int) -> int:
+        """
+        Position in ``original`` of the character at ``index`` in ``text``.
+
+        Characters that replaced a span (a collapsed run of spaces) map to the
+        span's start; ``len(text)`` maps to ``len(original)``.
+
+        Raises:
+            IndexError: If ``index`` is outside ``0..len(text)``
+        """
+        if not 0 <= index <= len(self.text):
+            raise IndexError(f"offset {index} outside normalized text of length {len(self.text)}")
+        for segments in reversed(self._maps):
+            index = segments.map(index)
+        return index
+
+    def original_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Span of ``original`` covering ``text[start:end]``."""
+        first = self.original_offset(start)
+        if end <= start:
+            return first, first
+        return first, self.original_offset(end - 1) + 1
+
+
+def _page_edges(page: str, base: int) -> List[Tuple[int, int, int, str]]:
+    """``(start, end, rank, line)`` of the non-blank lines at either end of a
+    page; ``rank`` counts from the nearer end (0 = first or last line)."""
+    lines = []
+    offset = base
+    for line in page.split("\n"):
+        if line.strip():
+            lines.append((offset, offset + len(line), line.strip()))
+        offset += len(line) + 1
+    edges = {}
+    for rank, (start, end, line) in enumerate(lines[:EDGE_LINES]):
+        edges[start] = (start, end, rank, line)
+    for rank, (start, end, line) in enumerate(reversed(lines[-EDGE_LINES:])):
+        if start not in edges or rank < edges[start][2]:
+            edges[start] = (start, end, rank, line)
+    return [edges[start] for start in sorted(edges)]
+
+
+def _header_keys(line: str, page: int) -> Set[str]:
+    """Keys under which a line can repeat across pages.
+
+    A line is keyed as written and, when it has numbers that can be its page
+    number, once more with each of those keyed by its distance from the page
+    index. So "Page 3" on the third page and "Page 4" on the fourth share a
+    key, a fixed "Version 3" or "2024" repeats as written, and "ARTICLE 1"
+    and "ARTICLE 2" at the top of unrelated pages share neither.
+    """
+    if len(line) > _MAX_HEADER_CHARS:
+        return set()
+    key = " ".join(line.split()).casefold()
+    return {key, _HEADER_PAGE_NUMBER.sub(lambda match: f"#{int(match.group()) - page}", key)}
+
+
+def _is_page_number(rank: int, line: str) -> bool:
+    return rank < _PAGE_NUMBER_LINES and _PAGE_NUMBER.fullmatch(line) is not None
+
+
+def _edge_edits(pages: Sequence[str], original: str, headers: bool, page_numbers: bool,
+                stats: Dict[str, Any]) -> List[_Edit]:
+    """Deletions of running headers, footers and page numbers.
+
+    Both only count when they recur on at least ``HEADER_MIN_FRACTION`` of the
+    pages, so in documents without page numbers a "1" or "iv" on its own line
+    at the top of a page stays.
+    """
+    edges = []
+    counts: Counter = Counter()
+    numbered = 0
+    base = 0
+    for index, page in enumerate(pages):
+        page_edges = _page_edges(page, base)
+        edges.append(page_edges)
+        counts.update(set().union(*(_header_keys(line, index) for _, _, _, line in page_edges)))
+        numbered += any(_is_page_number(rank, line) for _, _, rank, line in page_edges)
+        base += len(page) + 1
+
+    if len(pages) < HEADER_MIN_PAGES:
+        return []
+    needed = max(2, math.ceil(HEADER_MIN_FRACTION * len(pages)))
+    repeated = {key for key, count in counts.items() if count >= needed} if headers else set()
+    page_numbers = page_numbers and numbered >= needed
+
+    edits = []
+    for index, page_edges in enumerate(edges):
+        for start, end, rank, line in page_edges:
+            if _is_page_number(rank, line):
+                if not page_numbers:
+                    continue
+                stats["page_numbers"] += 1
+            elif _header_keys(line, index) & repeated:
+                stats["header_footer_lines"] += 1
+            else:
+                continue
+            # Take the line's newline with it (the one before, on the last line)
+            if end < len(original):
+                edits.append((start, end + 1, ""))
+            else:
+                edits.append((max(start - 1, 0), end, ""))
+    return edits
+
+
+def _hyphen_edits(text: str, stats: Dict[str, Any]) -> Iterable[_Edit]:
+    for match in _HYPHEN_BREAK.finditer(text):
+        if match.group().startswith("-"):
+            # "Smith-\nJones" and "pre-\n2020" keep their hyphen
+            if not text[match.end()].islower():
+                continue
+            stats["hyphenations"] += 1
+        yield match.start(), match.end(), ""
+
+
+def _whitespace_edits(text: str, stats: Dict[str, Any]) -> Iterable[_Edit]:
+    for match in _WHITESPACE.finditer(text):
+        kind = match.lastgroup
+        if kind == "blank":
+            replacement = "\n\n"
+        elif kind == "run":
+            replacement = " "
+        else:
+            replacement = ""
+        if match.group() == replacement:
+            continue
+        stats["whitespace_chars"] += len(match.group()) - len(replacement)
+        yield match.start(), match.end(), replacement
+
+
+def normalize_pages(pages: Iterable[str], headers: bool = True, page_numbers: bool = True,
+                    dehyphenate: bool = True, whitespace: bool = True) -> NormalizedText:
+    """
+    Normalize the page texts of a document (see the module docstring).
+
+    Args:
+        pages: Page texts, e.g. ``FileParser.iter_pages`` texts
+        headers: Drop running headers and footers
+        page_numbers: Drop page numbers at the top or bottom of pages
+        dehyphenate: Join words hyphenated across line breaks
+        whitespace: Collapse whitespace
+
+    Returns:
+        ``NormalizedText``; offsets in ``original`` refer to the pages joined
+        with newlines, which is how ``FileParser.parse_pdf`` joins them
+    """
+    pages = list(pages)
+    original = "\n".join(pages)
+    stats: Dict[str, Any] = {"header_footer_lines": 0, "page_numbers": 0,
+                             "hyphenations": 0, "whitespace_chars": 0}
+    maps = []
+    text = original
+    passes = []
+    if headers or page_numbers:
+        passes.append(lambda text: _edge_edits(pages, text, headers, page_numbers, stats))
+    if dehyphenate:
+        passes.append(lambda text: _hyphen_edits(text, stats))
+    if whitespace:
+        passes.append(lambda text: _whitespace_edits(text, stats))
+    for edits in passes:
+        text, segments = _apply(text, edits(text))
+        if segments is not None:
+            maps.append(segments)
+
+    original_tokens = estimate_tokens(original)
+    normalized_tokens = estimate_tokens(text)
+    stats.update({
+        "original_chars": len(original),
+        "normalized_chars": len(text),
+        "original_tokens": original_tokens,
+        "normalized_tokens": normalized_tokens,
+        "tokens_saved": original_tokens - normalized_tokens,
+        "token_savings": round(1 - normalized_tokens / original_tokens, 4) if original_tokens else 0.0,
+    })
+    return NormalizedText(text, original, stats, maps)
+
+
+def normalize_text(text: str, **options: bool) -> NormalizedText:
+    """
+    Normalize a document given as one string.
+
+    Pages are taken to be separated by form feeds (as in text files and
+    pdftotext output); without them, header and footer detection has a
+    single page to look at and does nothing. ``original`` is ``text``, with
+    the same offsets.
+
+    Args:
+        text: Document text
+        **options: As for ``normalize_pages``
+
+    Returns:
+        ``NormalizedText``
+    """
+    normalized = normalize_pages(text.split("\f"), **options)
+    # A form feed and a newline have the same length, so offsets carry over
+    normalized.original = text
+    return normalized
@@ -0,0 +1,418 @@
+# lexiguard_sdk/operations.py
+"""
+Prompt construction and response parsing for LexiGuard SDK operations.
+
+Each builder validates its inputs and returns an ``Operation``: the prompt to
+send to Gemini plus a ``finish`` callable that turns the raw model text into
+the result dictionary returned to the caller. Keeping these separate from the
+transport lets the sync and async clients share one definition per method.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import json
+
+
+class InvalidInputError(ValueError):
+    """Raised by operation builders when the caller's input is rejected"""
+    pass
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    A single model call prepared by one of the SDK methods.
+
+    Attributes:
+        name: SDK method name (e.g. "analyze_text")
+        prompt: Prompt text to send to the model
+        finish: Callable converting the raw response text into a result dict
+        generation_config: Generation parameters this operation needs on top
+            of the client's own (e.g. JSON response mode)
+    """
+    name: str
+    prompt: str
+    finish: Callable[[str], Dict[str, Any]]
+    generation_config: Optional[Dict[str, Any]] = None
+
+
+def clean_json_response(response: str) -> str:
+    """
+    Strip surrounding whitespace and Markdown code fences from a model response.
+
+    Args:
+        response: Raw response text
+
+    Returns:
+        Text ready for ``json.loads``
+    """
+    response = response.strip()
+    if response.startswith("```json"):
+        response = response[7:]
+    if response.startswith("```"):
+        response = response[3:]
+    if response.endswith("```"):
+        response = response[:-3]
+    return response.strip()
+
+
+def _finish_json(response: str) -> Dict[str, Any]:
+    try:
+        return {
+            "success": True,
+            "data": json.loads(clean_json_response(response))
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def _require_text(text: str) -> None:
+    if not text or not text.strip():
+        raise InvalidInputError("Text cannot be empty")
+
+
+def analyze_text(text: str) -> Operation:
+    """Build the general document analysis operation."""
+    _require_text(text)
+
+    prompt = f"""
+        You are a legal document analysis expert. Analyze the following legal document text:
+
+        {text}
+
+        Provide a comprehensive analysis in JSON format with:
+        1. "summary": Brief overview of the document
+        2. "document_type": Type of legal document
+        3. "key_clauses": List of important clauses
+        4. "potential_risks": List of risks or concerning terms
+        5. "recommendations": List of actionable recommendations
+        6. "parties_involved": List of parties mentioned
+
+        Return ONLY valid JSON.
+        """
+
+    def finish(response: str) -> Dict[str, Any]:
+        response = clean_json_response(response)
+        try:
+            analysis = json.loads(response)
+            return {
+                "success": True,
+                "data": analysis
+            }
+        except json.JSONDecodeError as e:
+            return {
+                "success": False,
+                "error": f"Failed to parse AI response: {str(e)}",
+                "raw_response": response
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    return Operation("analyze_text", prompt, finish)
+
+
+def analyze_clauses(text: str, clause_types: Optional[List[str]] = None) -> Operation:
+    """Build the clause-by-clause analysis operation."""
+    _require_text(text)
+
+    clause_focus = ""
+    if clause_types:
+        clause_focus = f"\nFocus especially on these clause types: {', '.join(clause_types)}"
+
+    prompt = f"""
+        Analyze the following legal document and break it down clause by clause:
+
+        {text}
+        {clause_focus}
+
+        For each significant clause, provide:
+        1. "clause_number": Sequential number
+        2. "clause_title": Short descriptive title
+        3. "clause_text": The actual clause text (excerpt)
+        4. "analysis": Detailed analysis of what this clause means
+        5. "risk_level": "low", "medium", or "high"
+        6. "fairness_score": 1-10 (10 being most fair)
+        7. "concerns": List of specific concerns if any
+
+        Return as JSON with a "clauses" array.
+        """
+
+    def finish(response: str) -> Dict[str, Any]:
+        try:
+            analysis = json.loads(clean_json_response(response))
+            return {
+                "success": True,
+                "data": analysis,
+                "total_clauses": len(analysis.get("clauses", []))
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    return Operation("analyze_clauses", prompt, finish)
+
+
+def analyze_fairness(text: str) -> Operation:
+    """Build the fairness scoring operation."""
+    _require_text(text)
+
+    prompt = f"""
+        Analyze the fairness of this legal document:
+
+        {text}
+
+        Provide a fairness assessment in JSON format:
+        1. "overall_fairness_score": 1-10 (10 being most fair)
+        2. "balance_analysis": Analysis of balance between parties
+        3. "one_sided_clauses": List of clauses that favor one party
+        4. "red_flags": List of concerning terms or conditions
+        5. "power_dynamics": Description of power balance
+        6. "recommendations": How to improve fairness
+
+        Return ONLY valid JSON.
+        """
+
+    return Operation("analyze_fairness", prompt, _finish_json)
+
+
+def analyze_all(text: str, clause_types: Optional[List[str]] = None) -> Operation:
+    """
+    Build the composite operation covering analyze_text, analyze_clauses and
+    analyze_fairness in a single model call.
+    """
+    _require_text(text)
+
+    clause_focus = ""
+    if clause_types:
+        clause_focus = f"\nIn the clause breakdown, focus especially on these clause types: {', '.join(clause_types)}"
+
+    prompt = f"""
+        You are a legal document analysis expert. Analyze the following legal document text:
+
+        {text}
+        {clause_focus}
+
+        Return a single JSON object with exactly these three keys:
+
+        "analysis": an object with
+            1. "summary": Brief overview of the document
+            2. "document_type": Type of legal document
+            3. "key_clauses": List of important clauses
+            4. "potential_risks": List of risks or concerning terms
+            5. "recommendations": List of actionable recommendations
+            6. "parties_involved": List of parties mentioned
+
+        "clauses": an array with one object per significant clause, each with
+            1. "clause_number": Sequential number
+            2. "clause_title": Short descriptive title
+            3. "clause_text": The actual clause text (excerpt)
+            4. "analysis": Detailed analysis of what this clause means
+            5. "risk_level": "low", "medium", or "high"
+            6. "fairness_score": 1-10 (10 being most fair)
+            7. "concerns": List of specific concerns if any
+
+        "fairness": an object with
+            1. "overall_fairness_score": 1-10 (10 being most fair)
+            2. "balance_analysis": Analysis of balance between parties
+            3. "one_sided_clauses": List of clauses that favor one party
+            4. "red_flags": List of concerning terms or conditions
+            5. "power_dynamics": Description of power balance
+            6. "recommendations": How to improve fairness
+
+        Return ONLY valid JSON.
+        """
+
+    def finish(response: str) -> Dict[str, Any]:
+        response = clean_json_response(response)
+        try:
+            combined = json.loads(response)
+            if not isinstance(combined, dict):
+                raise ValueError("Expected a JSON object")
+        except ValueError as e:
+            error = f"Failed to parse AI response: {str(e)}"
+            failed = {"success": False, "error": error}
+            return {
+                "success": False,
+                "error": error,
+                "raw_response": response,
+                "analysis": dict(failed),
+                "clauses": dict(failed),
+                "fairness": dict(failed)
+            }
+
+        def section(key: str, expected: type) -> Dict[str, Any]:
+            value = combined.get(key)
+            if not isinstance(value, expected):
+                return {
+                    "success": False,
+                    "error": f"AI response is missing the '{key}' section"
+                }
+            return {
+                "success": True,
+                "data": value
+            }
+
+        analysis = section("analysis", dict)
+        clauses = section("clauses", list)
+        if clauses["success"]:
+            clauses["data"] = {"clauses": clauses["data"]}
+            clauses["total_clauses"] = len(clauses["data"]["clauses"])
+        fairness = section("fairness", dict)
+
+        result = {
+            "success": analysis["success"] and clauses["success"] and fairness["success"],
+            "analysis": analysis,
+            "clauses": clauses,
+            "fairness": fairness
+        }
+        if not result["success"]:
+            result["error"] = "; ".join(
+                part["error"] for part in (analysis, clauses, fairness) if not part["success"]
+            )
+        return result
+
+    return Operation("analyze_all", prompt, finish,
+                     generation_config={"response_mime_type": "application/json"})
+
+
+def draft_negotiation_email(document_text: str, concerns: List[str],
+                            recipient_name: str = "Recipient") -> Operation:
+    """Build the negotiation email drafting operation."""
+    if not document_text or not concerns:
+        raise InvalidInputError("Document text and concerns are required")
+
+    concerns_text = "\n".join([f"- {c}" for c in concerns])
+
+    prompt = f"""
+        Draft a professional, polite negotiation email regarding a legal document.
+
+        Document context: {document_text[:500]}...
+
+        Concerns to address:
+        {concerns_text}
+
+        The email should:
+        1. Be addressed to {recipient_name}
+        2. Be professional and diplomatic
+        3. Clearly state the concerns
+        4. Propose constructive solutions
+        5. Request a discussion or revision
+
+        Return JSON with:
+        - "subject": Email subject line
+        - "body": Full email body
+        - "tone": The tone used (professional/diplomatic/etc)
+        """
+
+    return Operation("draft_negotiation_email", prompt, _finish_json)
+
+
+def draft_document_review_email(document_text: str, review_notes: str,
+                                recipient_name: str = "Recipient") -> Operation:
+    """Build the document review email drafting operation."""
+    if not document_text:
+        raise InvalidInputError("Document text is required")
+
+    prompt = f"""
+        Draft a professional email to share a document review.
+
+        Document context: {document_text[:500]}...
+        Review notes: {review_notes}
+
+        The email should:
+        1. Be addressed to {recipient_name}
+        2. Introduce the reviewed document
+        3. Summarize key findings
+        4. Be clear and actionable
+
+        Return JSON with:
+        - "subject": Email subject line
+        - "body": Full email body
+        """
+
+    return Operation("draft_document_review_email", prompt, _finish_json)
+
+
+def chat(message: str, document_context: Optional[str] = None) -> Operation:
+    """Build the document chat operation."""
+    if not message:
+        raise InvalidInputError("Message cannot be empty")
+
+    context_text = ""
+    if document_context:
+        context_text = f"\n\nDocument context:\n{document_context}\n\n"
+
+    prompt = f"""
+        You are a legal assistant helping users understand legal documents.
+        {context_text}
+        User question: {message}
+
+        Provide a helpful, clear, and accurate response. If the question is about the document,
+        reference specific parts of it. Be concise but thorough.
+        """
+
+    def finish(response: str) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "data": {
+                "message": message,
+                "response": response,
+                "has_context": document_context is not None
+            }
+        }
+
+    return Operation("chat", prompt, finish)
+
+
+def chat_turn(message: str, history: Sequence[Tuple[str, str]] = (),
+              excerpts: Optional[Sequence[str]] = None) -> Operation:
+    """
+    Build one turn of a ``ChatSession``.
+
+    Args:
+        message: The user's new question
+        history: Earlier (question, answer) pairs, oldest first
+        excerpts: Relevant document excerpts; None when the document is
+            already attached through provider-side context caching
+    """
+    if not message:
+        raise InvalidInputError("Message cannot be empty")
+
+    context_text = ""
+    if excerpts:
+        joined = "\n---\n".join(excerpts)
+        context_text = f"\n\nRelevant document excerpts:\n{joined}\n\n"
+
+    history_text = ""
+    if history:
+        turns = "\n".join(f"User: {q}\nAssistant: {a}" for q, a in history)
+        history_text = f"\nConversation so far:\n{turns}\n"
+
+    prompt = f"""
+        You are a legal assistant helping users understand legal documents.
+        {context_text}{history_text}
+        User question: {message}
+
+        Provide a helpful, clear, and accurate response. If the question is about the document,
+        reference specific parts of it. Be concise but thorough.
+        """
+
+    def finish(response: str) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "data": {
+                "message": message,
+                "response": response,
+                "has_context": True
+            }
+        }
+
+    return Operation("chat", prompt, finish)
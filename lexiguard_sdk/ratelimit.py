@@ -0,0 +1,304 @@
+# lexiguard_sdk/ratelimit.py
+"""
+Client-side rate limiting and retries for LexiGuard SDK
+
+``AdaptiveRateLimiter`` keeps calls under a requests-per-minute and
+tokens-per-minute quota with token buckets, and adjusts how many calls may be
+in flight with AIMD: the limit grows by roughly one slot per window of
+successful calls and is cut multiplicatively whenever the API throttles.
+``RetryPolicy`` retries throttled and transient failures with full-jitter
+exponential backoff.
+
+Usage:
+    from lexiguard_sdk import LexiGuard
+    from lexiguard_sdk.ratelimit import AdaptiveRateLimiter, RetryPolicy
+
+    limiter = AdaptiveRateLimiter(requests_per_minute=1000, tokens_per_minute=1_000_000)
+    lg = LexiGuard(api_key="YOUR_API_KEY", rate_limiter=limiter,
+                   retry_policy=RetryPolicy(max_retries=5))
+    ...
+    print(limiter.snapshot())
+"""
+
+from collections import deque
+from typing import Any, Dict, Optional
+import random
+import re
+import threading
+import time
+
+THROTTLE = "throttle"
+TRANSIENT = "transient"
+
+_THROTTLE_CODES = {429, 503}
+_TRANSIENT_CODES = {408, 500, 502, 504}
+# gRPC status names (grpc.StatusCode, google.rpc.Code) of the same failures
+_THROTTLE_STATUSES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE"}
+_TRANSIENT_STATUSES = {"DEADLINE_EXCEEDED", "INTERNAL", "ABORTED"}
+# google.api_core formats errors as "<HTTP status> <message>"; only a status
+# in that position is trusted, never numbers or words elsewhere in the text
+_LEADING_STATUS = re.compile(r"\s*(\d{3})\b")
+
+
+def _status_code(error: BaseException) -> Any:
+    """HTTP status (int) or gRPC status name reported by an exception, if any."""
+    for owner in (error, getattr(error, "response", None)):
+        if owner is None:
+            continue
+        for attribute in ("code", "status_code"):
+            code = getattr(owner, attribute, None)
+            if callable(code):
+                # grpc.RpcError.code() returns a grpc.StatusCode
+                try:
+                    code = code()
+                except Exception:
+                    code = None
+            if isinstance(code, int):
+                return int(code)
+            name = getattr(code, "name", None)
+            if isinstance(name, str):
+                return name
+    return None
+
+
+def classify_error(error: BaseException) -> Optional[str]:
+    """
+    Classify a model-call failure by its status code or exception type.
+
+    Args:
+        error: Exception raised by the model client
+
+    Returns:
+        THROTTLE for quota/overload responses (429, 503), TRANSIENT for other
+        retryable failures (timeouts, 5xx, dropped connections), None otherwise
+    """
+    code = _status_code(error)
+    if code is None:
+        match = _LEADING_STATUS.match(str(error))
+        if match:
+            code = int(match.group(1))
+    if code in _THROTTLE_CODES or code in _THROTTLE_STATUSES:
+        return THROTTLE
+    if code in _TRANSIENT_CODES or code in _TRANSIENT_STATUSES:
+        return TRANSIENT
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return TRANSIENT
+    return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for throttled and transient errors.
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 30.0, retry_transient: bool = True):
+        """
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            base_delay: Upper bound of the first backoff, in seconds
+            max_delay: Cap on any single backoff, in seconds
+            retry_transient: Also retry timeouts and 5xx errors, not only throttling
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_transient = retry_transient
+
+    def should_retry(self, kind: Optional[str], attempt: int) -> bool:
+        """Whether a failure of ``kind`` on retry number ``attempt`` (0-based) is retried."""
+        if attempt >= self.max_retries:
+            return False
+        return kind == THROTTLE or (kind == TRANSIENT and self.retry_transient)
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+# Used by the clients unless a policy (or None) is passed explicitly
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate`` units per second.
+
+    Not thread-safe on its own; ``AdaptiveRateLimiter`` guards it.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.available = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if it can be taken now)."""
+        self._refill(now)
+        # Requests larger than the bucket go through once it is full
+        needed = min(amount, self.capacity)
+        if self.available >= needed:
+            return 0.0
+        return (needed - self.available) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.available -= amount
+
+    def drain(self, now: float) -> None:
+        self._refill(now)
+        self.available = min(self.available, 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket quota limiter with AIMD concurrency control.
+
+    Safe to share between threads and between a sync and an async client.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None,
+                 max_concurrency: int = 32, min_concurrency: int = 1,
+                 initial_concurrency: Optional[int] = None,
+                 decrease_factor: float = 0.5, burst_seconds: float = 5.0):
+        """
+        Args:
+            requests_per_minute: Request quota (None for no request limit)
+            tokens_per_minute: Input-token quota (None for no token limit)
+            max_concurrency: Upper bound for in-flight calls
+            min_concurrency: Lower bound the limit never drops below
+            initial_concurrency: Starting limit (defaults to max_concurrency)
+            decrease_factor: Multiplier applied to the limit on throttling
+            burst_seconds: Bucket capacity, expressed in seconds of quota
+        """
+        if max_concurrency < min_concurrency or min_concurrency < 1:
+            raise ValueError("Require 1 <= min_concurrency <= max_concurrency")
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.decrease_factor = decrease_factor
+        self.concurrency_limit = float(initial_concurrency or max_concurrency)
+        self.in_flight = 0
+        self.requests_total = 0
+        self.throttled_total = 0
+        self.failures_total = 0
+
+        self._request_bucket = None
+        if requests_per_minute:
+            rate = requests_per_minute / 60.0
+            self._request_bucket = TokenBucket(rate, max(1.0, rate * burst_seconds))
+        self._token_bucket = None
+        if tokens_per_minute:
+            rate = tokens_per_minute / 60.0
+            self._token_bucket = TokenBucket(rate, max(1.0, rate * burst_seconds))
+
+        self._window: deque = deque()
+        self._condition = threading.Condition()
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Acquire a slot if possible; otherwise return seconds to wait."""
+        now = time.monotonic()
+        if self.in_flight >= int(self.concurrency_limit):
+            return 0.05
+        wait = 0.0
+        for bucket, amount in ((self._request_bucket, 1), (self._token_bucket, tokens)):
+            if bucket is not None:
+                wait = max(wait, bucket.wait_time(amount, now))
+        if wait > 0:
+            return wait
+        if self._request_bucket is not None:
+            self._request_bucket.take(1)
+        if self._token_bucket is not None:
+            self._token_bucket.take(tokens)
+        self.in_flight += 1
+        self.requests_total += 1
+        self._window.append((now, tokens))
+        self._prune_window(now)
+        return 0.0
+
+    def _prune_window(self, now: float) -> None:
+        while self._window and self._window[0][0] < now - 60:
+            self._window.popleft()
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until a call using ``tokens`` input tokens may start.
+
+        Every successful ``acquire`` must be paired with ``release``.
+        """
+        with self._condition:
+            while True:
+                wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return
+                self._condition.wait(timeout=wait)
+
+    async def acquire_async(self, tokens: int = 0) -> None:
+        """Awaitable ``acquire`` that never blocks the event loop."""
+        # Only async clients get here, and they have loaded asyncio already
+        import asyncio
+
+        while True:
+            with self._condition:
+                wait = self._try_acquire(tokens)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, outcome: Optional[str] = None) -> None:
+        """
+        Finish a call and adapt the concurrency limit.
+
+        Args:
+            outcome: None for success, THROTTLE when the API rejected the call
+                for quota/overload, any other value for other failures
+        """
+        with self._condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            if outcome is None:
+                # Additive increase: about +1 slot per limit's worth of successes
+                self.concurrency_limit = min(
+                    float(self.max_concurrency),
+                    self.concurrency_limit + 1.0 / self.concurrency_limit
+                )
+            elif outcome == THROTTLE:
+                self.throttled_total += 1
+                self.concurrency_limit = max(
+                    float(self.min_concurrency),
+                    self.concurrency_limit * self.decrease_factor
+                )
+                now = time.monotonic()
+                for bucket in (self._request_bucket, self._token_bucket):
+                    if bucket is not None:
+                        bucket.drain(now)
+            else:
+                self.failures_total += 1
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Live limiter state.
+
+        Returns:
+            Dictionary with the current concurrency limit, calls in flight,
+            achieved requests/tokens over the last minute, and counters
+        """
+        with self._condition:
+            self._prune_window(time.monotonic())
+            return {
+                "concurrency_limit": int(self.concurrency_limit),
+                "in_flight": self.in_flight,
+                "requests_last_minute": len(self._window),
+                "tokens_last_minute": sum(tokens for _, tokens in self._window),
+                "requests_total": self.requests_total,
+                "throttled_total": self.throttled_total,
+                "failures_total": self.failures_total,
+                "request_bucket_available": (self._request_bucket.available
+                                             if self._request_bucket else None),
+                "token_bucket_available": (self._token_bucket.available
+                                           if self._token_bucket else None),
+            }
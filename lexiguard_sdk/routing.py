@@ -0,0 +1,169 @@
+# lexiguard_sdk/routing.py
+"""
+Model routing for LexiGuard SDK
+
+A routing policy picks the model for each call from the SDK operation (task)
+and the prompt size, so short documents and simple tasks such as email drafts
+can go to a faster, cheaper model while long contracts keep the client's
+default model. When a routed call returns a response that fails JSON
+validation, the call is escalated: it is sent once more to a larger model.
+The policy keeps per-route latency statistics.
+
+Usage:
+    from lexiguard_sdk import LexiGuard
+    from lexiguard_sdk.routing import Route, RoutingPolicy
+
+    routing = RoutingPolicy([
+        Route("email", "models/gemini-2.5-flash-lite",
+              tasks={"draft_negotiation_email", "draft_document_review_email"}),
+        Route("small", "models/gemini-2.5-flash-lite", max_tokens=4000),
+    ])
+    lg = LexiGuard(api_key="YOUR_API_KEY", model_name="models/gemini-2.5-pro",
+                   routing=routing)
+    ...
+    print(routing.stats())
+
+Routes are tried in order and the first match wins; calls matching no route
+use the client's ``model_name`` (route "default"). Escalation goes to
+``escalation_model``, or to the client's ``model_name`` when that is not set.
+Streaming calls are routed but never escalated, since their events have
+already been delivered.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Dict, Optional, Sequence
+import threading
+
+from .hooks import percentile
+
+DEFAULT_ROUTE = "default"
+ESCALATION_ROUTE = "escalation"
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    One routing rule.
+
+    Attributes:
+        name: Route name used in statistics and call records
+        model_name: Model the matching calls are sent to (None for the
+            client's model)
+        tasks: SDK operation names the route applies to (None for any task)
+        max_tokens: Largest estimated prompt size the route accepts (None for
+            any size)
+    """
+    name: str
+    model_name: Optional[str] = None
+    tasks: Optional[AbstractSet[str]] = None
+    max_tokens: Optional[int] = None
+
+    def matches(self, task: Optional[str], tokens: int) -> bool:
+        if self.tasks is not None and task not in self.tasks:
+            return False
+        return self.max_tokens is None or tokens <= self.max_tokens
+
+
+class RoutingPolicy:
+    """
+    Ordered routing rules, the escalation rule and per-route statistics.
+
+    Safe to share between threads and between a sync and an async client.
+    """
+
+    def __init__(self, routes: Sequence[Route], escalation_model: Optional[str] = None,
+                 escalate: bool = True, window: int = 500):
+        """
+        Args:
+            routes: Routing rules, tried in order
+            escalation_model: Model that retries calls whose response failed
+                JSON validation (defaults to the client's model)
+            escalate: Set to False to return validation failures as they are
+            window: Number of recent latencies kept per route for percentiles
+        """
+        names = [route.name for route in routes]
+        if len(set(names)) != len(names):
+            raise ValueError("route names must be unique")
+        if {DEFAULT_ROUTE, ESCALATION_ROUTE} & set(names):
+            raise ValueError(f"route names {DEFAULT_ROUTE!r} and {ESCALATION_ROUTE!r} are reserved")
+        self.routes = list(routes)
+        self.default_route = Route(DEFAULT_ROUTE)
+        self.escalation_model = escalation_model
+        self.escalate = escalate
+        self.window = window
+        self._routes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def select(self, task: Optional[str], tokens: int) -> Route:
+        """
+        Pick the route for a call.
+
+        Args:
+            task: SDK operation name (e.g. "analyze_text")
+            tokens: Estimated prompt size in tokens
+
+        Returns:
+            The first matching route, or the default route
+        """
+        for route in self.routes:
+            if route.matches(task, tokens):
+                return route
+        return self.default_route
+
+    def escalation_target(self, model_name: str, default_model: str) -> Optional[str]:
+        """
+        Model to retry a failed validation on, or None when the call already
+        ran on that model or escalation is disabled.
+        """
+        if not self.escalate:
+            return None
+        target = self.escalation_model or default_model
+        return None if target == model_name else target
+
+    def _entry(self, name: str) -> Dict[str, Any]:
+        entry = self._routes.get(name)
+        if entry is None:
+            entry = {"calls": 0, "errors": 0, "escalations": 0,
+                     "latencies": deque(maxlen=self.window)}
+            self._routes[name] = entry
+        return entry
+
+    def observe(self, route: str, seconds: float, success: bool,
+                escalated: bool = False) -> None:
+        """
+        Record one call served by ``route``.
+
+        Args:
+            route: Route name
+            seconds: Time from sending the request to the parsed result
+            success: Whether the call produced a successful result
+            escalated: Whether the result failed validation and was escalated
+        """
+        with self._lock:
+            entry = self._entry(route)
+            entry["calls"] += 1
+            entry["errors"] += not success
+            entry["escalations"] += escalated
+            entry["latencies"].append(seconds)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-route statistics.
+
+        Returns:
+            Dictionary keyed by route name with calls, failed calls (before
+            any escalation), escalations, and p50/p95/p99 latency in seconds
+        """
+        with self._lock:
+            stats = {}
+            for name, entry in self._routes.items():
+                latencies = list(entry["latencies"])
+                stats[name] = {key: entry[key] for key in ("calls", "errors", "escalations")}
+                for label, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                    stats[name][f"latency_{label}"] = percentile(latencies, fraction)
+            return stats
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
@@ -0,0 +1,142 @@
+# lexiguard_sdk/singleflight.py
+"""
+Request coalescing ("single-flight") for LexiGuard SDK
+
+When several callers ask for the same generation at the same time, only the
+first one (the leader) calls the model; the others wait for the leader and
+receive its result, or its exception. A response cache only helps once the
+first call has finished; coalescing also covers calls that are still in
+flight. Keys are response-cache keys, so two calls are merged exactly when
+the cache would treat them as the same request.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key across threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn`` unless a call with ``key`` is already in flight.
+
+        Args:
+            key: Request identity (a response-cache key)
+            fn: Zero-argument callable producing the result
+
+        Returns:
+            ``(result, shared)`` where ``shared`` is True when the result came
+            from another caller's in-flight call
+
+        Raises:
+            Whatever ``fn`` raised, in the leader and in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being generated."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"leaders": self.leaders, "coalesced": self.coalesced,
+                    "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls with the same key on one event loop.
+
+    The shared work runs as its own task, so cancelling one waiting caller
+    (including the one that started it) does not cancel the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, Any] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await ``fn()`` unless a call with ``key`` is already in flight.
+
+        Args:
+            key: Request identity (a response-cache key)
+            fn: Coroutine function producing the result
+
+        Returns:
+            ``(result, shared)`` as for ``SingleFlight.do``
+        """
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task), True
+
+        self.leaders += 1
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task), False
+
+    def _done(self, key: str, task: Any) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being generated."""
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        return {"leaders": self.leaders, "coalesced": self.coalesced,
+                "in_flight": len(self._calls)}
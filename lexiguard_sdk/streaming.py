@@ -0,0 +1,186 @@
+# lexiguard_sdk/streaming.py
+"""
+Incremental JSON parsing for streamed LexiGuard analyses.
+
+The model returns one JSON object per analysis. ``IncrementalJSONParser``
+consumes the response chunk by chunk and reports each top-level field as soon
+as its value closes, plus every element of a top-level array as soon as that
+element closes, so callers can render the summary or the first clause long
+before generation finishes.
+
+Events are plain dictionaries:
+    {"type": "field", "key": "summary", "value": "..."}
+    {"type": "item", "key": "clauses", "index": 0, "value": {...}}
+    {"type": "result", "result": {"success": True, "data": {...}}}
+
+The "result" event is produced by the SDK once the stream ends and carries the
+same dictionary the non-streaming method returns.
+"""
+
+from typing import Any, Dict, List, Optional
+import io
+import json
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """
+    Streaming scanner for a single top-level JSON object.
+
+    Text before the opening brace (such as a Markdown code fence) and after the
+    closing brace is ignored. Completed values are decoded with ``json.loads``;
+    a value that fails to decode is skipped rather than raised, since the final
+    result is always rebuilt from the full response text.
+
+    Each chunk is scanned once and appended to a buffer that completed values
+    are read back from by offset, so parsing stays linear in the response size.
+    """
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        # Offset just past the last character scanned
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._done = False
+        # Top-level object state
+        self._expect_key = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._value_is_array = False
+        # Element state for top-level arrays
+        self._item_start: Optional[int] = None
+        self._item_index = 0
+
+    @property
+    def done(self) -> bool:
+        """True once the top-level object has closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Consume the next chunk of response text.
+
+        Args:
+            chunk: Newly received text
+
+        Returns:
+            Events for every field or array element completed by this chunk
+        """
+        events: List[Dict[str, Any]] = []
+        if self._done or not chunk:
+            return events
+
+        base = self._pos
+        self._buffer.seek(base)
+        self._buffer.write(chunk)
+        self._pos = base + len(chunk)
+
+        for pos, char in enumerate(chunk, start=base):
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = self._decode(self._slice(self._key_start, pos + 1))
+                        self._key_start = None
+                continue
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._expect_key = True
+                continue
+
+            if self._depth == 1:
+                if char in _WHITESPACE or char == ":":
+                    continue
+                if self._expect_key:
+                    if char == '"':
+                        self._in_string = True
+                        self._key_start = pos
+                        self._expect_key = False
+                    elif char == "}":
+                        self._done = True
+                        break
+                elif char in ",}":
+                    # Scalars end at the next separator; nested values were
+                    # already emitted when they closed
+                    if self._value_start is not None:
+                        self._emit_field(events, self._slice(self._value_start, pos))
+                    if char == "}":
+                        self._done = True
+                        break
+                    self._expect_key = True
+                else:
+                    if self._value_start is None:
+                        self._value_start = pos
+                        self._value_is_array = char == "["
+                        self._item_start = None
+                        self._item_index = 0
+                    if char == '"':
+                        self._in_string = True
+                    elif char in "{[":
+                        self._depth += 1
+                continue
+
+            # Inside a nested value (depth >= 2)
+            if self._depth == 2 and self._value_is_array:
+                if self._item_start is None and char not in _WHITESPACE + ",]":
+                    self._item_start = pos
+                elif char in ",]" and self._item_start is not None:
+                    self._emit_item(events, self._slice(self._item_start, pos))
+                    self._item_start = None
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._emit_field(events, self._slice(self._value_start, pos + 1))
+                elif self._depth == 2 and self._value_is_array and self._item_start is not None:
+                    self._emit_item(events, self._slice(self._item_start, pos + 1))
+                    self._item_start = None
+
+        return events
+
+    def _slice(self, start: int, end: int) -> str:
+        """Text received between two offsets."""
+        self._buffer.seek(start)
+        return self._buffer.read(end - start)
+
+    def _emit_field(self, events: List[Dict[str, Any]], raw: str) -> None:
+        if self._key is not None and self._value_start is not None:
+            raw = raw.strip()
+            if raw:
+                try:
+                    events.append({"type": "field", "key": self._key, "value": json.loads(raw)})
+                except ValueError:
+                    pass
+        self._key = None
+        self._value_start = None
+        self._value_is_array = False
+
+    def _emit_item(self, events: List[Dict[str, Any]], raw: str) -> None:
+        try:
+            value = json.loads(raw.strip())
+        except ValueError:
+            return
+        events.append({"type": "item", "key": self._key, "index": self._item_index, "value": value})
+        self._item_index += 1
+
+    @staticmethod
+    def _decode(raw: str) -> Optional[str]:
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
@@ -31,11 +31,15 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "google-generativeai>=0.3.0",
+        "google-generativeai>=0.5.0",
         "PyPDF2>=3.0.0",
-        "python-docx>=0.8.11",
     ],
     extras_require={
+        "pdf": [
+            "pymupdf>=1.23.0",
+            "pypdfium2>=4.0.0",
+            "pdfminer.six>=20221105",
+        ],
         "fastapi": [
             "fastapi>=0.100.0",
             "uvicorn[standard]>=0.23.0",
@@ -51,6 +55,12 @@ setup(
             "black>=23.7.0",
             "isort>=5.12.0",
             "mypy>=1.4.0",
+            "python-docx>=0.8.11",
+        ],
+    },
+    entry_points={
+        "console_scripts": [
+            "lexiguard=lexiguard_sdk.cli:main",
         ],
     },
 )
\ No newline at end of file
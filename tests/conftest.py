@@ -0,0 +1,10 @@
+# tests/conftest.py
+"""
+Shared pytest setup: the SDK is imported from this checkout, so the suite runs
+without installing the package.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,140 @@
+# tests/test_analyze_many.py
+"""Tests for batch analysis with analyze_many"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+
+import pytest
+
+from lexiguard_sdk import AsyncLexiGuard, LexiGuard, LexiGuardError
+from lexiguard_sdk.backends import FakeBackend, FakeBackendError, GenerationResult
+
+DOCUMENTS = [f"DOC-{i}: The tenant shall pay rent monthly. " * (1 + i % 4) for i in range(12)]
+
+
+class EchoBackend(FakeBackend):
+    """
+    Puts the document's DOC-n marker in the summary, fails documents marked
+    FAIL and records the peak number of calls running at once.
+    """
+
+    def __init__(self, seconds=0.02):
+        super().__init__()
+        self.seconds = seconds
+        self.running = 0
+        self.peak = 0
+        self._running_lock = threading.Lock()
+
+    def _enter(self):
+        with self._running_lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def _leave(self):
+        with self._running_lock:
+            self.running -= 1
+
+    def _echo(self, request, result):
+        if "FAIL" in request.prompt:
+            raise FakeBackendError("500 Internal error (fake)", 500)
+        data = json.loads(result.text)
+        data["summary"] = re.search(r"DOC-\d+", request.prompt).group()
+        return GenerationResult(json.dumps(data), request.model_name)
+
+    def generate(self, request):
+        self._enter()
+        try:
+            time.sleep(self.seconds)
+            return self._echo(request, super().generate(request))
+        finally:
+            self._leave()
+
+    async def generate_async(self, request):
+        self._enter()
+        try:
+            await asyncio.sleep(self.seconds)
+            return self._echo(request, await super().generate_async(request))
+        finally:
+            self._leave()
+
+
+class RaisingClient(LexiGuard):
+    def analyze_text(self, text, **kwargs):
+        if "RAISE" in text:
+            raise RuntimeError("cannot analyze this one")
+        return super().analyze_text(text, **kwargs)
+
+
+class AsyncRaisingClient(AsyncLexiGuard):
+    async def analyze_text(self, text, **kwargs):
+        if "RAISE" in text:
+            raise RuntimeError("cannot analyze this one")
+        return await super().analyze_text(text, **kwargs)
+
+
+def _summaries(results):
+    return [result["data"]["summary"] for result in results]
+
+
+def test_results_keep_input_order():
+    backend = EchoBackend()
+    results = LexiGuard(backend=backend).analyze_many(DOCUMENTS, max_concurrency=4)
+    assert _summaries(results) == [f"DOC-{i}" for i in range(len(DOCUMENTS))]
+
+
+def test_failures_do_not_cancel_other_documents():
+    texts = list(DOCUMENTS)
+    texts[2] = "FAIL " + texts[2]
+    texts[5] = "RAISE " + texts[5]
+    texts[7] = ""
+    progress = []
+    results = RaisingClient(backend=EchoBackend(), retry_policy=None).analyze_many(
+        texts, max_concurrency=3, progress_callback=lambda done, total: progress.append(done))
+    failed = [index for index, result in enumerate(results) if not result["success"]]
+    assert failed == [2, 5, 7]
+    assert results[5] == {"success": False, "error": "cannot analyze this one"}
+    assert _summaries(result for result in results if result["success"]) == \
+        [f"DOC-{i}" for i in range(len(texts)) if i not in failed]
+    assert progress == list(range(1, len(texts) + 1))
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_max_concurrency_is_respected(max_concurrency):
+    backend = EchoBackend()
+    LexiGuard(backend=backend).analyze_many(DOCUMENTS, max_concurrency=max_concurrency)
+    assert backend.peak == max_concurrency
+
+
+def test_invalid_arguments():
+    lg = LexiGuard(backend=EchoBackend())
+    assert lg.analyze_many([]) == []
+    with pytest.raises(LexiGuardError):
+        lg.analyze_many(DOCUMENTS, mode="summary")
+    with pytest.raises(LexiGuardError):
+        lg.analyze_many(DOCUMENTS, max_concurrency=0)
+
+
+def test_async_results_keep_order_and_failures_stay_isolated():
+    texts = list(DOCUMENTS)
+    texts[2] = "FAIL " + texts[2]
+    texts[5] = "RAISE " + texts[5]
+    backend = EchoBackend()
+    lg = AsyncRaisingClient(backend=backend, retry_policy=None, max_concurrency=3)
+    results = asyncio.run(lg.analyze_many(texts))
+    assert [index for index, result in enumerate(results) if not result["success"]] == [2, 5]
+    assert results[5] == {"success": False, "error": "cannot analyze this one"}
+    assert _summaries(result for result in results if result["success"]) == \
+        [f"DOC-{i}" for i in range(len(texts)) if i not in (2, 5)]
+    assert backend.peak == 3
+
+
+def test_async_client_can_be_reused_across_event_loops():
+    backend = EchoBackend()
+    lg = AsyncLexiGuard(backend=backend, max_concurrency=2)
+    first = asyncio.run(lg.analyze_many(DOCUMENTS[:6]))
+    second = asyncio.run(lg.analyze_many(DOCUMENTS[6:]))
+    assert _summaries(first + second) == [f"DOC-{i}" for i in range(len(DOCUMENTS))]
+    assert backend.peak == 2
@@ -0,0 +1,182 @@
+# tests/test_cache.py
+"""Tests for the response cache tiers"""
+
+import sqlite3
+
+import pytest
+
+from lexiguard_sdk import cache as cache_module
+from lexiguard_sdk.cache import MemoryCache, SQLiteCache, TieredCache, make_cache_key
+
+
+class Clock:
+    """Stands in for the ``time`` module so entries get distinct, controlled times."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def tick(self, seconds=1.0):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return tmp_path / "cache" / "responses.db"
+
+
+def test_make_cache_key_covers_model_prompt_and_config():
+    key = make_cache_key("model-a", "prompt", {"temperature": 0.1})
+    assert key == make_cache_key("model-a", "prompt", {"temperature": 0.1})
+    assert key != make_cache_key("model-b", "prompt", {"temperature": 0.1})
+    assert key != make_cache_key("model-a", "other prompt", {"temperature": 0.1})
+    assert key != make_cache_key("model-a", "prompt", {"temperature": 0.2})
+    assert make_cache_key("m", "p", None) == make_cache_key("m", "p", {})
+
+
+def test_memory_cache_evicts_least_recently_used(clock):
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_ttl(clock):
+    cache = MemoryCache(ttl=10)
+    cache.set("a", "1")
+    clock.tick(9)
+    assert cache.get("a") == "1"
+    clock.tick(2)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.stats.to_dict()["hits"] == 1
+
+
+def test_memory_cache_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        MemoryCache(max_entries=0)
+
+
+def test_sqlite_cache_persists_across_instances(sqlite_path):
+    cache = SQLiteCache(sqlite_path)
+    cache.set("a", "réponse")
+    cache.close()
+    reopened = SQLiteCache(sqlite_path)
+    assert reopened.get("a") == "réponse"
+    reopened.delete("a")
+    assert reopened.get("a") is None
+    reopened.close()
+
+
+def test_sqlite_cache_evicts_least_recently_used(sqlite_path, clock):
+    cache = SQLiteCache(sqlite_path, max_entries=2)
+    cache.set("a", "1")
+    clock.tick()
+    cache.set("b", "2")
+    clock.tick()
+    assert cache.get("a") == "1"
+    clock.tick()
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats.evictions == 1
+    cache.close()
+
+
+def test_sqlite_cache_ttl(sqlite_path, clock):
+    cache = SQLiteCache(sqlite_path, ttl=10)
+    cache.set("a", "1")
+    clock.tick(11)
+    assert cache.get("a") is None
+    assert cache.stats.evictions == 1
+    cache.close()
+
+
+def test_tiered_cache_promotes_disk_hits(sqlite_path):
+    disk = SQLiteCache(sqlite_path)
+    disk.set("a", "1")
+    cache = TieredCache(MemoryCache(), disk)
+    assert cache.blocking
+    assert cache.get("a") == "1"
+    assert cache.memory.get("a") == "1"
+    assert cache.get("missing") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    cache.delete("a")
+    assert disk.get("a") is None
+    disk.close()
+
+
+def test_blocking_flag():
+    assert not MemoryCache().blocking
+    assert not TieredCache(MemoryCache()).blocking
+
+
+def _columns(cache):
+    return [row[1] for row in cache._conn.execute("PRAGMA table_info(responses)")]
+
+
+def test_sqlite_cache_evicts_by_size(sqlite_path, clock):
+    cache = SQLiteCache(sqlite_path, max_bytes=10)
+    cache.set("a", "aaaa")
+    clock.tick()
+    cache.set("b", "bbbb")
+    clock.tick()
+    assert cache.get("a") == "aaaa"
+    clock.tick()
+    # Sizes are UTF-8 bytes: "éé" is 4
+    cache.set("c", "éé")
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "éé"
+    clock.tick()
+    cache.set("d", "d" * 10)
+    assert [cache.get(key) for key in "acd"] == [None, None, "d" * 10]
+    cache.close()
+
+
+def test_sqlite_cache_creates_size_column(sqlite_path):
+    cache = SQLiteCache(sqlite_path)
+    assert _columns(cache) == ["key", "value", "created_at", "accessed_at", "size"]
+    cache.set("a", "héllo")
+    assert cache._conn.execute("SELECT size FROM responses").fetchone() == (6,)
+    cache.close()
+
+
+def test_sqlite_cache_migrates_databases_without_size(sqlite_path, clock):
+    sqlite_path.parent.mkdir(parents=True)
+    conn = sqlite3.connect(str(sqlite_path))
+    conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                 "created_at REAL NOT NULL, accessed_at REAL NOT NULL)")
+    conn.executemany("INSERT INTO responses VALUES (?, ?, ?, ?)",
+                     [("old", "héllo", 1.0, 1.0), ("older", "x" * 8, 0.5, 0.5)])
+    conn.commit()
+    conn.close()
+
+    cache = SQLiteCache(sqlite_path, max_bytes=10)
+    assert "size" in _columns(cache)
+    assert dict(cache._conn.execute("SELECT key, size FROM responses")) == {"old": 6, "older": 8}
+    assert cache.get("old") == "héllo"
+    # The backfilled sizes drive eviction: the least recently used entry goes
+    cache.set("new", "abc")
+    assert cache.get("older") is None
+    assert cache.get("old") == "héllo"
+    cache.close()
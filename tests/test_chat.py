@@ -0,0 +1,119 @@
+# tests/test_chat.py
+"""Tests for ChatSession context caching and its excerpt fallback"""
+
+from lexiguard_sdk import LexiGuard
+from lexiguard_sdk.backends import FakeBackend, FakeBackendError
+from lexiguard_sdk.chat import MIN_CONTEXT_CACHE_TOKENS, ExcerptIndex
+
+DEPOSIT = "DEPOSIT. The landlord keeps the security deposit if the premises are damaged."
+QUESTION = "When can the landlord keep the deposit?"
+
+
+def _document(articles):
+    clauses = [f"ARTICLE {i}. The tenant shall pay rent of {i} dollars by the first day."
+               for i in range(articles)]
+    clauses.insert(articles // 2, DEPOSIT)
+    return "\n\n".join(clauses)
+
+
+SMALL_DOCUMENT = _document(40)
+LARGE_DOCUMENT = _document(MIN_CONTEXT_CACHE_TOKENS // 10)
+
+
+class ChatBackend(FakeBackend):
+    """Records requests and context caches; ``cached_error`` fails cached turns."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.created = []
+        self.deleted = []
+        self.cached_error = None
+
+    def generate(self, request):
+        self.requests.append(request)
+        if request.cached_content is not None and self.cached_error is not None:
+            raise self.cached_error
+        return super().generate(request)
+
+    def create_context_cache(self, model_name, document, system_instruction, ttl):
+        handle = super().create_context_cache(model_name, document, system_instruction, ttl)
+        self.created.append(handle)
+        return handle
+
+    def delete_context_cache(self, handle):
+        self.deleted.append(handle)
+
+
+def _session(document, **options):
+    backend = ChatBackend()
+    lg = LexiGuard(backend=backend, retry_policy=None)
+    return lg.start_chat(document, chunk_tokens=40, excerpt_tokens=60, **options), backend
+
+
+def test_excerpt_index_picks_matching_chunks_in_document_order():
+    chunks = ["Rent is due monthly.", "The deposit is returned.", "Rent rises yearly.",
+              "Notices go by post."]
+    index = ExcerptIndex(chunks)
+    assert index.search("rent", max_tokens=100) == [chunks[0], chunks[2]]
+    assert index.search("deposit returned", max_tokens=1) == [chunks[1]]
+    assert index.search("arbitration", max_tokens=100) == [chunks[0]]
+    assert ExcerptIndex([]).search("rent", max_tokens=100) == []
+
+
+def test_small_document_sends_relevant_excerpts():
+    session, backend = _session(SMALL_DOCUMENT)
+    assert session.context_mode == "excerpts"
+    assert backend.created == []
+    result = session.ask(QUESTION)
+    assert result["success"] and result["context_mode"] == "excerpts"
+    prompt = backend.requests[-1].prompt
+    assert DEPOSIT in prompt
+    assert "ARTICLE 3." not in prompt
+    assert len(prompt) < len(SMALL_DOCUMENT) / 4
+
+    session.ask("And what if they are not damaged?")
+    prompt = backend.requests[-1].prompt
+    assert f"User: {QUESTION}" in prompt
+    # The previous question still steers the excerpts
+    assert DEPOSIT in prompt
+
+
+def test_large_document_is_sent_once_as_cached_context():
+    session, backend = _session(LARGE_DOCUMENT)
+    assert session.context_mode == "cached"
+    assert session.ask(QUESTION)["context_mode"] == "cached"
+    request = backend.requests[-1]
+    assert request.cached_content is backend.created[0]
+    assert DEPOSIT not in request.prompt
+    session.close()
+    assert backend.deleted == backend.created
+
+
+def test_expired_context_cache_continues_on_excerpts():
+    session, backend = _session(LARGE_DOCUMENT)
+    backend.cached_error = FakeBackendError("403 CachedContent not found (or permission denied)",
+                                            403)
+    result = session.ask(QUESTION)
+    assert result["success"] and result["context_mode"] == "excerpts"
+    assert backend.deleted == backend.created
+    # The failed cached call, then the same turn answered from excerpts
+    assert [request.cached_content is None for request in backend.requests] == [False, True]
+    assert DEPOSIT in backend.requests[-1].prompt
+    assert session.ask("Is notice required?")["context_mode"] == "excerpts"
+    assert len(backend.created) == 1
+
+
+def test_other_failures_keep_the_context_cache():
+    session, backend = _session(LARGE_DOCUMENT)
+    backend.cached_error = FakeBackendError("500 Internal error (fake)", 500)
+    result = session.ask(QUESTION)
+    assert result == {"success": False, "error": result["error"], "context_mode": "cached"}
+    assert "500" in result["error"]
+    assert backend.deleted == []
+    assert not session.history
+
+    backend.cached_error = None
+    assert session.ask(QUESTION)["success"]
+    assert backend.requests[-1].cached_content is backend.created[0]
+    assert len(session.history) == 1
@@ -0,0 +1,137 @@
+# tests/test_chunking.py
+"""Tests for long-document chunking and result merging"""
+
+import pytest
+
+from lexiguard_sdk import LexiGuard
+from lexiguard_sdk.backends import FakeBackend, GenerationResult
+from lexiguard_sdk.chunking import estimate_tokens, merge_results, split_into_chunks
+from lexiguard_sdk.routing import Route, RoutingPolicy
+
+CONTRACT = "\n\n".join(
+    f"ARTICLE {i}. PAYMENT\nThe tenant shall pay amount {i} within thirty days. " * 12
+    for i in range(1, 16)
+)
+
+
+def test_split_into_chunks_respects_budget_and_boundaries():
+    chunks = split_into_chunks(CONTRACT, max_tokens=400)
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 400 for chunk in chunks)
+    assert all(chunk.startswith("ARTICLE") for chunk in chunks)
+    assert "".join(chunks).replace("\n", "").replace(" ", "") == \
+        CONTRACT.replace("\n", "").replace(" ", "")
+
+
+def test_split_into_chunks_blank_and_invalid():
+    assert split_into_chunks("   \n") == []
+    with pytest.raises(ValueError):
+        split_into_chunks("text", max_tokens=0)
+
+
+def test_merge_text_results():
+    merged = merge_results("text", [
+        {"summary": "First part.", "document_type": "Lease",
+         "key_clauses": ["Rent", "Deposit"], "parties_involved": ["Landlord"]},
+        {"summary": "Second part.", "document_type": "Lease",
+         "key_clauses": ["rent ", "Repairs"], "potential_risks": "Late fees"},
+        {"summary": "", "document_type": "Addendum"},
+    ])
+    assert merged == {
+        "summary": "First part.\n\nSecond part.",
+        "document_type": "Lease",
+        "key_clauses": ["Rent", "Deposit", "Repairs"],
+        "potential_risks": ["Late fees"],
+        "recommendations": [],
+        "parties_involved": ["Landlord"],
+    }
+
+
+def test_merge_clause_results_dedupes_and_renumbers():
+    repeated = {"clause_number": 3, "clause_title": "Term", "clause_text": "One year."}
+    merged = merge_results("clauses", [
+        {"clauses": [{"clause_number": 1, "clause_title": "Rent", "clause_text": "Monthly."},
+                     repeated]},
+        {"clauses": [dict(repeated, clause_number=1),
+                     {"clause_number": 2, "clause_title": "Repairs", "clause_text": "Tenant."}]},
+    ])
+    assert [(c["clause_number"], c["clause_title"]) for c in merged["clauses"]] == \
+        [(1, "Rent"), (2, "Term"), (3, "Repairs")]
+    # The inputs are not modified
+    assert repeated["clause_number"] == 3
+
+
+def test_merge_fairness_results_weights_scores():
+    merged = merge_results("fairness", [
+        {"overall_fairness_score": 4, "red_flags": ["Uncapped indemnity"],
+         "balance_analysis": "Leans to the landlord."},
+        {"overall_fairness_score": "n/a"},
+        {"overall_fairness_score": 8, "red_flags": ["uncapped  indemnity"]},
+    ], weights=[1, 100, 3])
+    assert merged["overall_fairness_score"] == 7.0
+    assert merged["red_flags"] == ["Uncapped indemnity"]
+    assert merged["balance_analysis"] == "Leans to the landlord."
+
+
+def test_merge_fairness_without_scores():
+    assert merge_results("fairness", [{}])["overall_fairness_score"] is None
+
+
+@pytest.mark.parametrize("mode", ["text", "clauses", "fairness"])
+def test_merge_results_skips_data_that_is_not_an_object(mode):
+    data = {"summary": "Kept.", "clauses": [{"clause_title": "Kept"}],
+            "overall_fairness_score": 6}
+    merged = merge_results(mode, [["a", "list"], "a string", data, None, 42],
+                           weights=[5, 5, 1, 5, 5])
+    assert merged == merge_results(mode, [data])
+
+
+def test_merge_results_unknown_mode():
+    with pytest.raises(ValueError):
+        merge_results("all", [{}])
+
+
+class ListBackend(FakeBackend):
+    """Answers every chunk of the document with a JSON array."""
+
+    def generate(self, request):
+        return GenerationResult("[1, 2]", request.model_name)
+
+
+def test_long_document_reports_non_object_chunks_as_failures():
+    lg = LexiGuard(backend=ListBackend())
+    result = lg.analyze_long_document(CONTRACT, max_chunk_tokens=400)
+    assert not result["success"]
+    assert result["failed_chunks"] == list(range(result["total_chunks"]))
+    assert "not a JSON object" in result["error"]
+    assert len(lg.chunk_cache) == 0
+
+
+def test_long_document_merges_chunks_and_caches_them():
+    backend = FakeBackend()
+    lg = LexiGuard(backend=backend)
+    result = lg.analyze_long_document(CONTRACT, mode="clauses", max_chunk_tokens=400)
+    assert result["success"]
+    assert result["total_chunks"] > 1
+    assert [c["clause_number"] for c in result["data"]["clauses"]] == \
+        list(range(1, result["total_clauses"] + 1))
+    calls = backend.calls
+    assert lg.analyze_long_document(CONTRACT, mode="clauses", max_chunk_tokens=400) == result
+    assert backend.calls == calls
+
+
+def test_chunk_cache_key_covers_route_and_generation_config():
+    key = LexiGuard(backend=FakeBackend())._chunk_cache_key("chunk", "text", None)
+    others = [
+        LexiGuard(backend=FakeBackend(), model_name="models/other")
+        ._chunk_cache_key("chunk", "text", None),
+        LexiGuard(backend=FakeBackend(), generation_config={"temperature": 0.2})
+        ._chunk_cache_key("chunk", "text", None),
+        LexiGuard(backend=FakeBackend(), routing=RoutingPolicy([Route("small", "models/small")]))
+        ._chunk_cache_key("chunk", "text", None),
+        LexiGuard(backend=FakeBackend(), routing=RoutingPolicy([Route("named")]))
+        ._chunk_cache_key("chunk", "text", None),
+        LexiGuard(backend=FakeBackend())._chunk_cache_key("chunk", "clauses", None),
+        LexiGuard(backend=FakeBackend())._chunk_cache_key("chunk", "clauses", ["Termination"]),
+    ]
+    assert len({key, *others}) == len(others) + 1
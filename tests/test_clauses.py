@@ -0,0 +1,111 @@
+# tests/test_clauses.py
+"""Tests for clause segmentation, clause IDs and version diffs"""
+
+import json
+
+from lexiguard_sdk.clauses import ClauseIndex, segment_clauses
+
+CONTRACT = """MASTER SERVICES AGREEMENT
+between Acme Ltd. and Beta LLC.
+
+ARTICLE I
+DEFINITIONS
+1. Definitions. In this Agreement:
+(a) "Services" means the services;
+(b) "Fees" means the fees, including
+(i) monthly fees; and
+(ii) one-off fees.
+1.1 Interpretation. Headings are for convenience.
+2. Payment
+The Customer shall pay within 30 days.
+
+ARTICLE II TERMINATION
+3. Either party may terminate on notice.
+
+SCHEDULE 2
+1. Service levels.
+1.1 Availability of 99.9%.
+"""
+
+
+def test_clause_ids_follow_the_numbering():
+    index = segment_clauses(CONTRACT)
+    assert [(clause.id, clause.parent) for clause in index] == [
+        ("master-services-agreement", None),
+        ("article-i", None),
+        ("1", "article-i"),
+        ("1(a)", "1"),
+        ("1(b)", "1"),
+        ("1(b)(i)", "1(b)"),
+        ("1(b)(ii)", "1(b)"),
+        ("1.1", "1"),
+        ("2", "article-i"),
+        ("article-ii", None),
+        ("3", "article-ii"),
+        ("schedule-2", None),
+        ("schedule-2/1", "schedule-2"),
+        ("schedule-2/1.1", "schedule-2/1"),
+    ]
+
+
+def test_titles_and_text():
+    index = segment_clauses(CONTRACT)
+    assert index["article-i"].title == "DEFINITIONS"
+    assert index["article-ii"].title == "TERMINATION"
+    assert index["2"].title == "Payment"
+    assert index.text("1(b)(ii)") == "(ii) one-off fees."
+    assert index.text("1(b)", own=True) == '(b) "Fees" means the fees, including'
+    assert index.text("1(b)").endswith("(ii) one-off fees.")
+    assert [clause.id for clause in index.children("1(b)")] == ["1(b)(i)", "1(b)(ii)"]
+    assert [clause.id for clause in index.children()] == \
+        ["master-services-agreement", "article-i", "article-ii", "schedule-2"]
+
+
+def test_offsets_point_into_the_text():
+    index = segment_clauses(CONTRACT)
+    for clause in index:
+        assert CONTRACT[clause.start:clause.end] == index.text(clause.id)
+    offset = CONTRACT.index("99.9%")
+    assert index.at(offset).id == "schedule-2/1.1"
+    assert index.at(CONTRACT.index("monthly fees")).id == "1(b)(i)"
+
+
+def test_preamble_and_repeated_numbers():
+    index = segment_clauses("This agreement is made today.\n\n1. First.\n2. Second.\n1. Again.")
+    assert [clause.id for clause in index] == ["preamble", "1", "2", "1~2"]
+
+
+def test_ids_and_hashes_ignore_rewrapping():
+    rewrapped = CONTRACT.replace("Headings are for convenience.",
+                                 "Headings  are\n   for convenience.")
+    old, new = segment_clauses(CONTRACT), segment_clauses(rewrapped)
+    assert [clause.id for clause in old] == [clause.id for clause in new]
+    assert [clause.hash for clause in old] == [clause.hash for clause in new]
+    assert old.diff(new) == {"added": [], "removed": [], "changed": []}
+
+
+def test_diff_between_versions():
+    revised = (CONTRACT
+               .replace("within 30 days", "within 45 days")
+               .replace("(ii) one-off fees.", "(ii) one-off fees.\n(iii) late fees.")
+               .replace("3. Either party may terminate on notice.\n", ""))
+    old, new = segment_clauses(CONTRACT), segment_clauses(revised)
+    assert old.diff(new) == {"added": ["1(b)(iii)"], "removed": ["3"], "changed": ["2"]}
+    # A changed sub-clause changes its ancestors' tree hashes, not their own hashes
+    assert old["1(b)"].hash == new["1(b)"].hash
+    assert old["1(b)"].tree_hash != new["1(b)"].tree_hash
+    assert old["1"].tree_hash != new["1"].tree_hash
+    assert old["article-i"].hash == new["article-i"].hash
+
+
+def test_renumbered_clause_shows_as_added_and_removed():
+    old = segment_clauses("1. Rent.\n2. Repairs.")
+    new = segment_clauses("1. Rent.\n2. Deposit.\n3. Repairs.")
+    assert old.diff(new) == {"added": ["3"], "removed": [], "changed": ["2"]}
+
+
+def test_to_dict_round_trip():
+    index = segment_clauses(CONTRACT)
+    restored = ClauseIndex.from_dict(json.loads(json.dumps(index.to_dict())), CONTRACT)
+    assert list(restored) == list(index)
+    assert restored.diff(index) == {"added": [], "removed": [], "changed": []}
@@ -0,0 +1,126 @@
+# tests/test_cli.py
+"""Tests for the resumable ``lexiguard batch`` command"""
+
+import io
+import json
+import os
+
+import pytest
+
+from lexiguard_sdk import LexiGuard
+from lexiguard_sdk.backends import FakeBackend
+from lexiguard_sdk.cli import BatchManifest, main, run_batch
+
+LEASE = "The tenant shall pay rent monthly. " * 40
+
+
+@pytest.fixture
+def documents(tmp_path):
+    root = tmp_path / "contracts"
+    (root / "leases").mkdir(parents=True)
+    for name in ("a.txt", "b.txt", "leases/c.txt"):
+        (root / name).write_text(f"{name}: {LEASE}", encoding="utf-8")
+    (root / "empty.txt").write_text("", encoding="utf-8")
+    (root / "notes.md").write_text("not a supported format", encoding="utf-8")
+    (root / "legacy.doc").write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1 Word 97")
+    return root
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _run(documents, output, client=None, **options):
+    client = client or LexiGuard(backend=FakeBackend(), retry_policy=None)
+    return run_batch(client, documents, output, parse_workers=1, concurrency=2, **options)
+
+
+def test_first_run_analyzes_every_file(documents, tmp_path):
+    output = tmp_path / "results.jsonl"
+    counts = _run(documents, output)
+    assert counts == {"found": 4, "skipped": 0, "succeeded": 3, "failed": 1, "rerun": 0}
+    lines = _lines(output)
+    assert sorted(line["path"] for line in lines) == \
+        ["a.txt", "b.txt", "empty.txt", "leases/c.txt"]
+    assert all(line["result"]["success"] for line in lines if line["path"] != "empty.txt")
+
+
+def test_resume_skips_successes_and_retries_failures(documents, tmp_path):
+    output = tmp_path / "results.jsonl"
+    _run(documents, output)
+    progress = io.StringIO()
+    counts = _run(documents, output, progress=progress)
+    assert counts == {"found": 4, "skipped": 3, "succeeded": 0, "failed": 1, "rerun": 1}
+    assert "last line for a path" in progress.getvalue()
+    paths = [line["path"] for line in _lines(output)]
+    assert paths.count("empty.txt") == 2
+    assert paths.count("a.txt") == 1
+
+    manifest = BatchManifest(output.with_name(output.name + ".manifest"))
+    assert manifest.is_recorded("empty.txt")
+    assert not manifest.is_done("empty.txt", documents / "empty.txt")
+    assert manifest.is_done("a.txt", documents / "a.txt")
+
+
+def test_fixed_and_changed_files_are_analyzed_again(documents, tmp_path):
+    output = tmp_path / "results.jsonl"
+    _run(documents, output)
+    (documents / "empty.txt").write_text(LEASE, encoding="utf-8")
+    stat = (documents / "b.txt").stat()
+    os.utime(documents / "b.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    counts = _run(documents, output)
+    assert counts == {"found": 4, "skipped": 2, "succeeded": 2, "failed": 0, "rerun": 2}
+    latest = {line["path"]: line for line in _lines(output)}
+    assert latest["empty.txt"]["result"]["success"]
+    assert _run(documents, output)["skipped"] == 4
+
+
+def test_interrupted_manifest_line_is_ignored(documents, tmp_path):
+    output = tmp_path / "results.jsonl"
+    manifest_path = tmp_path / "checkpoint"
+    _run(documents, output, manifest_path=manifest_path)
+    with open(manifest_path, "a", encoding="utf-8") as f:
+        f.write('{"path": "b.tx')
+    counts = _run(documents, output, manifest_path=manifest_path)
+    assert counts["skipped"] == 3
+
+
+def test_manifests_without_success_flags_count_successes(documents, tmp_path):
+    output = tmp_path / "results.jsonl"
+    manifest_path = output.with_name(output.name + ".manifest")
+    stat = (documents / "a.txt").stat()
+    manifest_path.write_text(json.dumps({"path": "a.txt", "size": stat.st_size,
+                                         "mtime_ns": stat.st_mtime_ns,
+                                         "finished_at": 0}) + "\n", encoding="utf-8")
+    counts = _run(documents, output)
+    assert (counts["skipped"], counts["rerun"]) == (1, 0)
+
+
+class RecordingClient(LexiGuard):
+    def __init__(self):
+        super().__init__(backend=FakeBackend(), retry_policy=None)
+        self.long_document_calls = []
+
+    def analyze_long_document(self, text, **options):
+        self.long_document_calls.append(options)
+        return super().analyze_long_document(text, **options)
+
+
+def test_long_documents_run_chunks_serially(documents, tmp_path):
+    client = RecordingClient()
+    counts = _run(documents, tmp_path / "results.jsonl", client=client,
+                  long_document_tokens=100)
+    assert counts["succeeded"] == 3
+    assert client.long_document_calls == [{"mode": "text", "max_concurrency": 1}] * 3
+
+
+def test_command_line_resume(documents, tmp_path, capsys):
+    output = tmp_path / "results.jsonl"
+    argv = ["batch", str(documents), "--output", str(output), "--fake", "--quiet",
+            "--parse-workers", "1"]
+    assert main(argv) == 1
+    assert json.loads(capsys.readouterr().out)["succeeded"] == 3
+    (documents / "empty.txt").unlink()
+    assert main(argv) == 0
+    assert json.loads(capsys.readouterr().out) == \
+        {"found": 3, "skipped": 3, "succeeded": 0, "failed": 0, "rerun": 0}
@@ -0,0 +1,125 @@
+# tests/test_docx_reader.py
+"""Tests for the streaming DOCX reader, checked against python-docx"""
+
+import io
+import zipfile
+
+import pytest
+
+from lexiguard_sdk.docx_reader import BODY, CELL_SEPARATOR, FOOTER, HEADER, iter_docx
+
+docx = pytest.importorskip("docx")
+from docx.enum.text import WD_BREAK  # noqa: E402
+
+
+def _save(document):
+    buffer = io.BytesIO()
+    document.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.fixture
+def contract():
+    document = docx.Document()
+    document.add_heading("MASTER SERVICES AGREEMENT", level=1)
+    document.add_paragraph("1. Services. The Provider shall perform the Services.")
+    paragraph = document.add_paragraph("2. Fees.")
+    paragraph.add_run("\tPayable monthly").bold = True
+    paragraph.add_run().add_break()
+    paragraph.add_run("within 30 days – net of taxes (ü, é).")
+    document.add_paragraph("")
+    document.add_paragraph("   ")
+    table = document.add_table(rows=2, cols=3)
+    for row, values in zip(table.rows, [("Party", "Role", "Signature"),
+                                        ("Acme Ltd.", "Provider", "")]):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+    document.add_paragraph("3. Term.").add_run().add_break(WD_BREAK.PAGE)
+    document.add_paragraph("4. Termination on the second page.")
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Acme Ltd. – Confidential"
+    section.footer.paragraphs[0].text = "Master Services Agreement"
+    return document
+
+
+def test_body_paragraphs_match_python_docx(contract):
+    expected = [p.text for p in contract.paragraphs if p.text.strip()]
+    blocks = [block for block in iter_docx(_save(contract), parts=[BODY]) if not block.table]
+    assert [block.text for block in blocks] == expected
+
+
+def test_table_rows_match_python_docx(contract):
+    expected = [CELL_SEPARATOR.join(cell.text for cell in row.cells)
+                for table in contract.tables for row in table.rows]
+    rows = [block.text for block in iter_docx(_save(contract), parts=[BODY]) if block.table]
+    assert rows == expected
+
+
+def test_blocks_keep_document_order(contract):
+    texts = [block.text for block in iter_docx(_save(contract), parts=[BODY])]
+    assert texts.index("Party | Role | Signature") == texts.index("3. Term.") - 2
+
+
+def test_headers_and_footers_match_python_docx(contract):
+    section = contract.sections[0]
+    blocks = list(iter_docx(_save(contract)))
+    assert [b.text for b in blocks if b.part == HEADER] == \
+        [p.text for p in section.header.paragraphs if p.text.strip()]
+    assert [b.text for b in blocks if b.part == FOOTER] == \
+        [p.text for p in section.footer.paragraphs if p.text.strip()]
+    assert [b.part for b in blocks] == sorted((b.part for b in blocks),
+                                              key=[HEADER, BODY, FOOTER].index)
+
+
+def test_page_breaks_advance_the_page(contract):
+    pages = {block.text: block.page for block in iter_docx(_save(contract))}
+    assert pages["MASTER SERVICES AGREEMENT"] == 0
+    assert pages["3. Term."] == 0
+    assert pages["4. Termination on the second page."] == 1
+    assert pages["Master Services Agreement"] == 1
+
+
+def _word_saved(*paragraphs):
+    """A DOCX whose runs are given as raw XML, as Word writes them."""
+    body = "".join(f"<w:p>{runs}</w:p>" for runs in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body>{body}</w:body></w:document>"))
+    buffer.seek(0)
+    return buffer
+
+
+def test_rendered_page_break_after_a_manual_one_is_the_same_break():
+    blocks = iter_docx(_word_saved(
+        '<w:r><w:t>A</w:t></w:r><w:r><w:br w:type="page"/></w:r>',
+        '<w:r><w:lastRenderedPageBreak/><w:t>B</w:t></w:r>',
+        '<w:r><w:t>C</w:t></w:r>',
+        '<w:r><w:t>D</w:t></w:r><w:r><w:lastRenderedPageBreak/><w:t>more D</w:t></w:r>',
+        '<w:r><w:t>E</w:t><w:br w:type="page"/></w:r>'
+        '<w:r><w:lastRenderedPageBreak/><w:t>more E</w:t></w:r>',
+        '<w:r><w:t>F</w:t></w:r>',
+    ))
+    assert [(block.text, block.page) for block in blocks] == \
+        [("A", 0), ("B", 1), ("C", 1), ("Dmore D", 1), ("Emore E", 2), ("F", 3)]
+
+
+def test_long_document_matches_python_docx():
+    document = docx.Document()
+    for i in range(2000):
+        document.add_paragraph(f"{i}.\tClause {i} & <terms> \"quoted\" ’ text")
+    expected = [p.text for p in document.paragraphs]
+    assert [block.text for block in iter_docx(_save(document))] == expected
+
+
+def test_rejects_archives_without_a_document():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("hello.txt", "not a docx")
+    buffer.seek(0)
+    with pytest.raises(ValueError):
+        list(iter_docx(buffer))
+    with pytest.raises(zipfile.BadZipFile):
+        list(iter_docx(io.BytesIO(b"not a zip archive")))
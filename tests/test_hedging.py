@@ -0,0 +1,127 @@
+# tests/test_hedging.py
+"""Tests for request hedging, its budget and its rate-limiter slots"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lexiguard_sdk import AsyncLexiGuard, LexiGuard
+from lexiguard_sdk.backends import FakeBackend
+from lexiguard_sdk.hedging import HedgePolicy, run_hedged
+from lexiguard_sdk.ratelimit import AdaptiveRateLimiter
+
+TEXT = "The tenant shall pay rent monthly. " * 20
+SLOW = "models/slow"
+FAST = "models/fast"
+
+
+class ModelLatencyBackend(FakeBackend):
+    """Takes a fixed time per model and records which calls ran to the end."""
+
+    def __init__(self, delays, **options):
+        super().__init__(**options)
+        self.delays = delays
+        self.finished = []
+
+    def generate(self, request):
+        time.sleep(self.delays[request.model_name])
+        self.finished.append(request.model_name)
+        return super().generate(request)
+
+    async def generate_async(self, request):
+        await asyncio.sleep(self.delays[request.model_name])
+        self.finished.append(request.model_name)
+        return await super().generate_async(request)
+
+
+def _client(client_class, slow_seconds, **options):
+    backend = ModelLatencyBackend({SLOW: slow_seconds, FAST: 0.0}, **options)
+    policy = HedgePolicy(initial_delay=0.05, min_delay=0.01, max_hedge_rate=1.0,
+                         fallback_model=FAST)
+    limiter = AdaptiveRateLimiter(max_concurrency=4)
+    client = client_class(backend=backend, model_name=SLOW, rate_limiter=limiter,
+                          hedge_policy=policy, retry_policy=None)
+    return client, backend, policy, limiter
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_hedge_budget_caps_hedged_calls():
+    policy = HedgePolicy(max_hedge_rate=0.5, burst=1.0)
+    spent = []
+    for _ in range(6):
+        policy.start_call()
+        spent.append(policy.try_hedge())
+    assert spent == [False, True] * 3
+    assert policy.stats()["hedge_rate"] == 0.5
+
+
+def test_no_budget_waits_for_the_first_call():
+    policy = HedgePolicy(initial_delay=0.01, min_delay=0.01, max_hedge_rate=0.0)
+    hedges = []
+
+    def primary():
+        time.sleep(0.1)
+        return "primary"
+
+    assert run_hedged(policy, primary, lambda: hedges.append(1)) == ("primary", False, False)
+    assert hedges == []
+    policy.shutdown()
+
+
+def test_fast_first_call_is_not_hedged():
+    client, backend, policy, limiter = _client(LexiGuard, 0.0)
+    assert client.analyze_text(TEXT)["success"]
+    assert (policy.hedged, backend.finished) == (0, [SLOW])
+    assert limiter.in_flight == 0
+
+
+def test_first_result_wins_and_the_loser_keeps_its_slot_until_it_ends():
+    client, backend, policy, limiter = _client(LexiGuard, 0.5)
+    started = time.monotonic()
+    assert client.analyze_text(TEXT)["success"]
+    assert time.monotonic() - started < 0.4
+    assert (policy.hedged, policy.hedge_wins) == (1, 1)
+    assert backend.finished == [FAST]
+    # The slow first call still runs and still holds its slot
+    assert limiter.in_flight == 1
+    assert _wait_for(lambda: limiter.in_flight == 0)
+    assert backend.finished == [FAST, SLOW]
+
+
+def test_failed_calls_release_their_slots():
+    client, backend, policy, limiter = _client(LexiGuard, 0.2, error_rate=1.0)
+    assert not client.analyze_text(TEXT)["success"]
+    assert policy.hedged == 1
+    assert _wait_for(lambda: limiter.in_flight == 0)
+
+
+def test_slot_is_released_when_the_first_call_cannot_be_submitted():
+    client, backend, policy, limiter = _client(LexiGuard, 0.0)
+    stopped = ThreadPoolExecutor(max_workers=1)
+    stopped.shutdown()
+    policy._executor = stopped
+    assert not client.analyze_text(TEXT)["success"]
+    assert backend.calls == 0
+    assert limiter.in_flight == 0
+
+
+def test_async_loser_is_cancelled_and_slots_are_released():
+    client, backend, policy, limiter = _client(AsyncLexiGuard, 0.5)
+
+    async def main():
+        result = await client.analyze_text(TEXT)
+        in_flight = limiter.in_flight
+        await asyncio.sleep(0.6)
+        return result, in_flight
+
+    result, in_flight = asyncio.run(main())
+    assert result["success"]
+    assert (policy.hedged, policy.hedge_wins) == (1, 1)
+    assert in_flight == 0
+    assert backend.finished == [FAST]
@@ -0,0 +1,131 @@
+# tests/test_normalize.py
+"""Tests for text normalization and its offset mapping"""
+
+import random
+
+import pytest
+
+from lexiguard_sdk.normalize import normalize_pages, normalize_text
+
+WORDS = ("the", "tenant", "shall", "pay", "rent", "monthly", "termi-", "nation",
+         "landlord", "pre-", "2020", "Smith-", "Jones", "deposit", "repairs")
+
+
+def _pages(count=6, seed=0):
+    rng = random.Random(seed)
+    pages = []
+    for index in range(count):
+        lines = ["ACME LEASE AGREEMENT   Confidential", f"ARTICLE {rng.randint(1, 40)}"]
+        for _ in range(rng.randint(3, 8)):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(2, 10))]
+            line = "  ".join(words) if rng.random() < 0.3 else " ".join(words)
+            lines.append(" " * rng.randint(0, 3) + line + "\t" * rng.randint(0, 1))
+            if rng.random() < 0.3:
+                lines.extend([""] * rng.randint(1, 4))
+        lines.append(f"Page {index + 1} of {count}")
+        pages.append("\n".join(lines))
+    return pages
+
+
+def _assert_copied_characters_map_back(normalized):
+    for index, char in enumerate(normalized.text):
+        offset = normalized.original_offset(index)
+        if not char.isspace():
+            assert normalized.original[offset] == char, (index, char)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_offsets_map_back_to_the_original(seed):
+    normalized = normalize_pages(_pages(seed=seed))
+    assert len(normalized.text) < len(normalized.original)
+    _assert_copied_characters_map_back(normalized)
+    assert normalized.original_offset(len(normalized.text)) == len(normalized.original)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_offsets_are_monotonic(seed):
+    normalized = normalize_pages(_pages(seed=seed))
+    offsets = [normalized.original_offset(i) for i in range(len(normalized.text) + 1)]
+    assert offsets == sorted(offsets)
+
+
+def test_original_span_of_a_match():
+    pages = ["Header\nThe  tenant shall   pay\nrent.\nPage 1",
+             "Header\nNotice of termi-\nnation is due.\nPage 2",
+             "Header\nEnd of the lease.\nPage 3"]
+    normalized = normalize_pages(pages)
+    assert "Header" not in normalized.text
+    assert "Page" not in normalized.text
+    assert "The tenant shall pay\nrent." in normalized.text
+    start = normalized.text.index("termination")
+    span = normalized.original_span(start, start + len("termination"))
+    assert normalized.original[span[0]:span[1]] == "termi-\nnation"
+    start = normalized.text.index("tenant shall pay")
+    span = normalized.original_span(start, start + len("tenant shall pay"))
+    assert normalized.original[span[0]:span[1]] == "tenant shall   pay"
+
+
+def test_original_offset_out_of_range():
+    normalized = normalize_pages(["a  b"])
+    with pytest.raises(IndexError):
+        normalized.original_offset(len(normalized.text) + 1)
+    with pytest.raises(IndexError):
+        normalized.original_offset(-1)
+
+
+def test_unchanged_text_maps_to_itself():
+    normalized = normalize_pages(["Plain text.\n\nSecond paragraph."])
+    assert normalized.text == normalized.original
+    assert [normalized.original_offset(i) for i in range(len(normalized.text) + 1)] == \
+        list(range(len(normalized.text) + 1))
+
+
+def test_normalize_text_keeps_form_feed_offsets():
+    text = "\f".join(_pages(count=4, seed=7))
+    normalized = normalize_text(text)
+    assert normalized.original == text
+    _assert_copied_characters_map_back(normalized)
+
+
+def test_hyphenation_keeps_names_and_numbers():
+    text = normalize_pages(["Smith-\nJones signed the pre-\n2020 termi-\nnation notice."]).text
+    assert text == "Smith-\nJones signed the pre-\n2020 termination notice."
+
+
+def test_running_headers_and_page_numbers_are_removed():
+    normalized = normalize_pages(_pages(count=6, seed=3))
+    assert "ACME LEASE AGREEMENT" not in normalized.text
+    assert "Page " not in normalized.text
+    assert normalized.stats["header_footer_lines"] == 6
+    assert normalized.stats["page_numbers"] == 6
+
+
+def test_numbered_headings_are_not_running_headers():
+    pages = [f"ARTICLE {n}\nBody of page {i}.\nAcme Lease - Page {i + 1}"
+             for i, n in enumerate([4, 1, 7, 2, 9])]
+    text = normalize_pages(pages).text
+    assert [line for line in text.split("\n") if line.startswith("ARTICLE")] == \
+        ["ARTICLE 4", "ARTICLE 1", "ARTICLE 7", "ARTICLE 2", "ARTICLE 9"]
+    assert "Acme Lease" not in text
+
+
+def test_footer_page_numbers_counting_with_the_pages_match():
+    # "Schedule 3" repeats verbatim and is a running footer; the page numbers
+    # at the end of the footers count up with the pages and still match
+    pages = [f"Body {i}.\nSchedule 3 - {i + 10}" for i in range(4)]
+    assert normalize_pages(pages).text == "Body 0.\nBody 1.\nBody 2.\nBody 3."
+
+
+def test_too_few_pages_for_headers():
+    pages = ["Header\nOne.", "Header\nTwo."]
+    assert normalize_pages(pages).text == "Header\nOne.\nHeader\nTwo."
+
+
+@pytest.mark.parametrize("footer", ["ACME Master Services Agreement 2024",
+                                    "Confidential - Version 3"])
+def test_fixed_numbers_in_footers_repeat_as_written(footer):
+    pages = [f"Body {i}.\n{footer}\nPage {i + 1}" for i in range(5)]
+    normalized = normalize_pages(pages)
+    assert normalized.text == "\n".join(f"Body {i}." for i in range(5))
+    assert normalized.stats["header_footer_lines"] == 5
+    assert normalized.stats["page_numbers"] == 5
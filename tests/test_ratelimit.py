@@ -0,0 +1,148 @@
+# tests/test_ratelimit.py
+"""Tests for error classification and retry policies"""
+
+import random
+
+import pytest
+
+from lexiguard_sdk import LexiGuard
+from lexiguard_sdk.backends import FakeBackend, FakeBackendError
+from lexiguard_sdk.ratelimit import THROTTLE, TRANSIENT, RetryPolicy, classify_error
+
+
+class StatusError(Exception):
+    def __init__(self, message="", status_code=None, code=None):
+        super().__init__(message)
+        if status_code is not None:
+            self.status_code = status_code
+        if code is not None:
+            self.code = code
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class GrpcCode:
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.mark.parametrize("code, kind", [
+    (429, THROTTLE), (503, THROTTLE),
+    (408, TRANSIENT), (500, TRANSIENT), (502, TRANSIENT), (504, TRANSIENT),
+    (400, None), (401, None), (403, None), (404, None),
+])
+def test_classify_error_by_code_attribute(code, kind):
+    assert classify_error(FakeBackendError("failed", code)) == kind
+    assert classify_error(StatusError(status_code=code)) == kind
+
+
+def test_classify_error_by_response_status():
+    error = StatusError("request failed")
+    error.response = Response(429)
+    assert classify_error(error) == THROTTLE
+
+
+@pytest.mark.parametrize("name, kind", [
+    ("RESOURCE_EXHAUSTED", THROTTLE), ("UNAVAILABLE", THROTTLE),
+    ("DEADLINE_EXCEEDED", TRANSIENT), ("INTERNAL", TRANSIENT),
+    ("INVALID_ARGUMENT", None), ("NOT_FOUND", None),
+])
+def test_classify_error_by_grpc_status(name, kind):
+    error = StatusError()
+    error.code = lambda: GrpcCode(name)
+    assert classify_error(error) == kind
+
+
+def test_classify_error_google_api_core():
+    exceptions = pytest.importorskip("google.api_core.exceptions")
+    assert classify_error(exceptions.ResourceExhausted("quota")) == THROTTLE
+    assert classify_error(exceptions.ServiceUnavailable("down")) == THROTTLE
+    assert classify_error(exceptions.InternalServerError("oops")) == TRANSIENT
+    assert classify_error(exceptions.InvalidArgument("bad prompt")) is None
+
+
+@pytest.mark.parametrize("message, kind", [
+    ("429 Resource has been exhausted", THROTTLE),
+    ("503 The model is overloaded", THROTTLE),
+    ("500 Internal error encountered", TRANSIENT),
+    # Numbers and words elsewhere in the text are not statuses
+    ("Invalid argument: max_output_tokens must be below 5000", None),
+    ("Prompt mentions a quota of 429 units", None),
+    ("Field 'unavailable_until' is not supported", None),
+    ("Request payload size exceeds the limit: 5000 bytes", None),
+    ("4290 is not a status", None),
+])
+def test_classify_error_by_message(message, kind):
+    assert classify_error(Exception(message)) == kind
+
+
+def test_classify_error_by_exception_type():
+    assert classify_error(TimeoutError("timed out")) == TRANSIENT
+    assert classify_error(ConnectionResetError("reset by peer")) == TRANSIENT
+    assert classify_error(ValueError("bad value")) is None
+
+
+def test_explicit_code_wins_over_message():
+    assert classify_error(StatusError("500 in message", status_code=400)) is None
+
+
+def test_retry_policy_should_retry():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry(THROTTLE, 0)
+    assert policy.should_retry(TRANSIENT, 1)
+    assert not policy.should_retry(THROTTLE, 2)
+    assert not policy.should_retry(None, 0)
+
+
+def test_retry_policy_without_transient_retries():
+    policy = RetryPolicy(retry_transient=False)
+    assert policy.should_retry(THROTTLE, 0)
+    assert not policy.should_retry(TRANSIENT, 0)
+
+
+def test_retry_policy_disabled():
+    assert not RetryPolicy(max_retries=0).should_retry(THROTTLE, 0)
+
+
+def test_retry_policy_delay_is_jittered_and_capped():
+    random.seed(0)
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    for attempt in range(8):
+        delays = [policy.delay(attempt) for _ in range(200)]
+        cap = min(5.0, 2 ** attempt)
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) > cap / 2
+
+
+class FlakyBackend(FakeBackend):
+    """Fails with ``code`` on the first ``failures`` calls."""
+
+    def __init__(self, failures, code):
+        super().__init__()
+        self.failures = failures
+        self.code = code
+        self.attempts = 0
+
+    def generate(self, request):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise FakeBackendError(f"{self.code} injected", self.code)
+        return super().generate(request)
+
+
+def test_client_retries_throttling():
+    backend = FlakyBackend(failures=2, code=429)
+    lg = LexiGuard(backend=backend, retry_policy=RetryPolicy(max_retries=3, base_delay=0))
+    assert lg.analyze_text("The tenant shall pay rent monthly.")["success"]
+    assert backend.attempts == 3
+
+
+def test_client_does_not_retry_client_errors():
+    backend = FlakyBackend(failures=1, code=400)
+    lg = LexiGuard(backend=backend, retry_policy=RetryPolicy(max_retries=3, base_delay=0))
+    result = lg.analyze_text("The tenant shall pay rent monthly.")
+    assert not result["success"]
+    assert backend.attempts == 1
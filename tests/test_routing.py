@@ -0,0 +1,110 @@
+# tests/test_routing.py
+"""Tests for model routing and escalation of invalid responses"""
+
+import asyncio
+
+from lexiguard_sdk import AsyncLexiGuard, LexiGuard
+from lexiguard_sdk.backends import FakeBackend, GenerationResult
+from lexiguard_sdk.cache import MemoryCache
+from lexiguard_sdk.routing import DEFAULT_ROUTE, ESCALATION_ROUTE, Route, RoutingPolicy
+
+SMALL = "models/small"
+LARGE = "models/large"
+SHORT = "The tenant shall pay rent monthly. " * 10
+LONG = "The tenant shall pay rent monthly. " * 400
+
+
+class ModelBackend(FakeBackend):
+    """Records the model of every call; models in ``broken`` answer with invalid JSON."""
+
+    def __init__(self, broken=()):
+        super().__init__()
+        self.broken = set(broken)
+        self.models = []
+
+    def _answer(self, request):
+        self.models.append(request.model_name)
+        if request.model_name in self.broken:
+            return GenerationResult('{"summary": "cut off', request.model_name)
+        return None
+
+    def generate(self, request):
+        return self._answer(request) or super().generate(request)
+
+    async def generate_async(self, request):
+        return self._answer(request) or await super().generate_async(request)
+
+
+def _client(client_class=LexiGuard, broken=(), route_model=SMALL, **policy_options):
+    backend = ModelBackend(broken)
+    routing = RoutingPolicy([Route("small", route_model, tasks={"analyze_text"},
+                                   max_tokens=1000)], **policy_options)
+    client = client_class(backend=backend, model_name=LARGE, cache=MemoryCache(),
+                          routing=routing, retry_policy=None)
+    return client, backend, routing
+
+
+def test_small_prompts_take_the_cheap_route():
+    lg, backend, routing = _client()
+    assert lg.analyze_text(SHORT)["success"]
+    assert lg.analyze_text(LONG)["success"]
+    assert lg.analyze_fairness(SHORT)["success"]
+    assert backend.models == [SMALL, LARGE, LARGE]
+    assert {name: stats["calls"] for name, stats in routing.stats().items()} == \
+        {"small": 1, DEFAULT_ROUTE: 2}
+
+
+def test_invalid_response_escalates_once_and_is_not_cached():
+    lg, backend, routing = _client(broken={SMALL})
+    result = lg.analyze_text(SHORT)
+    assert result["success"]
+    assert backend.models == [SMALL, LARGE]
+    stats = routing.stats()
+    assert (stats["small"]["errors"], stats["small"]["escalations"]) == (1, 1)
+    assert stats[ESCALATION_ROUTE]["calls"] == 1
+    # Only the valid answer is cached; the invalid one is asked for again
+    assert len(lg.cache) == 1
+    assert lg.analyze_text(SHORT) == result
+    assert backend.models == [SMALL, LARGE, SMALL]
+
+
+def test_escalated_call_that_fails_again_is_not_escalated_further():
+    lg, backend, routing = _client(broken={SMALL, LARGE})
+    assert not lg.analyze_text(SHORT)["success"]
+    assert backend.models == [SMALL, LARGE]
+    assert routing.stats()[ESCALATION_ROUTE]["escalations"] == 0
+    assert len(lg.cache) == 0
+
+
+def test_route_on_the_escalation_model_does_not_escalate():
+    lg, backend, routing = _client(broken={LARGE}, route_model=LARGE)
+    assert not lg.analyze_text(SHORT)["success"]
+    assert backend.models == [LARGE]
+    assert routing.stats()["small"]["escalations"] == 0
+
+
+def test_escalation_target():
+    routing = RoutingPolicy([], escalation_model=LARGE)
+    assert routing.escalation_target(SMALL, SMALL) == LARGE
+    assert routing.escalation_target(LARGE, SMALL) is None
+    assert RoutingPolicy([]).escalation_target(SMALL, LARGE) == LARGE
+    assert RoutingPolicy([]).escalation_target(LARGE, LARGE) is None
+    assert RoutingPolicy([], escalate=False).escalation_target(SMALL, LARGE) is None
+
+
+def test_escalation_can_be_disabled():
+    lg, backend, routing = _client(broken={SMALL}, escalate=False)
+    assert not lg.analyze_text(SHORT)["success"]
+    assert backend.models == [SMALL]
+
+
+def test_async_client_escalates_once_and_drops_the_invalid_response():
+    lg, backend, routing = _client(AsyncLexiGuard, broken={SMALL})
+
+    async def main():
+        return await lg.analyze_text(SHORT), await lg.analyze_text(SHORT)
+
+    first, second = asyncio.run(main())
+    assert first["success"] and second == first
+    assert backend.models == [SMALL, LARGE, SMALL]
+    assert len(lg.cache) == 1
@@ -0,0 +1,130 @@
+# tests/test_singleflight.py
+"""Tests for coalescing concurrent identical requests"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from lexiguard_sdk import AsyncLexiGuard, LexiGuard
+from lexiguard_sdk.backends import FakeBackend, fixed_latency
+from lexiguard_sdk.singleflight import AsyncSingleFlight, SingleFlight
+
+CALLERS = 8
+TEXT = "The tenant shall pay rent monthly. " * 20
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert condition()
+
+
+def _run_together(flight, fn):
+    """Call ``flight.do`` from CALLERS threads while the leader is blocked."""
+    release = threading.Event()
+    calls = []
+
+    def leader_work():
+        calls.append(1)
+        release.wait()
+        return fn()
+
+    def caller():
+        try:
+            return flight.do("key", leader_work)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        futures = [pool.submit(caller) for _ in range(CALLERS)]
+        _wait_for(lambda: flight.coalesced == CALLERS - 1)
+        release.set()
+        outcomes = [future.result() for future in futures]
+    return outcomes, calls
+
+
+def test_concurrent_calls_share_one_result():
+    flight = SingleFlight()
+    result = object()
+    outcomes, calls = _run_together(flight, lambda: result)
+    assert len(calls) == 1
+    assert all(value is result for value, _ in outcomes)
+    assert sorted(shared for _, shared in outcomes) == [False] + [True] * (CALLERS - 1)
+    assert flight.stats() == {"leaders": 1, "coalesced": CALLERS - 1, "in_flight": 0}
+
+
+def test_leader_error_reaches_every_caller_and_is_not_kept():
+    flight = SingleFlight()
+    error = ValueError("model unavailable")
+
+    def fail():
+        raise error
+
+    outcomes, calls = _run_together(flight, fail)
+    assert len(calls) == 1
+    assert all(outcome is error for outcome in outcomes)
+    assert flight.in_flight == 0
+    assert flight.do("key", lambda: "retried") == ("retried", False)
+
+
+def test_async_concurrent_calls_share_one_result_or_error():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def work(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    async def main():
+        shared = await asyncio.gather(*(flight.do("key", lambda: work("ok"))
+                                        for _ in range(CALLERS)))
+        error = ValueError("model unavailable")
+        failed = await asyncio.gather(*(flight.do("key", lambda: work(error))
+                                        for _ in range(CALLERS)), return_exceptions=True)
+        return shared, failed, error
+
+    shared, failed, error = asyncio.run(main())
+    assert [value for value, _ in shared] == ["ok"] * CALLERS
+    assert sum(not was_shared for _, was_shared in shared) == 1
+    assert all(outcome is error for outcome in failed)
+    assert len(calls) == 2
+    assert flight.in_flight == 0
+
+
+@pytest.mark.parametrize("error_rate", [0.0, 1.0])
+def test_client_coalesces_identical_requests(error_rate):
+    backend = FakeBackend(latency=fixed_latency(0.2), error_rate=error_rate)
+    lg = LexiGuard(backend=backend, retry_policy=None)
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        results = list(pool.map(lambda _: lg.analyze_text(TEXT), range(CALLERS)))
+    assert backend.calls == 1
+    assert all(result == results[0] for result in results)
+    assert results[0]["success"] == (error_rate == 0.0)
+    assert lg.inflight.in_flight == 0
+    # Nothing is cached, so the next call goes to the model again
+    lg.analyze_text(TEXT)
+    assert backend.calls == 2
+
+
+@pytest.mark.parametrize("error_rate", [0.0, 1.0])
+def test_async_client_coalesces_identical_requests(error_rate):
+    backend = FakeBackend(latency=fixed_latency(0.05), error_rate=error_rate)
+    lg = AsyncLexiGuard(backend=backend, retry_policy=None)
+
+    async def main():
+        results = await asyncio.gather(*(lg.analyze_text(TEXT) for _ in range(CALLERS)))
+        assert lg.inflight.in_flight == 0
+        await lg.analyze_text(TEXT)
+        return results
+
+    results = asyncio.run(main())
+    assert all(result == results[0] for result in results)
+    assert results[0]["success"] == (error_rate == 0.0)
+    assert backend.calls == 2
@@ -0,0 +1,119 @@
+# tests/test_streaming.py
+"""Tests for incremental JSON parsing of streamed responses"""
+
+import json
+
+import pytest
+
+from lexiguard_sdk import LexiGuard
+from lexiguard_sdk.backends import FakeBackend
+from lexiguard_sdk.streaming import IncrementalJSONParser
+
+DOCUMENT = {
+    "summary": 'Lease with a "no pets" rule, {braces} and [brackets] \\ and ünïcode',
+    "score": 7.5,
+    "renewal": True,
+    "deposit": None,
+    "clauses": [
+        {"clause_number": 1, "concerns": ["late fees", "access"]},
+        {"clause_number": 2, "concerns": []},
+    ],
+    "parties": ["Landlord", "Tenant"],
+    "empty": [],
+    "meta": {"pages": [1, 2]},
+}
+
+EXPECTED = [
+    {"type": "field", "key": "summary", "value": DOCUMENT["summary"]},
+    {"type": "field", "key": "score", "value": 7.5},
+    {"type": "field", "key": "renewal", "value": True},
+    {"type": "field", "key": "deposit", "value": None},
+    {"type": "item", "key": "clauses", "index": 0, "value": DOCUMENT["clauses"][0]},
+    {"type": "item", "key": "clauses", "index": 1, "value": DOCUMENT["clauses"][1]},
+    {"type": "field", "key": "clauses", "value": DOCUMENT["clauses"]},
+    {"type": "item", "key": "parties", "index": 0, "value": "Landlord"},
+    {"type": "item", "key": "parties", "index": 1, "value": "Tenant"},
+    {"type": "field", "key": "parties", "value": ["Landlord", "Tenant"]},
+    {"type": "field", "key": "empty", "value": []},
+    {"type": "field", "key": "meta", "value": {"pages": [1, 2]}},
+]
+
+
+def _feed(text, size):
+    parser = IncrementalJSONParser()
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return parser, events
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100_000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_events_do_not_depend_on_chunking(size, indent):
+    parser, events = _feed(json.dumps(DOCUMENT, indent=indent, ensure_ascii=False), size)
+    assert events == EXPECTED
+    assert parser.done
+
+
+def test_long_response_in_small_chunks():
+    clauses = [{"clause_number": i, "clause_text": "Rent – €100 𝄞 " * 20} for i in range(2000)]
+    text = json.dumps({"summary": "Lease ✓", "clauses": clauses}, ensure_ascii=False)
+    parser, events = _feed(text, 16)
+    assert [event["value"] for event in events if event["type"] == "item"] == clauses
+    assert events[0] == {"type": "field", "key": "summary", "value": "Lease ✓"}
+    assert events[-1] == {"type": "field", "key": "clauses", "value": clauses}
+    assert parser.done
+
+
+def test_fields_are_reported_as_soon_as_they_close():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"summary": "Short lease.", "clauses": [{"n": 1') == [
+        {"type": "field", "key": "summary", "value": "Short lease."},
+    ]
+    assert parser.feed('}, {"n": 2') == [
+        {"type": "item", "key": "clauses", "index": 0, "value": {"n": 1}},
+    ]
+    assert parser.feed("}]") == [
+        {"type": "item", "key": "clauses", "index": 1, "value": {"n": 2}},
+        {"type": "field", "key": "clauses", "value": [{"n": 1}, {"n": 2}]},
+    ]
+    assert not parser.done
+    assert parser.feed("}") == []
+    assert parser.done
+
+
+def test_code_fence_and_trailing_text_are_ignored():
+    text = '```json\n{"a": 1, "b": [true]}\n```\nDone.{"c": 2}'
+    parser, events = _feed(text, 5)
+    assert events == [
+        {"type": "field", "key": "a", "value": 1},
+        {"type": "item", "key": "b", "index": 0, "value": True},
+        {"type": "field", "key": "b", "value": [True]},
+    ]
+    assert parser.done
+    assert parser.feed('{"d": 3}') == []
+
+
+def test_empty_object():
+    parser, events = _feed("{ }", 1)
+    assert events == []
+    assert parser.done
+
+
+def test_malformed_values_are_skipped():
+    _, events = _feed('{"a": tru, "b": [1, x, 3], "c": "ok"}', 4)
+    assert events == [
+        {"type": "item", "key": "b", "index": 0, "value": 1},
+        {"type": "item", "key": "b", "index": 1, "value": 3},
+        {"type": "field", "key": "c", "value": "ok"},
+    ]
+
+
+def test_client_stream_ends_with_the_non_streaming_result():
+    backend = FakeBackend(stream_chunk_chars=5)
+    text = "The tenant shall pay rent monthly. " * 100
+    events = list(LexiGuard(backend=backend).analyze_clauses(text, stream=True))
+    result = LexiGuard(backend=backend).analyze_clauses(text)
+    assert events[-1] == {"type": "result", "result": result}
+    items = [event["value"] for event in events if event["type"] == "item"]
+    assert items == result["data"]["clauses"]